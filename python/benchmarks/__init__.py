@@ -0,0 +1,16 @@
+"""Benchmark suite: microbenchmarks and end-to-end renders.
+
+Usage (from python/):
+    uv run -m benchmarks run baseline               # full suite, saved as "baseline"
+    uv run -m benchmarks run after --quick          # small renders, one repeat
+    uv run -m benchmarks run after --only 'render.glass.*'
+    uv run -m benchmarks compare baseline after     # exit status 1 on regressions
+
+    # The thread backend with and without the GIL: the same command on a
+    # GIL build and a free-threaded build, then compare the two.
+    uv run --python 3.14 -m benchmarks run gil --only 'render.*.threads' --only 'render.*.processes'
+    uv run --python 3.14t -m benchmarks run nogil --only 'render.*.threads' --only 'render.*.processes'
+    uv run -m benchmarks compare gil nogil
+
+Results accumulate in benchmarks/results.json, one entry per label.
+"""
@@ -0,0 +1,184 @@
+"""Command line: run the suite under a label, or compare two labels."""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import fnmatch
+import json
+import os
+import platform
+import resource
+import sys
+
+import numpy as np
+
+from benchmarks.suite import (
+    MICRO,
+    QUICK_RESOLUTIONS,
+    RESOLUTIONS,
+    format_bytes,
+    measure_micro,
+    measure_render,
+    render_benchmarks,
+)
+from rayz.render import gil_disabled
+
+RESULTS_FILE = os.path.join(os.path.dirname(__file__), "results.json")
+DEFAULT_THRESHOLD = 0.10
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks", description=__doc__)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="run the suite and save its results under a label")
+    run_p.add_argument("label", nargs="?", default="baseline")
+    run_p.add_argument("--quick", action="store_true", help="tiny and small renders, one repeat")
+    run_p.add_argument("--only", action="append", metavar="PATTERN", help="glob on benchmark names")
+    run_p.add_argument("--repeat", type=int, help="timed runs per benchmark (default 5, 1 with --quick)")
+    run_p.add_argument("--workers", type=int, default=1, help="render workers (default 1)")
+    run_p.add_argument("--file", default=RESULTS_FILE)
+
+    cmp_p = sub.add_parser("compare", help="compare two labels; exit status 1 on regressions")
+    cmp_p.add_argument("baseline")
+    cmp_p.add_argument("candidate")
+    cmp_p.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"slowdown or memory growth counted as a regression (default {DEFAULT_THRESHOLD})",
+    )
+    cmp_p.add_argument("--file", default=RESULTS_FILE)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return run(args)
+    return compare(args)
+
+
+# ----------------------------------------------------------------------
+# run
+# ----------------------------------------------------------------------
+
+
+def run(args) -> int:
+    repeat = args.repeat or (1 if args.quick else 5)
+    resolutions = QUICK_RESOLUTIONS if args.quick else tuple(RESOLUTIONS)
+    benchmarks = [(f"micro.{name}", factory) for name, factory in MICRO.items()]
+    benchmarks += [(f"render.{name}", spec) for name, spec in render_benchmarks(resolutions).items()]
+    if args.only:
+        benchmarks = [(n, b) for n, b in benchmarks if any(fnmatch.fnmatch(n, p) for p in args.only)]
+    if not benchmarks:
+        print(f"No benchmarks match {args.only}")
+        return 1
+
+    print(f"Running {len(benchmarks)} benchmarks as {args.label!r}\n")
+    results = {}
+    for name, spec in benchmarks:
+        print(f"  {name:<32}", end="", flush=True)
+        if name.startswith("micro."):
+            r = measure_micro(spec, repeat)
+            print(f"{r['seconds'] * 1e6:12.3f} µs  {r['calls_per_second']:14,.0f} calls/s", end="")
+        else:
+            factory, width, height, backend = spec
+            r = measure_render(factory, width, height, repeat, args.workers, backend)
+            print(
+                f"{r['seconds']:12.3f} s   {r['pixels_per_second']:14,.0f} px/s"
+                f"  {r['rays_per_second']:14,.0f} rays/s",
+                end="",
+            )
+        print(f"  {format_bytes(r['peak_memory_bytes']):>10} peak")
+        results[name] = r
+
+    all_results = _load(args.file) if os.path.exists(args.file) else {}
+    all_results[args.label] = {
+        "timestamp": datetime.datetime.now().astimezone().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "gil_disabled": gil_disabled(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "workers": args.workers,
+        "max_rss_bytes": _max_rss(),
+        "results": results,
+    }
+    with open(args.file, "w") as f:
+        json.dump(all_results, f, indent=2)
+        f.write("\n")
+    print(f"\nResults saved to {args.file}")
+    return 0
+
+
+def _max_rss() -> int:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+# ----------------------------------------------------------------------
+# compare
+# ----------------------------------------------------------------------
+
+
+def compare(args) -> int:
+    all_results = _load(args.file)
+    for label in (args.baseline, args.candidate):
+        if label not in all_results:
+            print(f"No results for {label!r} in {args.file} (available: {sorted(all_results)})")
+            return 1
+    baseline = all_results[args.baseline]["results"]
+    candidate = all_results[args.candidate]["results"]
+    common = [name for name in baseline if name in candidate]
+    if not common:
+        print(f"{args.baseline!r} and {args.candidate!r} share no benchmarks")
+        return 1
+
+    for role, label in (("Baseline: ", args.baseline), ("Candidate:", args.candidate)):
+        entry = all_results[label]
+        gil = "no GIL" if entry.get("gil_disabled") else "GIL"
+        print(f"{role} {label}  ({entry['timestamp']}, Python {entry['python']}, {gil})")
+    print(f"Threshold: {args.threshold:.0%}\n")
+    print(f"  {'benchmark':<32}{'baseline':>12}{'candidate':>12}{'speedup':>10}{'memory':>10}")
+    regressions = []
+    for name in common:
+        b, c = baseline[name], candidate[name]
+        time_ratio = c["seconds"] / b["seconds"]
+        memory_ratio = c["peak_memory_bytes"] / b["peak_memory_bytes"] if b["peak_memory_bytes"] else 1.0
+        flags = []
+        if time_ratio > 1.0 + args.threshold:
+            flags.append("SLOWER")
+        if memory_ratio > 1.0 + args.threshold:
+            flags.append("MORE MEMORY")
+        if flags:
+            regressions.append(name)
+        print(
+            f"  {name:<32}{_seconds(b['seconds']):>12}{_seconds(c['seconds']):>12}"
+            f"{1.0 / time_ratio:>9.2f}x{memory_ratio:>9.2f}x  {' '.join(flags)}"
+        )
+
+    only = sorted(set(baseline) ^ set(candidate))
+    if only:
+        print(f"\nNot in both runs: {', '.join(only)}")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+def _seconds(s: float) -> str:
+    if s >= 1.0:
+        return f"{s:.3f} s"
+    if s >= 1e-3:
+        return f"{s * 1e3:.3f} ms"
+    return f"{s * 1e6:.3f} µs"
+
+
+def _load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Reproducible benchmark scenes.
+
+Every scene is rebuilt from scratch by its factory, and the random ones
+draw from a fixed seed, so two runs of the suite render the same pixels.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+from rayz.camera import Camera
+from rayz.color import Color
+from rayz.light import PointLight
+from rayz.render import SilhouetteScene, WorldScene
+from rayz.sphere import Sphere
+from rayz.transformations import scaling, translation, view_transform
+from rayz.tuple import Point, Vector
+from rayz.world import World
+
+SEED = 20240101
+
+
+def _camera(width: int, height: int) -> Camera:
+    camera = Camera(width, height, math.pi / 3)
+    camera.transform = view_transform(Point(0, 1.5, -5), Point(0, 1, 0), Vector(0, 1, 0))
+    return camera
+
+
+def _lit_world() -> World:
+    world = World()
+    world.light = PointLight(Point(-10, 10, -10), Color(1, 1, 1))
+    # There are no planes yet, so the floor is a very flat, very wide sphere.
+    floor = Sphere()
+    floor.transform = scaling(10, 0.01, 10)
+    floor.material.color = Color(1, 0.9, 0.9)
+    floor.material.specular = 0.0
+    world.objects.append(floor)
+    return world
+
+
+def spheres(width: int, height: int) -> WorldScene:
+    """Three matte spheres on a floor, as the Ruby suite's small scene."""
+    world = _lit_world()
+    for (x, y, z), radius, color in (
+        ((0, 1, 0), 1.0, Color(0.8, 0.3, 0.3)),
+        ((-1.5, 0.5, -0.5), 0.5, Color(0.3, 0.8, 0.3)),
+        ((1.5, 0.33, -0.75), 0.33, Color(0.3, 0.3, 0.8)),
+    ):
+        s = Sphere()
+        s.transform = translation(x, y, z) * scaling(radius, radius, radius)
+        s.material.color = color
+        world.objects.append(s)
+    return WorldScene(world, _camera(width, height))
+
+
+def glass(width: int, height: int) -> WorldScene:
+    """A glass, a mirror and a matte sphere on a reflective floor, as the
+    Ruby suite's medium scene; most pixels spawn secondary rays."""
+    world = _lit_world()
+    world.objects[0].material.reflective = 0.3
+    world.objects[0].material.specular = 0.3
+
+    clear = Sphere()
+    clear.transform = translation(-1.5, 1, 0)
+    clear.material.transparency = 0.9
+    clear.material.refractive_index = 1.5
+    clear.material.reflective = 0.9
+
+    mirror = Sphere()
+    mirror.transform = translation(1.5, 1, 0)
+    mirror.material.reflective = 0.8
+    mirror.material.color = Color(0.9, 0.9, 0.9)
+
+    matte = Sphere()
+    matte.transform = translation(0, 1, 1)
+    matte.material.color = Color(0.8, 0.3, 0.3)
+
+    world.objects += [clear, mirror, matte]
+    return WorldScene(world, _camera(width, height))
+
+
+def crowd(width: int, height: int, count: int = 500) -> WorldScene:
+    """count small spheres scattered in front of the camera, enough for the
+    world to be traversed through its BVH."""
+    rng = random.Random(SEED)
+    world = _lit_world()
+    for _ in range(count):
+        s = Sphere()
+        radius = rng.uniform(0.05, 0.25)
+        s.transform = translation(rng.uniform(-4, 4), rng.uniform(0, 3), rng.uniform(-1, 6)) * scaling(
+            radius, radius, radius
+        )
+        s.material.color = Color(rng.random(), rng.random(), rng.random())
+        s.material.reflective = rng.choice((0.0, 0.0, 0.5))
+        world.objects.append(s)
+    return WorldScene(world, _camera(width, height))
+
+
+def silhouette(width: int, height: int) -> SilhouetteScene:
+    """Chapter 5's silhouette. Its wall is width pixels across, so a
+    shorter image covers only the wall's top rows."""
+    return SilhouetteScene(Sphere(), width, Color(1, 0, 0))
+
+
+SCENES = {
+    "silhouette": silhouette,
+    "spheres": spheres,
+    "glass": glass,
+    "crowd": crowd,
+}
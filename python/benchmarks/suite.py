@@ -0,0 +1,278 @@
+"""Benchmark definitions and the measurements taken for each.
+
+A microbenchmark times one small operation with timeit and reports the
+best time per call. A render benchmark renders a scene at one resolution
+and reports the best wall time with pixels/sec and rays/sec. Both record
+the peak memory traced while running once more outside the timed runs.
+
+The render.<scene>.<size>.threads and .processes benchmarks render
+BACKEND_SCENES on each backend with a pool of workers, so running the
+suite on a GIL build and on a free-threaded (3.14t) build of the same
+version shows what the thread backend gains without the GIL.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import statistics
+import timeit
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+from benchmarks.scenes import SCENES
+from rayz.canvas import Canvas
+from rayz.ray import Ray
+from rayz.render import WorldScene, render
+from rayz.sphere import Sphere
+from rayz.transformations import rotation_y, scaling, translation
+from rayz.tuple import Point, Vector
+
+RESOLUTIONS = {
+    "tiny": (100, 50),
+    "small": (200, 100),
+    "medium": (400, 200),
+    "large": (800, 400),
+}
+QUICK_RESOLUTIONS = ("tiny", "small")
+
+BACKENDS = ("threads", "processes")
+BACKEND_SCENES = ("spheres", "glass")
+# Backend benchmarks always use a pool, even on one CPU, so they time the
+# backend rather than render()'s in-thread path.
+BACKEND_WORKERS = max(2, os.cpu_count() or 1)
+
+BATCH_RAYS = 10_000
+PPM_SIZE = (200, 200)
+
+# ----------------------------------------------------------------------
+# Microbenchmarks
+#
+# Each factory does its setup and returns (fn, items): a zero-argument
+# callable to time and the number of items (rays, pixels) one call
+# handles, which gives the per-second throughput.
+# ----------------------------------------------------------------------
+
+
+def _tuple_add_sub():
+    p, v = Point(1, 2, 3), Vector(0.5, -1, 2)
+    return lambda: (p + v) - v, 1
+
+
+def _tuple_normalize():
+    v = Vector(1, -2, 3)
+    return v.normalize, 1
+
+
+def _tuple_dot_cross():
+    a, b = Vector(1, 2, 3), Vector(2, 3, 4)
+    return lambda: a.cross(b).dot(a), 1
+
+
+def _matrix_inverse():
+    m = translation(1, -2, 3) * rotation_y(0.5) * scaling(2, 3, 4)
+    return m.inverse, 1
+
+
+def _matrix_mul_tuple():
+    m = translation(1, -2, 3) * rotation_y(0.5) * scaling(2, 3, 4)
+    p = Point(1, 2, 3)
+    return lambda: m * p, 1
+
+
+def _sphere():
+    s = Sphere()
+    s.transform = translation(0.5, 0, 0) * scaling(2, 2, 2)
+    return s
+
+
+def _sphere_intersect():
+    s, ray = _sphere(), Ray(Point(0, 0, -5), Vector(0, 0, 1))
+    return lambda: s.intersect(ray), 1
+
+
+def _sphere_intersect_miss():
+    s, ray = _sphere(), Ray(Point(0, 5, -5), Vector(0, 0, 1))
+    return lambda: s.intersect(ray), 1
+
+
+def _sphere_intersect_rays():
+    rng = np.random.default_rng(0)
+    origins = np.tile([0.0, 0.0, -5.0, 1.0], (BATCH_RAYS, 1))
+    directions = np.zeros((BATCH_RAYS, 4))
+    directions[:, :3] = rng.normal(size=(BATCH_RAYS, 3)) * 0.2 + (0.0, 0.0, 1.0)
+    directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+    s = _sphere()
+    return lambda: s.intersect_rays(origins, directions), BATCH_RAYS
+
+
+def _canvas():
+    width, height = PPM_SIZE
+    canvas = Canvas(width, height)
+    canvas.write_block(0, 0, np.random.default_rng(0).uniform(-0.2, 1.2, size=(height, width, 3)))
+    return canvas
+
+
+def _canvas_to_ppm():
+    canvas = _canvas()
+    return canvas.to_ppm, canvas.width * canvas.height
+
+
+def _canvas_to_ppm_binary():
+    canvas = _canvas()
+    return canvas.to_ppm_binary, canvas.width * canvas.height
+
+
+MICRO = {
+    "tuple.add_sub": _tuple_add_sub,
+    "tuple.normalize": _tuple_normalize,
+    "tuple.dot_cross": _tuple_dot_cross,
+    "matrix.inverse": _matrix_inverse,
+    "matrix.mul_tuple": _matrix_mul_tuple,
+    "sphere.intersect": _sphere_intersect,
+    "sphere.intersect_miss": _sphere_intersect_miss,
+    "sphere.intersect_rays": _sphere_intersect_rays,
+    "canvas.to_ppm": _canvas_to_ppm,
+    "canvas.to_ppm_binary": _canvas_to_ppm_binary,
+}
+
+
+def measure_micro(factory: Callable, repeat: int) -> dict:
+    fn, items = factory()
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat, number)]
+    result = _summary(times)
+    result.update(
+        number=number,
+        calls_per_second=round(1.0 / result["seconds"], 1),
+        items_per_second=round(items / result["seconds"], 1),
+        peak_memory_bytes=_peak_memory(fn),
+    )
+    return result
+
+
+# ----------------------------------------------------------------------
+# Render benchmarks
+# ----------------------------------------------------------------------
+
+
+def render_benchmarks(resolutions) -> dict[str, tuple[Callable, int, int, str | None]]:
+    """Name -> (scene factory, width, height, backend) for every scene at
+    every resolution, with render()'s default backend (None), and for
+    BACKEND_SCENES at every resolution on each of BACKENDS."""
+    benchmarks = {
+        f"{scene}.{size}": (factory, *RESOLUTIONS[size], None)
+        for scene, factory in SCENES.items()
+        for size in resolutions
+    }
+    benchmarks.update(
+        (f"{scene}.{size}.{backend}", (SCENES[scene], *RESOLUTIONS[size], backend))
+        for scene in BACKEND_SCENES
+        for size in resolutions
+        for backend in BACKENDS
+    )
+    return benchmarks
+
+
+def measure_render(
+    factory: Callable, width: int, height: int, repeat: int, workers: int, backend: str | None = None
+) -> dict:
+    """Time render() of one scene, built once and rendered repeat times.
+
+    A first, untimed render counts the rays traced and the peak memory;
+    it also warms the world's caches (packed inverses, the BVH), so the
+    timed renders measure tracing alone. With a backend, workers=1 means
+    BACKEND_WORKERS.
+    """
+    kwargs = {}
+    if backend is not None:
+        kwargs["backend"] = backend
+        if workers == 1:
+            workers = BACKEND_WORKERS
+    scene = factory(width, height)
+    tracemalloc.start()
+    try:
+        rays = _count_rays(scene, width, height)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    times = [
+        timeit.timeit(lambda: render(scene, width, height, workers=workers, **kwargs), number=1)
+        for _ in range(repeat)
+    ]
+    result = _summary(times)
+    pixels = width * height
+    result.update(
+        width=width,
+        height=height,
+        workers=workers,
+        backend=backend or "auto",
+        pixels=pixels,
+        rays=rays,
+        pixels_per_second=round(pixels / result["seconds"], 1),
+        rays_per_second=round(rays / result["seconds"], 1),
+        peak_memory_bytes=peak,
+    )
+    return result
+
+
+def _count_rays(scene, width: int, height: int) -> int:
+    # A WorldScene's rays all pass through its world's nearest_hits (camera
+    # and secondary rays) and any_hits (shadow rays); count them by
+    # shadowing both methods on the instance for one single-process render.
+    if not isinstance(scene, WorldScene):
+        render(scene, width, height, workers=1)
+        return width * height
+    world = scene.world
+    count = 0
+
+    def counted(method):
+        def wrapper(origins, *args):
+            nonlocal count
+            count += len(origins)
+            return method(origins, *args)
+
+        return wrapper
+
+    world.nearest_hits = counted(world.nearest_hits)
+    world.any_hits = counted(world.any_hits)
+    try:
+        render(scene, width, height, workers=1)
+    finally:
+        del world.nearest_hits, world.any_hits
+    return count
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+
+def _summary(times: list[float]) -> dict:
+    return {
+        "seconds": min(times),
+        "mean": statistics.fmean(times),
+        "stddev": statistics.pstdev(times),
+        "repeat": len(times),
+    }
+
+
+def _peak_memory(fn: Callable) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def format_bytes(n: float) -> str:
+    if n <= 0:
+        return "0 B"
+    units = ("B", "KiB", "MiB", "GiB")
+    i = min(len(units) - 1, int(math.log(n, 1024)))
+    return f"{n / 1024**i:.1f} {units[i]}"
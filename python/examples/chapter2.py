@@ -42,7 +42,7 @@ def run() -> None:
     out_path = os.path.join(os.path.dirname(__file__), "chapter2.ppm")
     print(f"Writing {out_path}...", end="", flush=True)
     with open(out_path, "w") as f:
-        f.write(canvas.to_ppm())
+        canvas.write_ppm(f)
     print(" done.")
     print("\n" + "=" * 60 + "\n")
 
@@ -95,7 +95,7 @@ def demo_clock_face() -> None:
     out_path = os.path.join(os.path.dirname(__file__), "chapter3.ppm")
     print(f"Writing {out_path}...", end="", flush=True)
     with open(out_path, "w") as f:
-        f.write(canvas.to_ppm())
+        canvas.write_ppm(f)
     print(" done.")
     print("Clock face with 12 hour marks drawn using rotation matrices.")
     print("\n" + "=" * 60 + "\n")
@@ -142,7 +142,7 @@ def demo_analog_clock() -> None:
     out_path = os.path.join(os.path.dirname(__file__), "chapter4.ppm")
     print(f"  Writing {out_path}...", end="", flush=True)
     with open(out_path, "w") as f:
-        f.write(canvas.to_ppm())
+        canvas.write_ppm(f)
     print(" done.")
     print("\n" + "=" * 60 + "\n")
 
@@ -5,8 +5,13 @@ Usage (from python/):
     uv run examples/run.py all      # all chapters (explicit)
     uv run examples/run.py 1        # chapter 1 only
     uv run examples/run.py 2 3      # chapters 2 and 3
+    uv run examples/run.py 5 --profile
+                                    # chapter 5 with stage timings and counters,
+                                    # saved as examples/chapter5.profile.json
+                                    # and examples/chapter5.pstats
 """
 
+import os
 import sys
 
 from examples.chapter1 import run as ch1
@@ -14,6 +19,7 @@ from examples.chapter2 import run as ch2
 from examples.chapter3 import run as ch3
 from examples.chapter4 import run as ch4
 from examples.chapter5 import run as ch5
+from rayz.profiling import Profiler
 
 CHAPTERS: dict[int, tuple[str, object]] = {
     1: ("Projectile physics", ch1),
@@ -26,6 +32,8 @@ CHAPTERS: dict[int, tuple[str, object]] = {
 
 def main() -> None:
     args = sys.argv[1:]
+    profile = "--profile" in args
+    args = [a for a in args if a != "--profile"]
 
     if not args or args == ["all"]:
         targets = sorted(CHAPTERS.keys())
@@ -43,7 +51,21 @@ def main() -> None:
             print(f"Chapter {n} not yet implemented.")
             continue
         _name, fn = CHAPTERS[n]
+        if profile:
+            run_profiled(n, fn)
+        else:
+            fn()
+
+
+def run_profiled(n: int, fn) -> None:
+    with Profiler(cprofile=True) as prof:
         fn()
+    print(prof.summary())
+    base = os.path.join(os.path.dirname(__file__), f"chapter{n}")
+    prof.save_json(f"{base}.profile.json")
+    prof.dump_stats(f"{base}.pstats")
+    print(f"\nSaved {base}.profile.json and {base}.pstats")
+    print(f"Inspect with: python -m pstats {base}.pstats\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+Feature: Bounding boxes and the BVH
+
+Scenario: Creating an empty bounding box
+  Given box ← bounding_box(empty)
+  Then box.min = point(infinity, infinity, infinity)
+    And box.max = point(-infinity, -infinity, -infinity)
+
+Scenario: Adding points to an empty bounding box
+  Given box ← bounding_box(empty)
+    And p1 ← point(-5, 2, 0)
+    And p2 ← point(7, 0, -3)
+  When p1 is added to box
+    And p2 is added to box
+  Then box.min = point(-5, 0, -3)
+    And box.max = point(7, 2, 0)
+
+Scenario: A sphere has a bounding box
+  Given shape ← sphere()
+  When box ← bounds_of(shape)
+  Then box.min = point(-1, -1, -1)
+    And box.max = point(1, 1, 1)
+
+Scenario: Querying a transformed sphere's bounding box in its parent's space
+  Given shape ← sphere()
+    And m ← translation(1, -3, 5) * scaling(0.5, 2, 4)
+    And set_transform(shape, m)
+  When box ← parent_space_bounds_of(shape)
+  Then box.min = point(0.5, -5, 1)
+    And box.max = point(1.5, -1, 9)
+
+Scenario: A rotated sphere's parent-space bounds are tighter than its transformed cube
+  Given shape ← sphere()
+    And set_transform(shape, rotation_y(π / 4))
+  When box ← parent_space_bounds_of(shape)
+  Then box.min = point(-1, -1, -1)
+    And box.max = point(1, 1, 1)
+
+Scenario Outline: Intersecting a ray with a bounding box at the origin
+  Given box ← bounding_box(min=point(-1, -1, -1) max=point(1, 1, 1))
+    And r ← ray(<origin>, <direction>)
+  Then intersects(box, r) is <result>
+
+  Examples:
+    | origin            | direction          | result |
+    | point(5, 0.5, 0)  | vector(-1, 0, 0)   | true   |
+    | point(-5, 0.5, 0) | vector(1, 0, 0)    | true   |
+    | point(0.5, 5, 0)  | vector(0, -1, 0)   | true   |
+    | point(0, 0.5, 0)  | vector(0, 0, 1)    | true   |
+    | point(-2, 0, 0)   | vector(2, 4, 6)    | false  |
+    | point(2, 2, 0)    | vector(0, 0, -1)   | false  |
+    | point(0, 2, 2)    | vector(0, -1, 0)   | false  |
+
+Scenario: A BVH over no objects is never hit
+  Given bvh ← bvh over 0 random spheres
+    And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+  Then bvh has 0 nodes
+    And nearest_hit(bvh, r) is a miss
+
+Scenario: A BVH node's box contains the boxes of everything beneath it
+  Given bvh ← bvh over 300 random spheres
+  Then every bvh node contains its children
+    And every bvh leaf holds at most 4 spheres
+    And bvh places every sphere in exactly one leaf
+
+Scenario: BVH traversal agrees with testing every object
+  Given bvh ← bvh over 300 random spheres
+  Then nearest_hits(bvh) for 2000 random rays agrees with testing every object
+    And nearest_hit(bvh) for 200 random rays agrees with testing every object
+
+Scenario: BVH occlusion queries agree with testing every object
+  Given bvh ← bvh over 300 random spheres
+  Then any_hits(bvh) for 2000 random rays up to t = 8 agrees with testing every object
+    And any_hit(bvh) for 200 random rays up to t = 8 agrees with testing every object
+
+Scenario: A world with many objects answers nearest_hits through its BVH
+  Given w ← world()
+    And 100 random spheres are added to w
+  Then w uses a BVH for nearest_hits
+    And nearest_hits(w) for a 15x15 fan of rays from point(0, 0, -40) agrees with intersect_world
+
+Scenario: A world keeps its BVH when a sphere outside it is built or moved
+  Given w ← world()
+    And 100 random spheres are added to w
+  When bvh1 ← the BVH of w
+    And a sphere outside w is built and moved
+    And bvh2 ← the BVH of w
+  Then bvh1 and bvh2 are the same BVH
+
+Scenario: A world rebuilds its BVH when one of its spheres moves
+  Given w ← world()
+    And 100 random spheres are added to w
+  When bvh1 ← the BVH of w
+    And the first object of w is moved by translation(0, 0, 30)
+    And bvh2 ← the BVH of w
+  Then bvh1 and bvh2 are not the same BVH
+    And nearest_hits(w) for a 15x15 fan of rays from point(0, 0, -40) agrees with intersect_world
@@ -12,6 +12,28 @@ Scenario: Writing pixels to a canvas
   When write_pixel(canvas, 2, 3, red)
   Then pixel_at(canvas, 2, 3) = red
 
+Scenario: Writing a row of pixels to a canvas
+  Given canvas ← canvas(3, 2)
+  When every pixel of row 1 of canvas is set to color(0.2, 0.4, 0.6)
+  Then pixel_at(canvas, 0, 1) = color(0.2, 0.4, 0.6)
+    And pixel_at(canvas, 2, 1) = color(0.2, 0.4, 0.6)
+    And pixel_at(canvas, 2, 0) = color(0, 0, 0)
+
+Scenario: Writing a block of pixels to a canvas
+  Given canvas ← canvas(4, 4)
+  When a 2x3 block of color(1, 0.5, 0) is written to canvas at 1, 1
+  Then pixel_at(canvas, 1, 1) = color(1, 0.5, 0)
+    And pixel_at(canvas, 2, 3) = color(1, 0.5, 0)
+    And pixel_at(canvas, 3, 1) = color(0, 0, 0)
+    And pixel_at(canvas, 1, 0) = color(0, 0, 0)
+
+Scenario: A canvas exposes its pixels as an array
+  Given canvas ← canvas(10, 20)
+    And red ← color(1, 0, 0)
+  When write_pixel(canvas, 2, 3, red)
+  Then canvas array has shape 20x10x3
+    And canvas array at row 3, col 2 is 1, 0, 0
+
 Scenario: Constructing the PPM header
   Given canvas ← canvas(5, 3)
   When ppm ← canvas_to_ppm(canvas)
@@ -55,7 +77,102 @@ Scenario: Constructing the PPM pixel data
 #     153 255 204 153 255 204 153 255 204 153 255 204 153
 #     """
 
+# Same as the book's scenario, with a color that quantizes identically at our 256 scale.
+Scenario: Splitting long lines in PPM files
+  Given canvas ← canvas(10, 2)
+  When every pixel of canvas is set to color(1, 0.5, 0.25)
+    And ppm ← canvas_to_ppm(canvas)
+  Then lines 4-7 of ppm are
+    """
+    255 128 64 255 128 64 255 128 64 255 128 64 255 128 64 255 128 64 255
+    128 64 255 128 64 255 128 64 255 128 64
+    255 128 64 255 128 64 255 128 64 255 128 64 255 128 64 255 128 64 255
+    128 64 255 128 64 255 128 64 255 128 64
+    """
+
+Scenario: Streaming a canvas to a PPM file
+  Given canvas ← canvas(40, 3)
+  When every pixel of canvas is set to color(1, 0.8, 0.6)
+    And the canvas is streamed to ppm
+  Then ppm = canvas_to_ppm(canvas)
+    And no line of ppm is longer than 70 characters
+
 Scenario: PPM files are terminated by a newline character
   Given canvas ← canvas(5, 3)
   When ppm ← canvas_to_ppm(canvas)
   Then ppm ends with a newline character
+
+Scenario: Constructing a binary P6 PPM
+  Given canvas ← canvas(2, 1)
+    And color1 ← color(1.5, 0, 0)
+  When write_pixel(canvas, 0, 0, color1)
+    And ppm ← canvas_to_ppm_binary(canvas)
+  Then lines 1-3 of binary ppm are
+    """
+    P6
+    2 1
+    255
+    """
+    And the pixel bytes of ppm are 0 0 0 255 0 0
+
+Scenario Outline: Constructing a PNG
+  Given canvas ← canvas(5, 3)
+    And color1 ← color(1.5, 0, 0)
+    And color2 ← color(0, 0.5, 0)
+    And color3 ← color(-0.5, 0, 1)
+  When write_pixel(canvas, 0, 0, color1)
+    And write_pixel(canvas, 2, 1, color2)
+    And write_pixel(canvas, 4, 2, color3)
+    And png ← canvas_to_png(canvas, <level>, "<filter>")
+  Then png starts with the PNG signature
+    And png has width 5 and height 3
+    And png decodes to the pixel bytes of canvas_to_ppm_binary(canvas)
+
+  Examples:
+    | level | filter  |
+    | 0     | none    |
+    | 6     | sub     |
+    | 9     | up      |
+    | 6     | average |
+    | 6     | paeth   |
+
+Scenario: A memory-mapped canvas keeps its pixels in a file
+  Given canvas ← mapped_canvas(10, 20, "float32")
+    And red ← color(1, 0, 0)
+  When write_pixel(canvas, 2, 3, red)
+    And canvas is reopened from its file
+  Then canvas.width = 10
+    And canvas.height = 20
+    And pixel_at(canvas, 2, 3) = red
+    And pixel_at(canvas, 0, 0) = color(0, 0, 0)
+    And canvas array has shape 20x10x3
+
+Scenario: A byte-backed memory-mapped canvas stores quantized colors
+  Given canvas ← mapped_canvas(4, 4, "uint8")
+  When a 2x3 block of color(0.5, 0.25, 1.5) is written to canvas at 1, 1
+  Then pixel_at(canvas, 2, 3) = color(0.5, 0.25, 0.99609375)
+    And pixel_at(canvas, 0, 0) = color(0, 0, 0)
+    And canvas array at row 1, col 1 is 128, 64, 255
+
+Scenario Outline: A memory-mapped canvas exports the same images as a canvas
+  Given canvas ← mapped_canvas(5, 3, "<dtype>")
+    And color1 ← color(1.5, 0, 0)
+    And color2 ← color(0, 0.5, 0)
+    And color3 ← color(-0.5, 0, 1)
+  When write_pixel(canvas, 0, 0, color1)
+    And write_pixel(canvas, 2, 1, color2)
+    And write_pixel(canvas, 4, 2, color3)
+  Then canvas exports the same PPM and PNG files as a copy in memory
+
+  Examples:
+    | dtype   |
+    | float32 |
+    | uint8   |
+
+Scenario: A memory-mapped canvas streams a large image in chunks of rows
+  Given canvas ← mapped_canvas(700, 600, "uint8")
+  When every row of canvas is filled with a gradient
+  Then canvas exports the same PPM and PNG files as a copy in memory
+
+Scenario: A memory-mapped canvas holds floats or bytes
+  Then mapped_canvas(4, 4, "float64") raises an error
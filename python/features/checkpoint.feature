@@ -0,0 +1,45 @@
+Feature: Checkpointed rendering
+
+Scenario: An interrupted render resumes where it stopped
+  Given s ← sphere()
+    And set_transform(s, scaling(1, 0.5, 1))
+    And scene ← silhouette_scene(s, 40)
+    And a checkpoint directory
+  When scene fails on its 6th tile while rendering 40x40 in 8-pixel tiles with checkpoints
+  Then the checkpoint holds 5 of 25 tiles done
+  When image ← scene rendered 40x40 in 8-pixel tiles from the checkpoint
+  Then 20 tiles were rendered
+    And image matches render(scene, 40, 40)
+
+Scenario: Tiles are committed as soon as they finish with a zero interval
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 40)
+    And a checkpoint directory
+  When scene fails on its 4th tile while rendering 40x40 in 8-pixel tiles with checkpoints every 0 seconds
+  Then the checkpoint holds 3 of 25 tiles done
+
+Scenario: A finished checkpoint renders nothing more
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 40)
+    And a checkpoint directory
+  When image1 ← scene rendered 40x40 in 8-pixel tiles from the checkpoint
+    And image2 ← scene rendered 40x40 in 8-pixel tiles from the checkpoint
+  Then 0 tiles were rendered
+    And image1 and image2 have identical pixels
+    And image2 matches render(scene, 40, 40)
+
+Scenario: Worker processes write their tiles into the checkpoint
+  Given s ← sphere()
+    And set_transform(s, scaling(1, 0.5, 1))
+    And scene ← silhouette_scene(s, 40)
+    And a checkpoint directory
+  When image ← scene rendered 40x40 in 8-pixel tiles from the checkpoint with 3 workers
+  Then the checkpoint holds 25 of 25 tiles done
+    And image matches render(scene, 40, 40)
+
+Scenario: A checkpoint is only resumed for the same image and tile sizes
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 40)
+    And a checkpoint directory
+  When image ← scene rendered 40x40 in 8-pixel tiles from the checkpoint
+  Then rendering scene 40x40 in 16-pixel tiles from the checkpoint raises an error
@@ -1,5 +1,12 @@
+from rayz import profiling
 from rayz.math_parser import parse_math  # noqa: F401 — re-exported for step files
 
 
 def before_scenario(context, scenario):
     pass
+
+
+def after_scenario(context, scenario):
+    # A failed step can leave a profiler running, with its hooks installed.
+    if profiling._active is not None:
+        profiling._active.stop()
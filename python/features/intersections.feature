@@ -48,3 +48,53 @@ Scenario: The hit is always the lowest nonnegative intersection
   And xs ← intersections(i1, i2, i3, i4)
   When i ← hit(xs)
   Then i = i4
+
+Scenario: Intersections are sorted by t
+  Given s ← sphere()
+    And i1 ← intersection(5, s)
+    And i2 ← intersection(-3, s)
+    And i3 ← intersection(2, s)
+  When xs ← intersections(i1, i2, i3)
+  Then xs[0] = i2
+    And xs[1] = i3
+    And xs[2] = i1
+
+Scenario: Adding an intersection keeps the list sorted
+  Given s ← sphere()
+    And i1 ← intersection(1, s)
+    And i2 ← intersection(4, s)
+    And i3 ← intersection(2, s)
+    And xs ← intersections(i1, i2)
+  When add(xs, i3)
+  Then xs.count = 3
+    And xs[1] = i3
+    And xs[2] = i2
+
+Scenario: Merging sorted intersection lists
+  Given s1 ← sphere()
+    And s2 ← sphere()
+    And i1 ← intersection(-1, s1)
+    And i2 ← intersection(3, s1)
+    And i3 ← intersection(1, s2)
+    And i4 ← intersection(2, s2)
+    And xs1 ← intersections(i1, i2)
+    And xs2 ← intersections(i3, i4)
+  When xs ← merge(xs1, xs2)
+  Then xs.count = 4
+    And xs[0] = i1
+    And xs[1] = i3
+    And xs[2] = i4
+    And xs[3] = i2
+
+Scenario: The hit of a merged list is its lowest nonnegative intersection
+  Given s1 ← sphere()
+    And s2 ← sphere()
+    And i1 ← intersection(-4, s1)
+    And i2 ← intersection(6, s1)
+    And i3 ← intersection(-2, s2)
+    And i4 ← intersection(3, s2)
+    And xs1 ← intersections(i1, i2)
+    And xs2 ← intersections(i3, i4)
+    And xs ← merge(xs1, xs2)
+  When i ← hit(xs)
+  Then i = i4
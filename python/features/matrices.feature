@@ -197,6 +197,47 @@ Scenario: Testing a noninvertible matrix for invertibility
   Then determinant(A) = 0
     And A is not invertible
 
+Scenario: Inverting a noninvertible matrix is an error
+  Given the following 4x4 matrix A:
+    | -4 |  2 | -2 | -3 |
+    |  9 |  6 |  2 |  6 |
+    |  0 | -5 |  1 | -5 |
+    |  0 |  0 |  0 |  0 |
+  Then inverse(A) raises an error
+
+Scenario: Calculating the inverse of a 2x2 matrix
+  Given the following 2x2 matrix A:
+    | 4 | 7 |
+    | 2 | 6 |
+  Then inverse(A) is the following 2x2 matrix:
+    |  0.6 | -0.7 |
+    | -0.2 |  0.4 |
+
+Scenario: Inverting a noninvertible 2x2 matrix is an error
+  Given the following 2x2 matrix A:
+    | 1 | 2 |
+    | 2 | 4 |
+  Then A is not invertible
+    And inverse(A) raises an error
+
+Scenario: Calculating the inverse of a 3x3 matrix
+  Given the following 3x3 matrix A:
+    |  1 |  2 |  6 |
+    | -5 |  8 | -4 |
+    |  2 |  6 |  4 |
+  Then inverse(A) is the following 3x3 matrix:
+    |  -2/7 | -1/7 |   2/7 |
+    | -3/49 | 2/49 | 13/98 |
+    | 23/98 | 1/98 | -9/98 |
+
+Scenario: Inverting a noninvertible 3x3 matrix is an error
+  Given the following 3x3 matrix A:
+    | 1 | 2 | 3 |
+    | 4 | 5 | 6 |
+    | 7 | 8 | 9 |
+  Then A is not invertible
+    And inverse(A) raises an error
+
 Scenario: Calculating the inverse of a matrix
   Given the following 4x4 matrix A:
       | -5 |  2 |  6 | -8 |
@@ -0,0 +1,79 @@
+Feature: Profiling
+
+Scenario: A profiler counts rays, intersection tests and allocations
+  Given prof ← profiler()
+    And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+    And s ← sphere()
+  When prof is started
+    And xs ← intersect(s, r)
+    And prof is stopped
+  Then prof.rays = 1
+    And prof.intersection_tests = 1
+    And prof.intersection_allocations = 2
+    And prof.tuple_allocations > 0
+    And prof timed 1 call of the intersect stage
+
+Scenario: A world intersection counts one ray and a test per object
+  Given prof ← profiler()
+    And w ← default_world()
+    And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+  When prof is started
+    And xs ← intersect_world(w, r)
+    And prof is stopped
+  Then prof.rays = 1
+    And prof.intersection_tests = 2
+    And prof.intersection_allocations = 4
+    And prof timed 1 call of the intersect stage
+
+Scenario: Setting a transform counts one matrix inversion
+  Given prof ← profiler()
+    And s ← sphere()
+  When prof is started
+    And set_transform(s, scaling(2, 2, 2))
+    And prof is stopped
+  Then prof.matrix_inversions = 1
+
+Scenario: A profiled render times each stage and counts batched rays
+  Given prof ← profiler()
+    And w ← default_world()
+    And c ← camera(11, 11, π/2)
+    And from ← point(0, 0, -5)
+    And to ← point(0, 0, 0)
+    And up ← vector(0, 1, 0)
+    And c.transform ← view_transform(from, to, up)
+  When image ← render(c, w) under prof
+  Then pixel_at(image, 5, 5) = color(0.38066, 0.47583, 0.2855)
+    And prof timed 1 call of the render stage
+    And prof timed the camera, trace, intersect, shadow and shade stages
+    And prof.rays > 121
+    And prof.intersection_tests > 242
+
+Scenario: A profiler cannot be used with the threads backend
+  Given prof ← profiler()
+    And w ← default_world()
+    And c ← camera(11, 11, π/2)
+  Then rendering w through c with backend="threads" under prof raises an error
+    And prof timed 0 calls of the render stage
+
+Scenario: Nothing stays patched once a profiler stops
+  Given prof ← profiler()
+  When prof is started
+    And prof is stopped
+  Then no profiling hooks are installed
+
+Scenario: Only one profiler can be active at a time
+  Given prof ← profiler()
+    And other ← profiler()
+  When prof is started
+  Then starting other raises an error
+    And prof is stopped
+
+Scenario: Exporting profiler results as JSON and pstats
+  Given prof ← profiler(cprofile)
+    And s ← sphere()
+    And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+  When prof is started
+    And xs ← intersect(s, r)
+    And prof is stopped
+  Then the JSON export of prof has rays = 1
+    And the pstats export of prof includes intersect
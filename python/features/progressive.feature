@@ -0,0 +1,86 @@
+Feature: Progressive rendering
+
+Scenario: Progressive passes trace every pixel exactly once
+  When passes ← progressive_passes(21, 13, 8)
+  Then the steps of passes are 8, 4, 2, 1
+    And passes trace every pixel of a 21x13 image exactly once
+
+Scenario: The first pass fills blocks with its coarse samples
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 32)
+  When image ← render_progressive(scene, 32, 32) stopping after 1 pass
+  Then image has the same color in every aligned 8x8 block
+    And pixel_at(image, 16, 16) = color(1, 0, 0)
+
+Scenario: A finished progressive render matches render
+  Given s ← sphere()
+    And set_transform(s, scaling(1, 0.5, 1))
+    And scene ← silhouette_scene(s, 37)
+  When image1 ← render(scene, 37, 37, workers=1)
+    And image2 ← render_progressive(scene, 37, 37)
+  Then image1 and image2 have identical pixels
+    And the callback saw steps 8, 4, 2, 1
+
+Scenario: A progressive render of a world matches render
+  Given w ← default_world()
+    And c ← camera(11, 11, π/2)
+    And from ← point(0, 0, -5)
+    And to ← point(0, 0, 0)
+    And up ← vector(0, 1, 0)
+    And c.transform ← view_transform(from, to, up)
+    And scene ← world_scene(c, w)
+  When image1 ← render(scene, 11, 11, workers=1)
+    And image2 ← render_progressive(scene, 11, 11)
+  Then image1 and image2 have identical pixels
+
+Scenario: No ray is traced twice across passes
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 24)
+    And prof ← profiler()
+  When prof is started
+    And image ← render_progressive(scene, 24, 24)
+    And prof is stopped
+  Then prof.rays = 576
+
+Scenario: Cancelling stops the render after the current pass
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 24)
+    And prof ← profiler()
+  When prof is started
+    And image ← render_progressive(scene, 24, 24) stopping after 2 passes
+    And prof is stopped
+  Then the callback saw steps 8, 4
+    And prof.rays = 36
+
+Scenario Outline: A progressive render is the same with any backend
+  Given s ← sphere()
+    And set_transform(s, scaling(1, 0.5, 1))
+    And scene ← silhouette_scene(s, 40)
+  When image1 ← render_progressive(scene, 40, 40)
+    And image2 ← render_progressive(scene, 40, 40, workers=3, backend="<backend>")
+  Then image1 and image2 have identical pixels
+
+  Examples:
+    | backend   |
+    | processes |
+    | threads   |
+
+Scenario: Writing a PPM preview after each pass
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 16)
+  When image ← render_progressive(scene, 16, 16) with a PPM preview
+  Then the preview file holds image as binary PPM
+
+Scenario: The start step must be a power of two
+  Then progressive_passes(16, 16, 6) raises an error
+
+Scenario Outline: Cancelling while a pass's last chunk is traced still completes that pass
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 24)
+  When image ← render_progressive(scene, 24, 24, workers=<workers>) cancelled by its first chunk
+  Then the callback saw steps 8
+
+  Examples:
+    | workers |
+    | 1       |
+    | 3       |
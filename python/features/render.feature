@@ -0,0 +1,92 @@
+Feature: Tile rendering
+
+Scenario: Splitting an image into tiles
+  When ts ← tiles(10, 7, 4)
+  Then ts.count = 6
+    And ts cover a 10x7 image exactly once
+
+Scenario: Rendering a silhouette scene
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 20)
+  When image ← render(scene, 20, 20, workers=1)
+  Then pixel_at(image, 10, 10) = color(1, 0, 0)
+    And pixel_at(image, 0, 0) = color(0, 0, 0)
+
+Scenario: Rendering gives the same image for any number of workers
+  Given s ← sphere()
+    And set_transform(s, scaling(1, 0.5, 1))
+    And scene ← silhouette_scene(s, 40)
+  When image1 ← render(scene, 40, 40, workers=1)
+    And image2 ← render(scene, 40, 40, workers=3)
+  Then image1 and image2 have identical pixels
+
+Scenario Outline: Rendering needs at least one worker
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 20)
+    And a checkpoint directory
+  Then render(scene, 20, 20, workers=<workers>) raises an error
+    And rendering scene 20x20 from the checkpoint with <workers> workers raises an error
+    And nothing was written to the checkpoint directory
+
+  Examples:
+    | workers |
+    | 0       |
+    | -2      |
+
+Scenario Outline: Rendering gives the same image with any backend
+  Given s ← sphere()
+    And set_transform(s, scaling(1, 0.5, 1))
+    And scene ← silhouette_scene(s, 40)
+  When image1 ← render(scene, 40, 40, workers=1)
+    And image2 ← render(scene, 40, 40, workers=3, backend="<backend>")
+  Then image1 and image2 have identical pixels
+
+  Examples:
+    | backend   |
+    | auto      |
+    | processes |
+    | threads   |
+
+Scenario Outline: Rendering into a memory-mapped canvas
+  Given s ← sphere()
+    And set_transform(s, scaling(1, 0.5, 1))
+    And scene ← silhouette_scene(s, 40)
+  When image1 ← render(scene, 40, 40, workers=1)
+    And image2 ← render(scene, 40, 40, workers=<workers>) into a mapped canvas
+  Then image1 and image2 have identical pixels
+
+  Examples:
+    | workers |
+    | 1       |
+    | 3       |
+
+Scenario: A world scene renders changes made to its world since the last render
+  Given w ← default_world()
+    And c ← camera(11, 11, π/2)
+    And from ← point(0, 0, -5)
+    And to ← point(0, 0, 0)
+    And up ← vector(0, 1, 0)
+    And c.transform ← view_transform(from, to, up)
+    And scene ← world_scene(c, w)
+  When image1 ← render(scene, 11, 11, workers=1)
+    And the color of the first object in w is set to color(0, 0, 1)
+    And image2 ← render(scene, 11, 11, workers=1)
+    And image3 ← render(world_scene(c, w), 11, 11, workers=1)
+  Then pixel_at(image1, 5, 5) = color(0.38066, 0.47583, 0.2855)
+    And pixel_at(image2, 5, 5) = color(0, 0, 0.47583)
+    And image2 and image3 have identical pixels
+
+Scenario: A world scene renders objects removed from its world since the last render
+  Given w ← default_world()
+    And c ← camera(11, 11, π/2)
+    And from ← point(0, 0, -5)
+    And to ← point(0, 0, 0)
+    And up ← vector(0, 1, 0)
+    And c.transform ← view_transform(from, to, up)
+    And scene ← world_scene(c, w)
+  When image1 ← render(scene, 11, 11, workers=1)
+    And the first object in w is removed
+    And image2 ← render(scene, 11, 11, workers=1)
+    And image3 ← render(world_scene(c, w), 11, 11, workers=1)
+  Then image2 and image3 have identical pixels
+    And image1 and image2 do not have identical pixels
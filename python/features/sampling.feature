@@ -0,0 +1,60 @@
+Feature: Supersampling
+
+Scenario: Stratified samples are the centres of a pixel's cells
+  When offsets ← sample_offsets(2, 1)
+  Then the offsets of pixel 0 in offsets are:
+    | x    | y    |
+    | 0.25 | 0.25 |
+    | 0.75 | 0.25 |
+    | 0.25 | 0.75 |
+    | 0.75 | 0.75 |
+
+Scenario: Jittered samples each lie inside their own cell
+  When offsets ← jittered sample_offsets(3, 50)
+  Then every sample in offsets lies inside cell 3x3
+
+Scenario: One stratified sample per pixel is the plain render
+  Given w ← default_world()
+    And c ← camera(11, 11, π/2)
+    And from ← point(0, 0, -5)
+    And to ← point(0, 0, 0)
+    And up ← vector(0, 1, 0)
+    And c.transform ← view_transform(from, to, up)
+    And scene ← world_scene(c, w)
+    And aa ← supersampled(scene, 1)
+  When image1 ← render(scene, 11, 11, workers=1)
+    And image2 ← render(aa, 11, 11, workers=1)
+  Then image1 and image2 have identical pixels
+
+Scenario: Supersampling a silhouette blends its edges
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 20)
+    And aa ← supersampled(scene, 4)
+  When image ← render(aa, 20, 20, workers=1)
+  Then pixel_at(image, 10, 10) = color(1, 0, 0)
+    And pixel_at(image, 0, 0) = color(0, 0, 0)
+    And some pixels of image are partly red
+
+Scenario: Adaptive supersampling matches full supersampling with far fewer rays
+  Given s ← sphere()
+    And set_transform(s, scaling(1, 0.5, 1))
+    And scene ← silhouette_scene(s, 40)
+    And full ← supersampled(scene, 4)
+    And adaptive ← supersampled(scene, 4, threshold=0.1)
+  When image1 ← render(full, 40, 40) counting rays as rays1
+    And image2 ← render(adaptive, 40, 40) counting rays as rays2
+  Then image1 and image2 have identical pixels
+    And rays2 is less than a third of rays1
+
+Scenario: Jittered supersampling gives the same image for any number of workers
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 40)
+    And aa ← supersampled(scene, 3, jittered)
+  When image1 ← render(aa, 40, 40, workers=1)
+    And image2 ← render(aa, 40, 40, workers=3)
+  Then image1 and image2 have identical pixels
+
+Scenario: The sample grid must have at least one cell
+  Given s ← sphere()
+    And scene ← silhouette_scene(s, 20)
+  Then supersampled(scene, 0) raises an error
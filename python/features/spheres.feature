@@ -56,6 +56,20 @@ Scenario: Changing a sphere's transformation
   When set_transform(s, t)
   Then s.transform = t
 
+Scenario: Changing a sphere's transformation caches its inverse
+  Given s ← sphere()
+    And t ← translation(2, 3, 4)
+  When set_transform(s, t)
+  Then s.transform_inverse = inverse(t)
+    And s.transform_inverse_transpose = transpose(inverse(t))
+
+Scenario: A noninvertible transformation is rejected when it is set
+  Given s ← sphere()
+    And t ← translation(2, 3, 4)
+  When set_transform(s, t)
+  Then set_transform(s, scaling(0, 1, 1)) raises an error
+    And s.transform = t
+
 Scenario: Intersecting a scaled sphere with a ray
   Given r ← ray(point(0, 0, -5), vector(0, 0, 1))
     And s ← sphere()
@@ -72,6 +86,62 @@ Scenario: Intersecting a translated sphere with a ray
     And xs ← intersect(s, r)
   Then xs.count = 0
 
+Scenario: Intersecting a batch of rays with a sphere
+  Given s ← sphere()
+    And the following ray batch rs:
+      | ox | oy | oz | dx | dy | dz |
+      | 0  | 0  | -5 | 0  | 0  | 1  |
+      | 0  | 1  | -5 | 0  | 0  | 1  |
+      | 0  | 2  | -5 | 0  | 0  | 1  |
+      | 0  | 0  | 5  | 0  | 0  | 1  |
+  When hits ← intersect_rays(s, rs)
+  Then hits are:
+      | t0 | t1 | hit   |
+      | 4  | 6  | true  |
+      | 5  | 5  | true  |
+      | -  | -  | false |
+      | -6 | -4 | true  |
+
+Scenario: Intersecting a batch of rays with a scaled sphere
+  Given s ← sphere()
+    And the following ray batch rs:
+      | ox | oy | oz | dx | dy | dz |
+      | 0  | 0  | -5 | 0  | 0  | 1  |
+      | 5  | 0  | -5 | 0  | 0  | 1  |
+  When set_transform(s, scaling(2, 2, 2))
+    And hits ← intersect_rays(s, rs)
+  Then hits are:
+      | t0 | t1 | hit   |
+      | 3  | 7  | true  |
+      | -  | -  | false |
+
+Scenario Outline: A sphere blocks a ray only between EPSILON and max_t
+  Given s ← sphere()
+    And r ← ray(<origin>, vector(0, 0, 1))
+  Then any_hit(s, r, <max_t>) is <result>
+
+  Examples:
+    | origin          | max_t | result |
+    | point(0, 0, -5) | 10    | true   |
+    | point(0, 0, -5) | 4     | false  |
+    | point(0, 0, -5) | 4.5   | true   |
+    | point(0, 0, 0)  | 10    | true   |
+    | point(0, 0, 1)  | 10    | false  |
+    | point(0, 0, 5)  | 10    | false  |
+    | point(0, 2, -5) | 10    | false  |
+
+Scenario: Blocking a batch of rays with a sphere
+  Given s ← sphere()
+    And the following ray batch rs:
+      | ox | oy | oz | dx | dy | dz |
+      | 0  | 0  | -5 | 0  | 0  | 1  |
+      | 0  | 0  | -3 | 0  | 0  | 1  |
+      | 0  | 0  | 0  | 0  | 0  | 1  |
+      | 0  | 0  | 1  | 0  | 0  | 1  |
+      | 0  | 2  | -5 | 0  | 0  | 1  |
+  When blocked ← any_hits(s, rs, 3)
+  Then blocked is false, true, true, false, false
+
 Scenario: The normal on a sphere at a point on the x axis
   Given s ← sphere()
   When n ← normal_at(s, point(1, 0, 0))
@@ -110,6 +180,28 @@ Scenario: Computing the normal on a transformed sphere
   When n ← normal_at(s, point(0, √2/2, -√2/2))
   Then n = vector(0, 0.97014, -0.24254)
 
+Scenario: The normals at a batch of points on a transformed sphere
+  Given s ← sphere()
+    And m ← scaling(1, 0.5, 1) * rotation_z(π/5)
+    And set_transform(s, m)
+    And the following point batch ps:
+      | x   | y    | z     |
+      | 0   | √2/2 | -√2/2 |
+      | 0   | 0    | 1     |
+      | 0   | 0    | -1    |
+  When ns ← normals_at(s, ps)
+  Then the normals in ns are:
+      | x | y       | z        |
+      | 0 | 0.97014 | -0.24254 |
+      | 0 | 0       | 1        |
+      | 0 | 0       | -1       |
+
+Scenario: Batched normals agree with normal_at
+  Given s ← sphere()
+    And m ← translation(1, -2, 3) * shearing(1, 0, 0, 0.5, 0, 0)
+    And set_transform(s, m)
+  Then normals_at(s) agrees with normal_at for 500 random points on s
+
 Scenario: A sphere has a default material
   Given s ← sphere()
   When m ← s.material
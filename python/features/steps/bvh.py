@@ -0,0 +1,227 @@
+import numpy as np
+import pytest
+from behave import given, then, use_step_matcher, when
+
+from rayz.bounds import BoundingBox
+from rayz.bvh import BVH
+from rayz.math_parser import parse_math
+from rayz.ray import Ray
+from rayz.sphere import Sphere, _any_sphere_hits, _nearest_sphere_hits
+from rayz.transformations import rotation_y, scaling, translation
+from rayz.tuple import Point, Vector
+
+use_step_matcher("re")
+
+_V = r"([A-Za-z][A-Za-z0-9_]*)"
+_A = r"([^\s,)]+)"
+_I = r"(\d+)"
+
+
+def _random_spheres(count: int, seed: int = 7) -> list[Sphere]:
+    rng = np.random.default_rng(seed)
+    spheres = []
+    for _ in range(count):
+        s = Sphere()
+        r = rng.uniform(0.1, 0.6)
+        s.set_transform(
+            translation(*rng.uniform(-10, 10, 3))
+            * rotation_y(rng.uniform(0, np.pi))
+            * scaling(r, r * rng.uniform(0.5, 2.0), r)
+        )
+        spheres.append(s)
+    return spheres
+
+
+def _random_rays(count: int, seed: int = 11) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    origins = np.ones((count, 4))
+    origins[:, :3] = rng.uniform(-15, 15, (count, 3))
+    directions = np.zeros((count, 4))
+    directions[:, :3] = rng.normal(size=(count, 3))
+    directions[:, :3] /= np.linalg.norm(directions[:, :3], axis=1)[:, np.newaxis]
+    # Some rays run exactly parallel to a pair of slabs.
+    directions[::17, :3] = (0.0, 0.0, 1.0)
+    return origins, directions
+
+
+def _brute_force(spheres: list[Sphere], origins: np.ndarray, directions: np.ndarray):
+    inv = np.stack([s.transform_inverse.to_array() for s in spheres])
+    return _nearest_sphere_hits(inv, origins, directions)
+
+
+# ---------------------------------------------------------------------------
+# Bounding boxes
+# ---------------------------------------------------------------------------
+
+
+@given(rf"{_V} ← bounding_box\(empty\)")
+def step_given_empty_box(context, var):
+    setattr(context, var, BoundingBox())
+
+
+@given(rf"{_V} ← bounding_box\(min=point\({_A},\s*{_A},\s*{_A}\) max=point\({_A},\s*{_A},\s*{_A}\)\)")
+def step_given_box(context, var, x0, y0, z0, x1, y1, z1):
+    minimum = Point(parse_math(x0), parse_math(y0), parse_math(z0))
+    maximum = Point(parse_math(x1), parse_math(y1), parse_math(z1))
+    setattr(context, var, BoundingBox(minimum, maximum))
+
+
+@when(rf"{_V} is added to {_V}")
+def step_when_add_point(context, point, box):
+    getattr(context, box).add_point(getattr(context, point))
+
+
+@when(rf"{_V} ← bounds_of\({_V}\)")
+def step_when_bounds_of(context, var, shape):
+    setattr(context, var, getattr(context, shape).bounds())
+
+
+@when(rf"{_V} ← parent_space_bounds_of\({_V}\)")
+def step_when_parent_space_bounds_of(context, var, shape):
+    setattr(context, var, getattr(context, shape).parent_space_bounds())
+
+
+@then(rf"{_V}\.(min|max) = point\({_A},\s*{_A},\s*{_A}\)")
+def step_then_box_corner(context, var, corner, x, y, z):
+    expected = Point(parse_math(x), parse_math(y), parse_math(z))
+    actual = getattr(getattr(context, var), corner)
+    # Compare component-wise so infinite corners match too.
+    for a, e in zip((actual.x, actual.y, actual.z), (expected.x, expected.y, expected.z)):
+        assert a == pytest.approx(e, abs=1e-5), f"{corner}: {actual} != {expected}"
+
+
+@then(rf"intersects\({_V},\s*{_V}\) is (true|false)")
+def step_then_box_intersects(context, box, ray, expected):
+    assert getattr(context, box).intersects(getattr(context, ray)) == (expected == "true")
+
+
+# ---------------------------------------------------------------------------
+# BVH
+# ---------------------------------------------------------------------------
+
+
+@given(rf"{_V} ← bvh over {_I} random spheres")
+def step_given_bvh(context, var, count):
+    setattr(context, var, BVH(_random_spheres(int(count))))
+
+
+@given(rf"{_I} random spheres are added to {_V}")
+def step_given_random_spheres_in_world(context, count, var):
+    getattr(context, var).objects.extend(_random_spheres(int(count)))
+
+
+@then(rf"{_V} has {_I} nodes")
+def step_then_bvh_nodes(context, var, count):
+    assert len(getattr(context, var)) == int(count)
+
+
+@then(rf"nearest_hit\({_V},\s*{_V}\) is a miss")
+def step_then_bvh_miss(context, var, ray):
+    assert getattr(context, var).nearest_hit(getattr(context, ray)) == (-1, float("inf"))
+
+
+@then(rf"every {_V} node contains its children")
+def step_then_nodes_contain_children(context, var):
+    bvh = getattr(context, var)
+
+    def box(node):
+        return BoundingBox(Point(*bvh.node_min[node]), Point(*bvh.node_max[node]))
+
+    for node in range(len(bvh)):
+        if bvh.node_count[node]:
+            start = bvh.node_offset[node]
+            for i in bvh.order[start : start + bvh.node_count[node]]:
+                assert box(node).contains_box(bvh.objects[i].parent_space_bounds())
+        else:
+            assert box(node).contains_box(box(node + 1))
+            assert box(node).contains_box(box(bvh.node_offset[node]))
+
+
+@then(rf"every {_V} leaf holds at most {_I} spheres")
+def step_then_leaf_size(context, var, count):
+    bvh = getattr(context, var)
+    assert bvh.node_count.max() <= int(count)
+
+
+@then(rf"{_V} places every sphere in exactly one leaf")
+def step_then_leaves_partition(context, var):
+    bvh = getattr(context, var)
+    slots = []
+    for node in np.flatnonzero(bvh.node_count):
+        slots.extend(range(bvh.node_offset[node], bvh.node_offset[node] + bvh.node_count[node]))
+    assert sorted(slots) == list(range(len(bvh.objects)))
+    assert sorted(bvh.order.tolist()) == list(range(len(bvh.objects)))
+
+
+@then(rf"nearest_hits\({_V}\) for {_I} random rays agrees with testing every object")
+def step_then_bvh_batch_agrees(context, var, count):
+    bvh = getattr(context, var)
+    origins, directions = _random_rays(int(count))
+    index, t = bvh.nearest_hits(origins, directions)
+    expected_index, expected_t = _brute_force(bvh.objects, origins, directions)
+    assert (index >= 0).any()
+    np.testing.assert_array_equal(index, expected_index)
+    np.testing.assert_allclose(t, expected_t)
+
+
+@then(rf"nearest_hit\({_V}\) for {_I} random rays agrees with testing every object")
+def step_then_bvh_scalar_agrees(context, var, count):
+    bvh = getattr(context, var)
+    origins, directions = _random_rays(int(count))
+    expected_index, expected_t = _brute_force(bvh.objects, origins, directions)
+    for i, (o, d) in enumerate(zip(origins.tolist(), directions.tolist())):
+        index, t = bvh.nearest_hit(Ray(Point(*o[:3]), Vector(*d[:3])))
+        assert index == expected_index[i]
+        assert t == pytest.approx(expected_t[i], abs=1e-9)
+
+
+@then(rf"any_hits\({_V}\) for {_I} random rays up to t = {_A} agrees with testing every object")
+def step_then_bvh_any_hits_agree(context, var, count, max_t):
+    bvh = getattr(context, var)
+    origins, directions = _random_rays(int(count))
+    max_t = parse_math(max_t)
+    inv = np.stack([s.transform_inverse.to_array() for s in bvh.objects])
+    expected = _any_sphere_hits(inv, origins, directions, max_t)
+    assert expected.any() and not expected.all()
+    np.testing.assert_array_equal(bvh.any_hits(origins, directions, max_t), expected)
+
+
+@then(rf"any_hit\({_V}\) for {_I} random rays up to t = {_A} agrees with testing every object")
+def step_then_bvh_any_hit_agrees(context, var, count, max_t):
+    bvh = getattr(context, var)
+    origins, directions = _random_rays(int(count))
+    max_t = parse_math(max_t)
+    for o, d in zip(origins.tolist(), directions.tolist()):
+        ray = Ray(Point(*o[:3]), Vector(*d[:3]))
+        assert bvh.any_hit(ray, max_t) == any(s.any_hit(ray, max_t) for s in bvh.objects)
+
+
+@then(rf"{_V} uses a BVH for nearest_hits")
+def step_then_world_uses_bvh(context, var):
+    w = getattr(context, var)
+    origins, directions = _random_rays(10)
+    w.nearest_hits(origins, directions)
+    assert isinstance(w._cache.get("bvh"), BVH)
+
+
+@when(rf"{_V} ← the BVH of {_V}")
+def step_when_world_bvh(context, var, world_var):
+    setattr(context, var, getattr(context, world_var).bvh())
+
+
+@when(rf"a sphere outside {_V} is built and moved")
+def step_when_outside_sphere(context, world_var):
+    s = Sphere()
+    s.set_transform(translation(1, 2, 3))
+    assert s not in getattr(context, world_var).objects
+
+
+@when(rf"the first object of {_V} is moved by translation\({_A},\s*{_A},\s*{_A}\)")
+def step_when_move_first_object(context, world_var, x, y, z):
+    obj = getattr(context, world_var).objects[0]
+    obj.set_transform(translation(parse_math(x), parse_math(y), parse_math(z)) * obj.transform)
+
+
+@then(rf"{_V} and {_V} are (not )?the same BVH")
+def step_then_same_bvh(context, a, b, negate):
+    assert (getattr(context, a) is getattr(context, b)) != bool(negate)
@@ -0,0 +1,115 @@
+import math
+
+import pytest
+from behave import given, then, use_step_matcher, when
+
+from rayz.camera import Camera
+from rayz.math_parser import parse_math
+from rayz.render import WorldScene, render
+from rayz.transformations import rotation_x, rotation_y, rotation_z, scaling, translation, view_transform
+from rayz.tuple import Point, Vector
+
+use_step_matcher("re")
+
+_V = r"([A-Za-z][A-Za-z0-9_]*)"
+_A = r"([^\s,)]+)"
+_I = r"(\d+)"
+
+_TRANSFORM_FUNCS = {
+    "rotation_x": rotation_x,
+    "rotation_y": rotation_y,
+    "rotation_z": rotation_z,
+    "scaling": scaling,
+    "translation": translation,
+}
+
+
+def _value(context, text: str):
+    return getattr(context, text) if hasattr(context, text) else parse_math(text)
+
+
+def _eval_transform(expr: str):
+    """Evaluate a product of transform calls, e.g. rotation_y(π/4) * translation(0, -2, 5)."""
+    result = None
+    for term in expr.split(" * "):
+        name, args = term.strip().rstrip(")").split("(", 1)
+        m = _TRANSFORM_FUNCS[name](*(parse_math(a.strip()) for a in args.split(",")))
+        result = m if result is None else result * m
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Construction
+# ---------------------------------------------------------------------------
+
+
+@given(r"(hsize|vsize|field_of_view) ← ([^\s]+)")
+def step_given_camera_param(context, var, val):
+    setattr(context, var, parse_math(val))
+
+
+@given(rf"{_V} ← camera\({_A},\s*{_A},\s*{_A}\)")
+@when(rf"{_V} ← camera\({_A},\s*{_A},\s*{_A}\)")
+def step_camera(context, var, hsize, vsize, fov):
+    hsize, vsize = int(_value(context, hsize)), int(_value(context, vsize))
+    setattr(context, var, Camera(hsize, vsize, _value(context, fov)))
+
+
+@when(rf"{_V}\.transform ← ((?:rotation_[xyz]|scaling|translation)\(.+\))")
+def step_when_camera_transform(context, var, expr):
+    getattr(context, var).transform = _eval_transform(expr)
+
+
+@given(rf"{_V}\.transform ← view_transform\({_V},\s*{_V},\s*{_V}\)")
+def step_given_camera_view_transform(context, var, frm, to, up):
+    getattr(context, var).transform = view_transform(
+        getattr(context, frm), getattr(context, to), getattr(context, up)
+    )
+
+
+@when(rf"{_V} ← render\({_V},\s*{_V}\)")
+def step_when_render_world(context, var, camera, world):
+    c = getattr(context, camera)
+    setattr(context, var, render(WorldScene(getattr(context, world), c), c.hsize, c.vsize, workers=1))
+
+
+@when(rf"{_V} ← ray_for_pixel\({_V},\s*{_I},\s*{_I}\)")
+def step_when_ray_for_pixel(context, var, cam, px, py):
+    setattr(context, var, getattr(context, cam).ray_for_pixel(int(px), int(py)))
+
+
+@when(rf"{_V} ← rays_for_tile\({_V}(?:,\s*{_I},\s*{_I},\s*{_I},\s*{_I})?\)")
+def step_when_rays_for_tile(context, var, cam, col, row, w, h):
+    camera = getattr(context, cam)
+    if col is None:
+        setattr(context, var, camera.rays_for_tile())
+    else:
+        setattr(context, var, camera.rays_for_tile(int(col), int(row), int(w), int(h)))
+
+
+# ---------------------------------------------------------------------------
+# Then
+# ---------------------------------------------------------------------------
+
+
+@then(rf"{_V}\.(hsize|vsize|field_of_view|pixel_size) = {_A}")
+def step_then_camera_attr(context, var, attr, val):
+    assert getattr(getattr(context, var), attr) == pytest.approx(parse_math(val), abs=1e-5)
+
+
+@then(rf"{_V} holds {_I} rays")
+def step_then_ray_batch_count(context, var, n):
+    origins, directions = getattr(context, var)
+    assert len(origins) == len(directions) == int(n)
+
+
+@then(rf"every ray in {_V} matches ray_for_pixel\({_V}\) for tile {_I}, {_I}, {_I}, {_I}")
+def step_then_rays_match(context, var, cam, col, row, w, h):
+    camera = getattr(context, cam)
+    origins, directions = getattr(context, var)
+    col, row, w, h = int(col), int(row), int(w), int(h)
+    for i in range(w * h):
+        r = camera.ray_for_pixel(col + i % w, row + i // w)
+        assert Point(*origins[i, :3]) == r.origin
+        assert Vector(*directions[i, :3]) == r.direction
+        assert math.isclose(origins[i, 3], 1.0) and math.isclose(directions[i, 3], 0.0, abs_tol=1e-12)
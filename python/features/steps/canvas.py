@@ -1,6 +1,13 @@
+import io
+import os
+import struct
+import tempfile
+import zlib
+
+import numpy as np
 from behave import given, then, use_step_matcher, when
 
-from rayz.canvas import Canvas
+from rayz.canvas import Canvas, MappedCanvas
 from rayz.color import Color
 from rayz.math_parser import parse_math
 
@@ -52,11 +59,68 @@ def step_then_pixel_at(context, col, row, color_var):
     assert context.canvas.pixel_at(col=int(col), row=int(row)) == getattr(context, color_var)
 
 
+@when(rf"every pixel of row (\d+) of canvas is set to color\({_A},\s*{_A},\s*{_A}\)")
+def step_when_write_row(context, row, r, g, b):
+    rgb = [parse_math(r), parse_math(g), parse_math(b)]
+    context.canvas.write_row(int(row), np.tile(rgb, (context.canvas.width, 1)))
+
+
+@when(rf"a (\d+)x(\d+) block of color\({_A},\s*{_A},\s*{_A}\) is written to canvas at (\d+),\s*(\d+)")
+def step_when_write_block(context, w, h, r, g, b, col, row):
+    block = np.empty((int(h), int(w), 3))
+    block[:] = [parse_math(r), parse_math(g), parse_math(b)]
+    context.canvas.write_block(int(col), int(row), block)
+
+
+@then(rf"pixel_at\(canvas,\s*(\d+),\s*(\d+)\) = color\({_A},\s*{_A},\s*{_A}\)")
+def step_then_pixel_at_color(context, col, row, r, g, b):
+    expected = Color(parse_math(r), parse_math(g), parse_math(b))
+    assert context.canvas.pixel_at(col=int(col), row=int(row)) == expected
+
+
+@then(r"canvas array has shape (\d+)x(\d+)x(\d+)")
+def step_then_canvas_array_shape(context, h, w, c):
+    pixels = context.canvas.to_array()
+    assert pixels.shape == (int(h), int(w), int(c))
+    assert pixels.dtype == np.float32
+
+
+@then(rf"canvas array at row (\d+), col (\d+) is {_A},\s*{_A},\s*{_A}")
+def step_then_canvas_array_at(context, row, col, r, g, b):
+    expected = [parse_math(r), parse_math(g), parse_math(b)]
+    assert context.canvas.to_array()[int(row), int(col)].tolist() == expected
+
+
+@when(rf"every pixel of canvas is set to color\({_A},\s*{_A},\s*{_A}\)")
+def step_when_fill_canvas(context, r, g, b):
+    color = Color(parse_math(r), parse_math(g), parse_math(b))
+    for row in range(context.canvas.height):
+        for col in range(context.canvas.width):
+            context.canvas.write_pixel(col=col, row=row, color=color)
+
+
 @when(r"ppm ← canvas_to_ppm\(canvas\)")
 def step_when_canvas_to_ppm(context):
     context.ppm = context.canvas.to_ppm()
 
 
+@when("the canvas is streamed to ppm")
+def step_when_stream_ppm(context):
+    out = io.StringIO()
+    context.canvas.write_ppm(out)
+    context.ppm = out.getvalue()
+
+
+@then(r"ppm = canvas_to_ppm\(canvas\)")
+def step_then_ppm_matches_to_ppm(context):
+    assert context.ppm == context.canvas.to_ppm()
+
+
+@then(r"no line of ppm is longer than (\d+) characters")
+def step_then_ppm_line_limit(context, n):
+    assert all(len(line) <= int(n) for line in context.ppm.split("\n"))
+
+
 @then("lines 1-3 of ppm are")
 def step_then_ppm_header(context):
     ppm_lines = context.ppm.split("\n")[:3]
@@ -73,6 +137,156 @@ def step_then_ppm_body(context):
         assert ppm_lines[i] == expected_line, f"Line {i + 4}: {ppm_lines[i]!r} != {expected_line!r}"
 
 
+@then("lines 4-7 of ppm are")
+def step_then_ppm_body_wrapped(context):
+    ppm_lines = context.ppm.split("\n")[3:7]
+    doc_lines = context.text.split("\n")
+    for i, expected_line in enumerate(doc_lines):
+        assert ppm_lines[i] == expected_line, f"Line {i + 4}: {ppm_lines[i]!r} != {expected_line!r}"
+
+
 @then("ppm ends with a newline character")
 def step_then_ppm_ends_newline(context):
     assert context.ppm.endswith("\n")
+
+
+# ---------------------------------------------------------------------------
+# Binary PPM and PNG export
+# ---------------------------------------------------------------------------
+
+
+def _ppm_binary_pixels(data: bytes) -> bytes:
+    # The P6 header is three newline-terminated lines.
+    return data.split(b"\n", 3)[3]
+
+
+def _png_chunks(data: bytes):
+    pos = 8
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        yield data[pos + 4 : pos + 8], data[pos + 8 : pos + 8 + length]
+        pos += 12 + length
+
+
+def _png_unfilter(raw: bytes, width: int, height: int) -> bytes:
+    stride = width * 3
+    out = bytearray()
+    prior = bytearray(stride)
+    for y in range(height):
+        kind = raw[y * (stride + 1)]
+        line = bytearray(raw[y * (stride + 1) + 1 : (y + 1) * (stride + 1)])
+        for i in range(stride):
+            a = line[i - 3] if i >= 3 else 0
+            b = prior[i]
+            c = prior[i - 3] if i >= 3 else 0
+            if kind == 1:
+                line[i] = (line[i] + a) & 0xFF
+            elif kind == 2:
+                line[i] = (line[i] + b) & 0xFF
+            elif kind == 3:
+                line[i] = (line[i] + (a + b) // 2) & 0xFF
+            elif kind == 4:
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                pred = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+                line[i] = (line[i] + pred) & 0xFF
+        out += line
+        prior = line
+    return bytes(out)
+
+
+@when(r"ppm ← canvas_to_ppm_binary\(canvas\)")
+def step_when_canvas_to_ppm_binary(context):
+    context.ppm = context.canvas.to_ppm_binary()
+
+
+@when(r'png ← canvas_to_png\(canvas,\s*(-?\d+),\s*"(\w+)"\)')
+def step_when_canvas_to_png(context, level, filter_type):
+    context.png = context.canvas.to_png(compression_level=int(level), filter_type=filter_type)
+
+
+@then("lines 1-3 of binary ppm are")
+def step_then_binary_ppm_header(context):
+    ppm_lines = context.ppm.split(b"\n")[:3]
+    doc_lines = context.text.encode("ascii").split(b"\n")
+    assert ppm_lines == doc_lines, f"{ppm_lines!r} != {doc_lines!r}"
+
+
+@then(r"the pixel bytes of ppm are ([\d ]+)")
+def step_then_ppm_binary_pixels(context, values):
+    assert list(_ppm_binary_pixels(context.ppm)) == [int(v) for v in values.split()]
+
+
+@then("png starts with the PNG signature")
+def step_then_png_signature(context):
+    assert context.png[:8] == b"\x89PNG\r\n\x1a\n"
+
+
+@then(r"png has width (\d+) and height (\d+)")
+def step_then_png_size(context, w, h):
+    kind, data = next(_png_chunks(context.png))
+    assert kind == b"IHDR"
+    assert struct.unpack(">II", data[:8]) == (int(w), int(h))
+
+
+@then(r"png decodes to the pixel bytes of canvas_to_ppm_binary\(canvas\)")
+def step_then_png_matches_ppm(context):
+    chunks = list(_png_chunks(context.png))
+    assert chunks[-1][0] == b"IEND"
+    raw = zlib.decompress(b"".join(data for kind, data in chunks if kind == b"IDAT"))
+    canvas = context.canvas
+    pixels = _png_unfilter(raw, canvas.width, canvas.height)
+    assert pixels == _ppm_binary_pixels(canvas.to_ppm_binary())
+
+
+# ---------------------------------------------------------------------------
+# Memory-mapped canvases
+# ---------------------------------------------------------------------------
+
+
+def _mapped_canvas(context, w, h, dtype):
+    tmp = tempfile.TemporaryDirectory()
+    context.add_cleanup(tmp.cleanup)
+    return MappedCanvas(os.path.join(tmp.name, "canvas.npy"), int(w), int(h), dtype)
+
+
+@given(r'canvas ← mapped_canvas\((\d+),\s*(\d+),\s*"(\w+)"\)')
+def step_given_mapped_canvas(context, w, h, dtype):
+    context.canvas = _mapped_canvas(context, w, h, dtype)
+
+
+@when("canvas is reopened from its file")
+def step_when_reopen_canvas(context):
+    context.canvas.flush()
+    context.canvas = MappedCanvas.open(context.canvas.path)
+
+
+@when("every row of canvas is filled with a gradient")
+def step_when_fill_gradient(context):
+    canvas = context.canvas
+    ramp = np.linspace(0.0, 1.0, canvas.width * 3).reshape(canvas.width, 3)
+    for row in range(canvas.height):
+        canvas.write_row(row, (ramp + row / canvas.height) % 1.0)
+
+
+@then("canvas exports the same PPM and PNG files as a copy in memory")
+def step_then_mapped_exports(context):
+    mapped = context.canvas
+    pixels = mapped.to_array()
+    if pixels.dtype == np.uint8:
+        # Byte channel b stands for the color b / 256, which quantizes back to b.
+        pixels = pixels / 256
+    copy = Canvas(mapped.width, mapped.height)
+    copy.write_block(0, 0, pixels)
+    assert mapped.to_ppm() == copy.to_ppm()
+    assert mapped.to_ppm_binary() == copy.to_ppm_binary()
+    assert mapped.to_png() == copy.to_png()
+
+
+@then(r'mapped_canvas\((\d+),\s*(\d+),\s*"(\w+)"\) raises an error')
+def step_then_mapped_canvas_error(context, w, h, dtype):
+    try:
+        _mapped_canvas(context, w, h, dtype)
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
@@ -0,0 +1,129 @@
+import os
+import tempfile
+
+import numpy as np
+from behave import given, then, use_step_matcher, when
+
+from rayz.checkpoint import Checkpoint, render_checkpointed
+from rayz.render import render
+
+use_step_matcher("re")
+
+_V = r"([A-Za-z][A-Za-z0-9_]*)"
+_I = r"(\d+)"
+
+
+class _CountingScene:
+    """Wraps a scene, counting its tiles and failing on the fail_on-th one."""
+
+    def __init__(self, scene, fail_on=None):
+        self.scene = scene
+        self.fail_on = fail_on
+        self.count = 0
+
+    def render_tile(self, col, row, width, height):
+        self.count += 1
+        if self.count == self.fail_on:
+            raise RuntimeError("simulated crash")
+        return self.scene.render_tile(col, row, width, height)
+
+
+@given(r"a checkpoint directory")
+def step_checkpoint_dir(context):
+    tmp = tempfile.TemporaryDirectory()
+    context.add_cleanup(tmp.cleanup)
+    context.checkpoint_dir = tmp.name
+
+
+@when(
+    rf"{_V} fails on its {_I}(?:st|nd|rd|th) tile while rendering {_I}x{_I} in {_I}-pixel tiles "
+    rf"with checkpoints(?: every {_I} seconds)?"
+)
+def step_render_fails(context, scene, fail_on, w, h, tile_size, interval):
+    flaky = _CountingScene(getattr(context, scene), int(fail_on))
+    interval = float(interval) if interval is not None else 3600.0
+    try:
+        render_checkpointed(
+            flaky,
+            int(w),
+            int(h),
+            context.checkpoint_dir,
+            workers=1,
+            tile_size=int(tile_size),
+            interval=interval,
+        )
+    except RuntimeError:
+        context.checkpoint_size = (int(w), int(h), int(tile_size))
+        return
+    raise AssertionError("expected the render to fail")
+
+
+@when(rf"{_V} ← {_V} rendered {_I}x{_I} in {_I}-pixel tiles from the checkpoint(?: with {_I} workers)?")
+def step_render_checkpointed(context, var, scene, w, h, tile_size, workers):
+    context.checkpoint_size = (int(w), int(h), int(tile_size))
+    if workers is None:
+        counting = _CountingScene(getattr(context, scene))
+        image = render_checkpointed(
+            counting, int(w), int(h), context.checkpoint_dir, workers=1, tile_size=int(tile_size)
+        )
+        context.tiles_rendered = counting.count
+    else:
+        image = render_checkpointed(
+            getattr(context, scene),
+            int(w),
+            int(h),
+            context.checkpoint_dir,
+            workers=int(workers),
+            tile_size=int(tile_size),
+            backend="processes",
+        )
+    setattr(context, var, image)
+
+
+@then(rf"the checkpoint holds {_I} of {_I} tiles done")
+def step_checkpoint_holds(context, done, total):
+    checkpoint = Checkpoint(context.checkpoint_dir, *context.checkpoint_size)
+    assert int(checkpoint.done.sum()) == int(done), checkpoint
+    assert len(checkpoint.tiles) == int(total), checkpoint
+
+
+@then(rf"{_I} tiles were rendered")
+def step_tiles_rendered(context, count):
+    assert context.tiles_rendered == int(count), context.tiles_rendered
+
+
+@then(rf"{_V} matches render\({_V},\s*{_I},\s*{_I}\)")
+def step_matches_render(context, var, scene, w, h):
+    expected = render(getattr(context, scene), int(w), int(h), workers=1)
+    assert np.array_equal(getattr(context, var).to_array(), expected.to_array())
+
+
+@then(rf"rendering {_V} {_I}x{_I} in {_I}-pixel tiles from the checkpoint raises an error")
+def step_render_mismatch(context, scene, w, h, tile_size):
+    try:
+        render_checkpointed(
+            getattr(context, scene),
+            int(w),
+            int(h),
+            context.checkpoint_dir,
+            workers=1,
+            tile_size=int(tile_size),
+        )
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
+@then(rf"rendering {_V} {_I}x{_I} from the checkpoint with (-?\d+) workers raises an error")
+def step_render_checkpointed_workers(context, scene, w, h, workers):
+    scene = getattr(context, scene)
+    try:
+        render_checkpointed(scene, int(w), int(h), context.checkpoint_dir, workers=int(workers))
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
+@then(r"nothing was written to the checkpoint directory")
+def step_checkpoint_dir_empty(context):
+    assert os.listdir(context.checkpoint_dir) == [], os.listdir(context.checkpoint_dir)
@@ -1,7 +1,7 @@
 import pytest
 from behave import given, then, use_step_matcher, when
 
-from rayz.intersection import Intersection, hit, intersections
+from rayz.intersection import Intersection, IntersectionList, hit, intersections
 from rayz.math_parser import parse_math
 from rayz.sphere import Sphere
 
@@ -49,6 +49,18 @@ def step_when_intersections(context, var, args):
     setattr(context, var, intersections(*items))
 
 
+@given(rf"{_V} ← merge\((.+)\)")
+@when(rf"{_V} ← merge\((.+)\)")
+def step_merge(context, var, args):
+    lists = [getattr(context, a.strip()) for a in args.split(",")]
+    setattr(context, var, IntersectionList.merge(*lists))
+
+
+@when(rf"add\({_V},\s*{_V}\)")
+def step_when_add(context, xs_var, i_var):
+    getattr(context, xs_var).add(getattr(context, i_var))
+
+
 @when(rf"{_V} ← hit\({_V}\)")
 def step_when_hit(context, var, xs_var):
     setattr(context, var, hit(getattr(context, xs_var)))
@@ -84,6 +96,11 @@ def step_then_xs_item_object(context, xs_var, idx, obj_var):
     assert getattr(context, xs_var)[int(idx)].object is getattr(context, obj_var)
 
 
+@then(rf"{_V}\[{_I}\] = {_V}")
+def step_then_xs_item_is(context, xs_var, idx, i_var):
+    assert getattr(context, xs_var)[int(idx)] is getattr(context, i_var)
+
+
 @then(rf"{_V} is nothing")
 def step_then_is_nothing(context, var):
     assert getattr(context, var) is None
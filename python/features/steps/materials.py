@@ -0,0 +1,150 @@
+import re
+
+import numpy as np
+import pytest
+from behave import given, then, use_step_matcher, when
+
+from rayz.color import Color
+from rayz.lighting import lighting, lighting_batch
+from rayz.material import MaterialArrays
+from rayz.math_parser import parse_math
+from rayz.tuple import Point, Vector
+
+use_step_matcher("re")
+
+_V = r"([A-Za-z][A-Za-z0-9_]*)"
+_A = r"([^\s,)]+)"
+_I = r"(\d+)"
+
+# Every property but ambient, which spheres.py already handles.
+_PROPERTIES = "diffuse|specular|shininess|reflective|transparency|refractive_index"
+
+
+def _xyzw(text: str) -> list[float]:
+    m = re.fullmatch(r"(point|vector)\((.+)\)", text.strip())
+    xyz = [parse_math(a) for a in m.group(2).split(",")]
+    return [*xyz, 1.0 if m.group(1) == "point" else 0.0]
+
+
+# ---------------------------------------------------------------------------
+# Given
+# ---------------------------------------------------------------------------
+
+
+@given(rf"{_V}\.({_PROPERTIES}) ← {_A}")
+def step_given_material_property(context, var, prop, value):
+    setattr(getattr(context, var), prop, parse_math(value))
+
+
+@given(rf"{_V}\.color ← color\({_A},\s*{_A},\s*{_A}\)")
+def step_given_material_color(context, var, r, g, b):
+    getattr(context, var).color = Color(parse_math(r), parse_math(g), parse_math(b))
+
+
+@given(rf"{_V} ← (true|false)")
+def step_given_bool(context, var, value):
+    setattr(context, var, value == "true")
+
+
+@given(rf"the following hit buffer {_V}:")
+def step_given_hit_buffer(context, var):
+    rows = context.table.rows
+    buffer = {name: np.array([_xyzw(row[name]) for row in rows]) for name in ("point", "eyev", "normalv")}
+    buffer["in_shadow"] = np.array([row["in_shadow"] == "true" for row in rows])
+    setattr(context, var, buffer)
+
+
+# ---------------------------------------------------------------------------
+# When
+# ---------------------------------------------------------------------------
+
+
+@when(rf"{_V} ← lighting\({_V},\s*{_V},\s*{_V},\s*{_V},\s*{_V}(?:,\s*{_V})?\)")
+def step_when_lighting(context, var, m, light, position, eyev, normalv, in_shadow):
+    args = [getattr(context, name) for name in (m, light, position, eyev, normalv)]
+    if in_shadow is not None:
+        args.append(getattr(context, in_shadow))
+    setattr(context, var, lighting(*args))
+
+
+@when(rf"{_V} ← lighting_batch\({_V},\s*{_V},\s*{_V}\)")
+def step_when_lighting_batch(context, var, m, light, hits):
+    buffer = getattr(context, hits)
+    setattr(
+        context,
+        var,
+        lighting_batch(
+            getattr(context, m),
+            getattr(context, light),
+            buffer["point"],
+            buffer["eyev"],
+            buffer["normalv"],
+            buffer["in_shadow"],
+        ),
+    )
+
+
+@when(rf"{_V} ← lighting_batch\(materials \[(.+)\] indexed by \[(.+)\],\s*{_V},\s*{_V}\)")
+def step_when_lighting_batch_per_hit(context, var, names, index, light, hits):
+    table = MaterialArrays.from_materials([getattr(context, n.strip()) for n in names.split(",")])
+    buffer = getattr(context, hits)
+    setattr(
+        context,
+        var,
+        lighting_batch(
+            table[np.array([int(i) for i in index.split(",")])],
+            getattr(context, light),
+            buffer["point"],
+            buffer["eyev"],
+            buffer["normalv"],
+            buffer["in_shadow"],
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Then
+# ---------------------------------------------------------------------------
+
+
+@then(rf"{_V}\.({_PROPERTIES}|ambient) = {_A}")
+def step_then_material_property(context, var, prop, value):
+    assert getattr(getattr(context, var), prop) == pytest.approx(parse_math(value))
+
+
+@then(rf"{_V}\.color = color\({_A},\s*{_A},\s*{_A}\)")
+def step_then_material_color(context, var, r, g, b):
+    assert getattr(context, var).color == Color(parse_math(r), parse_math(g), parse_math(b))
+
+
+@then(rf"the colors in {_V} are:")
+def step_then_colors_are(context, var):
+    expected = np.array([[float(row[c]) for c in ("red", "green", "blue")] for row in context.table.rows])
+    actual = getattr(context, var)
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, atol=1e-4)
+
+
+@then(rf"lighting_batch\({_V},\s*{_V}\) agrees with lighting for {_I} random hits")
+def step_then_lighting_batch_agrees(context, m, light, count):
+    material, light = getattr(context, m), getattr(context, light)
+    rng = np.random.default_rng(5)
+    n = int(count)
+    points = np.ones((n, 4))
+    points[:, :3] = rng.uniform(-2, 2, (n, 3))
+    eyevs, normals = np.zeros((n, 4)), np.zeros((n, 4))
+    for a in (eyevs, normals):
+        a[:, :3] = rng.normal(size=(n, 3))
+        a[:, :3] /= np.linalg.norm(a[:, :3], axis=1)[:, np.newaxis]
+    in_shadow = rng.random(n) < 0.2
+    colors = lighting_batch(material, light, points, eyevs, normals, in_shadow)
+    for i in range(n):
+        expected = lighting(
+            material,
+            light,
+            Point(*points[i, :3]),
+            Vector(*eyevs[i, :3]),
+            Vector(*normals[i, :3]),
+            bool(in_shadow[i]),
+        )
+        assert Color(*colors[i]) == expected, f"hit {i}: {colors[i]} != {expected}"
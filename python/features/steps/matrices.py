@@ -194,6 +194,15 @@ def step_then_inverse_table(context, var):
     assert _resolve(context, var).inverse() == expected
 
 
+@then(rf"inverse\({_V}\) raises an error")
+def step_then_inverse_raises(context, var):
+    try:
+        _resolve(context, var).inverse()
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
 @then(rf"{_V} is the following (?:\d+x\d+ )?matrix:")
 def step_then_var_is_matrix(context, var):
     expected = _matrix_from_table(context.table)
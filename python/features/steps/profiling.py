@@ -0,0 +1,113 @@
+import importlib
+import json
+import os
+import tempfile
+
+from behave import given, then, use_step_matcher, when
+
+from rayz.profiling import _HOOKS, Profiler
+from rayz.render import WorldScene, render
+
+use_step_matcher("re")
+
+_V = r"([A-Za-z][A-Za-z0-9_]*)"
+_I = r"(\d+)"
+_COUNTER = r"(rays|intersection_tests|matrix_inversions|tuple_allocations|intersection_allocations)"
+
+
+@given(rf"{_V} ← profiler\((cprofile)?\)")
+def step_profiler(context, var, cprofile):
+    setattr(context, var, Profiler(cprofile=bool(cprofile)))
+
+
+@when(rf"{_V} is started")
+def step_start(context, var):
+    getattr(context, var).start()
+
+
+@when(rf"{_V} is stopped")
+@then(rf"{_V} is stopped")
+def step_stop(context, var):
+    getattr(context, var).stop()
+
+
+@when(rf"{_V} ← render\({_V},\s*{_V}\) under {_V}")
+def step_render_profiled(context, var, camera, world, prof):
+    c = getattr(context, camera)
+    with getattr(context, prof):
+        image = render(WorldScene(getattr(context, world), c), c.hsize, c.vsize)
+    setattr(context, var, image)
+
+
+@then(rf'rendering {_V} through {_V} with backend="threads" under {_V} raises an error')
+def step_render_threads_profiled(context, world, camera, prof):
+    c = getattr(context, camera)
+    with getattr(context, prof):
+        try:
+            render(WorldScene(getattr(context, world), c), c.hsize, c.vsize, workers=2, backend="threads")
+        except ValueError:
+            return
+    raise AssertionError("expected ValueError")
+
+
+@then(rf"{_V}\.{_COUNTER} = {_I}")
+def step_counter_eq(context, var, counter, expected):
+    assert getattr(context, var).counters[counter] == int(expected), getattr(context, var).counters
+
+
+@then(rf"{_V}\.{_COUNTER} > {_I}")
+def step_counter_gt(context, var, counter, bound):
+    assert getattr(context, var).counters[counter] > int(bound), getattr(context, var).counters
+
+
+@then(rf"{_V} timed {_I} calls? of the (\w+) stage")
+def step_stage_calls(context, var, calls, stage):
+    assert getattr(context, var).stages[stage][0] == int(calls), getattr(context, var).stages
+
+
+@then(rf"{_V} timed the ((?:\w+, )*\w+) and (\w+) stages")
+def step_stages_timed(context, var, stages, last):
+    prof = getattr(context, var)
+    for stage in [*stages.split(", "), last]:
+        calls, seconds = prof.stages[stage]
+        assert calls > 0 and seconds > 0, (stage, prof.stages)
+
+
+@then(r"no profiling hooks are installed")
+def step_no_hooks(context):
+    for target in _HOOKS:
+        module_name, _, qualname = target.partition(":")
+        value = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            value = getattr(value, part)
+        assert not hasattr(value, "__wrapped__"), target
+
+
+@then(rf"starting {_V} raises an error")
+def step_start_raises(context, var):
+    try:
+        getattr(context, var).start()
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
+@then(rf"the JSON export of {_V} has {_COUNTER} = {_I}")
+def step_json_export(context, var, counter, expected):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profile.json")
+        getattr(context, var).save_json(path)
+        with open(path) as f:
+            data = json.load(f)
+    assert data["counters"][counter] == int(expected), data
+
+
+@then(rf"the pstats export of {_V} includes (\w+)")
+def step_pstats_export(context, var, name):
+    import pstats
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profile.pstats")
+        getattr(context, var).dump_stats(path)
+        stats = pstats.Stats(path)
+    assert any(func == name for (_file, _line, func) in stats.stats), sorted(stats.stats)
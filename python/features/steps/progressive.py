@@ -0,0 +1,145 @@
+import os
+import tempfile
+import threading
+
+import numpy as np
+from behave import then, use_step_matcher, when
+
+from rayz.progressive import ppm_preview, progressive_passes, render_progressive
+
+use_step_matcher("re")
+
+_V = r"([A-Za-z][A-Za-z0-9_]*)"
+_I = r"(\d+)"
+
+
+def _record_steps(context):
+    context.callback_steps = []
+
+    def callback(canvas, step):
+        context.callback_steps.append(step)
+
+    return callback
+
+
+@when(rf"{_V} ← progressive_passes\({_I},\s*{_I},\s*{_I}\)")
+def step_passes(context, var, w, h, start):
+    setattr(context, var, list(progressive_passes(int(w), int(h), int(start))))
+
+
+@when(rf"{_V} ← render_progressive\({_V},\s*{_I},\s*{_I}\)")
+def step_render_progressive(context, var, scene, w, h):
+    image = render_progressive(
+        getattr(context, scene), int(w), int(h), callback=_record_steps(context), workers=1
+    )
+    setattr(context, var, image)
+
+
+@when(rf'{_V} ← render_progressive\({_V},\s*{_I},\s*{_I},\s*workers={_I},\s*backend="(\w+)"\)')
+def step_render_progressive_backend(context, var, scene, w, h, workers, backend):
+    image = render_progressive(
+        getattr(context, scene), int(w), int(h), workers=int(workers), backend=backend, chunk_size=64
+    )
+    setattr(context, var, image)
+
+
+@when(rf"{_V} ← render_progressive\({_V},\s*{_I},\s*{_I}\) stopping after {_I} pass(?:es)?")
+def step_render_progressive_cancelled(context, var, scene, w, h, passes):
+    cancel = threading.Event()
+    record = _record_steps(context)
+
+    def callback(canvas, step):
+        record(canvas, step)
+        if len(context.callback_steps) == int(passes):
+            cancel.set()
+
+    image = render_progressive(
+        getattr(context, scene), int(w), int(h), callback=callback, cancel=cancel, workers=1
+    )
+    setattr(context, var, image)
+
+
+class _CancellingScene:
+    """Wraps a scene, setting cancel as soon as its first chunk is traced.
+
+    With 16-pixel chunks that is the whole of a 24x24 image's first pass.
+    """
+
+    def __init__(self, scene, cancel):
+        self.scene = scene
+        self.cancel = cancel
+
+    def pixels(self, cols, rows):
+        colors = self.scene.pixels(cols, rows)
+        self.cancel.set()
+        return colors
+
+
+@when(rf"{_V} ← render_progressive\({_V},\s*{_I},\s*{_I},\s*workers={_I}\) cancelled by its first chunk")
+def step_render_progressive_cancelled_in_chunk(context, var, scene, w, h, workers):
+    cancel = threading.Event()
+    image = render_progressive(
+        _CancellingScene(getattr(context, scene), cancel),
+        int(w),
+        int(h),
+        callback=_record_steps(context),
+        cancel=cancel,
+        workers=int(workers),
+        backend="threads",
+        chunk_size=16,
+    )
+    setattr(context, var, image)
+
+
+@when(rf"{_V} ← render_progressive\({_V},\s*{_I},\s*{_I}\) with a PPM preview")
+def step_render_progressive_preview(context, var, scene, w, h):
+    tmp = tempfile.TemporaryDirectory()
+    context.add_cleanup(tmp.cleanup)
+    context.preview_path = os.path.join(tmp.name, "preview.ppm")
+    image = render_progressive(
+        getattr(context, scene), int(w), int(h), callback=ppm_preview(context.preview_path), workers=1
+    )
+    setattr(context, var, image)
+
+
+@then(rf"the steps of {_V} are ((?:\d+, )*\d+)")
+def step_pass_steps(context, var, steps):
+    assert [step for step, _cols, _rows in getattr(context, var)] == [int(s) for s in steps.split(", ")]
+
+
+@then(rf"{_V} trace every pixel of a {_I}x{_I} image exactly once")
+def step_passes_cover(context, var, w, h):
+    coverage = np.zeros((int(h), int(w)), dtype=int)
+    for _step, cols, rows in getattr(context, var):
+        np.add.at(coverage, (rows, cols), 1)
+    assert (coverage == 1).all()
+
+
+@then(r"the callback saw steps ((?:\d+, )*\d+)")
+def step_callback_steps(context, steps):
+    assert context.callback_steps == [int(s) for s in steps.split(", ")], context.callback_steps
+
+
+@then(rf"{_V} has the same color in every aligned {_I}x{_I} block")
+def step_blocks(context, var, size, _size):
+    pixels = getattr(context, var).to_array()
+    size = int(size)
+    for row in range(0, pixels.shape[0], size):
+        for col in range(0, pixels.shape[1], size):
+            block = pixels[row : row + size, col : col + size]
+            assert (block == block[0, 0]).all(), (col, row)
+
+
+@then(rf"the preview file holds {_V} as binary PPM")
+def step_preview_file(context, var):
+    with open(context.preview_path, "rb") as f:
+        assert f.read() == getattr(context, var).to_ppm_binary()
+
+
+@then(rf"progressive_passes\({_I},\s*{_I},\s*{_I}\) raises an error")
+def step_passes_raise(context, w, h, start):
+    try:
+        list(progressive_passes(int(w), int(h), int(start)))
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
@@ -0,0 +1,101 @@
+import os
+import tempfile
+
+import numpy as np
+from behave import given, then, use_step_matcher, when
+
+from rayz.canvas import MappedCanvas
+from rayz.color import Color
+from rayz.math_parser import parse_math
+from rayz.render import SilhouetteScene, WorldScene, render, tiles
+
+use_step_matcher("re")
+
+_V = r"([A-Za-z][A-Za-z0-9_]*)"
+_A = r"([^\s,)]+)"
+_I = r"(\d+)"
+
+RED = Color(1, 0, 0)
+
+
+@when(rf"{_V} ← tiles\({_I},\s*{_I},\s*{_I}\)")
+def step_when_tiles(context, var, w, h, size):
+    setattr(context, var, tiles(int(w), int(h), int(size)))
+
+
+@given(rf"{_V} ← silhouette_scene\({_V},\s*{_I}\)")
+def step_given_silhouette_scene(context, var, shape_var, size):
+    setattr(context, var, SilhouetteScene(getattr(context, shape_var), int(size), RED))
+
+
+@when(rf"{_V} ← render\({_V},\s*{_I},\s*{_I},\s*workers={_I}\)")
+def step_when_render(context, var, scene_var, w, h, workers):
+    setattr(
+        context, var, render(getattr(context, scene_var), int(w), int(h), workers=int(workers), tile_size=8)
+    )
+
+
+@when(rf'{_V} ← render\({_V},\s*{_I},\s*{_I},\s*workers={_I},\s*backend="(\w+)"\)')
+def step_when_render_backend(context, var, scene_var, w, h, workers, backend):
+    scene = getattr(context, scene_var)
+    image = render(scene, int(w), int(h), workers=int(workers), tile_size=8, backend=backend)
+    setattr(context, var, image)
+
+
+@when(rf"{_V} ← render\({_V},\s*{_I},\s*{_I},\s*workers={_I}\) into a mapped canvas")
+def step_when_render_mapped(context, var, scene_var, w, h, workers):
+    tmp = tempfile.TemporaryDirectory()
+    context.add_cleanup(tmp.cleanup)
+    canvas = MappedCanvas(os.path.join(tmp.name, "image.npy"), int(w), int(h))
+    scene = getattr(context, scene_var)
+    image = render(
+        scene, int(w), int(h), workers=int(workers), tile_size=8, backend="processes", canvas=canvas
+    )
+    assert image is canvas
+    setattr(context, var, image)
+
+
+@when(rf"{_V} ← render\(world_scene\({_V},\s*{_V}\),\s*{_I},\s*{_I},\s*workers={_I}\)")
+def step_when_render_world_scene(context, var, camera, world, w, h, workers):
+    scene = WorldScene(getattr(context, world), getattr(context, camera))
+    setattr(context, var, render(scene, int(w), int(h), workers=int(workers)))
+
+
+@when(rf"the color of the (first|second) object in {_V} is set to color\({_A},\s*{_A},\s*{_A}\)")
+def step_when_object_color(context, nth, world, r, g, b):
+    obj = getattr(context, world).objects[0 if nth == "first" else 1]
+    obj.material.color = Color(parse_math(r), parse_math(g), parse_math(b))
+
+
+@when(rf"the (first|second) object in {_V} is removed")
+def step_when_object_removed(context, nth, world):
+    del getattr(context, world).objects[0 if nth == "first" else 1]
+
+
+@then(rf"render\({_V},\s*{_I},\s*{_I},\s*workers=(-?\d+)\) raises an error")
+def step_then_render_raises(context, scene_var, w, h, workers):
+    try:
+        render(getattr(context, scene_var), int(w), int(h), workers=int(workers))
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
+@then(rf"{_V} cover a {_I}x{_I} image exactly once")
+def step_then_tiles_cover(context, var, w, h):
+    coverage = np.zeros((int(h), int(w)), dtype=int)
+    for col, row, tw, th in getattr(context, var):
+        coverage[row : row + th, col : col + tw] += 1
+    assert (coverage == 1).all()
+
+
+@then(rf"pixel_at\({_V},\s*{_I},\s*{_I}\) = color\({_A},\s*{_A},\s*{_A}\)")
+def step_then_pixel_at(context, var, col, row, r, g, b):
+    expected = Color(parse_math(r), parse_math(g), parse_math(b))
+    assert getattr(context, var).pixel_at(int(col), int(row)) == expected
+
+
+@then(rf"{_V} and {_V} (do not )?have identical pixels")
+def step_then_identical_pixels(context, a, b, negate):
+    same = np.array_equal(getattr(context, a).to_array(), getattr(context, b).to_array())
+    assert same != bool(negate)
@@ -0,0 +1,78 @@
+import numpy as np
+from behave import given, then, use_step_matcher, when
+
+from rayz.profiling import Profiler
+from rayz.render import WorldScene, render
+from rayz.sampling import SupersampledScene, sample_offsets
+
+use_step_matcher("re")
+
+_V = r"([A-Za-z][A-Za-z0-9_]*)"
+_A = r"([^\s,)]+)"
+_I = r"(\d+)"
+
+
+@when(rf"{_V} ← (jittered )?sample_offsets\({_I},\s*{_I}\)")
+def step_sample_offsets(context, var, jittered, grid, count):
+    rng = np.random.default_rng(0) if jittered else None
+    setattr(context, var, sample_offsets(int(grid), int(count), rng))
+
+
+@given(rf"{_V} ← world_scene\({_V},\s*{_V}\)")
+def step_world_scene(context, var, camera, world):
+    setattr(context, var, WorldScene(getattr(context, world), getattr(context, camera)))
+
+
+@given(rf"{_V} ← supersampled\({_V},\s*{_I}(?:,\s*(jittered))?(?:,\s*threshold={_A})?\)")
+def step_supersampled(context, var, scene, grid, jittered, threshold):
+    threshold = float(threshold) if threshold is not None else None
+    setattr(
+        context,
+        var,
+        SupersampledScene(getattr(context, scene), int(grid), jitter=bool(jittered), threshold=threshold),
+    )
+
+
+@when(rf"{_V} ← render\({_V},\s*{_I},\s*{_I}\) counting rays as {_V}")
+def step_render_counting(context, var, scene, w, h, rays):
+    with Profiler() as prof:
+        image = render(getattr(context, scene), int(w), int(h), workers=1, tile_size=8)
+    setattr(context, var, image)
+    setattr(context, rays, prof.counters["rays"])
+
+
+@then(rf"the offsets of pixel {_I} in {_V} are:")
+def step_offsets_are(context, pixel, var):
+    expected = [[float(row["x"]), float(row["y"])] for row in context.table]
+    assert np.allclose(getattr(context, var)[int(pixel)], expected)
+
+
+@then(rf"every sample in {_V} lies inside cell {_I}x{_I}")
+def step_samples_in_cells(context, var, grid, _grid):
+    offsets = getattr(context, var)
+    grid = int(grid)
+    cells = np.arange(grid * grid)
+    lo = np.stack([cells % grid, cells // grid], axis=-1) / grid
+    assert ((offsets >= lo) & (offsets < lo + 1.0 / grid)).all()
+    # Different pixels get different samples.
+    assert not np.allclose(offsets[0], offsets[1])
+
+
+@then(rf"some pixels of {_V} are partly red")
+def step_partly_red(context, var):
+    red = getattr(context, var).to_array()[..., 0]
+    assert ((red > 0) & (red < 1)).any()
+
+
+@then(rf"{_V} is less than a third of {_V}")
+def step_less_than_third(context, a, b):
+    assert 3 * getattr(context, a) < getattr(context, b), (getattr(context, a), getattr(context, b))
+
+
+@then(rf"supersampled\({_V},\s*{_I}\) raises an error")
+def step_supersampled_raises(context, scene, grid):
+    try:
+        SupersampledScene(getattr(context, scene), int(grid))
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
@@ -1,5 +1,6 @@
 import re
 
+import numpy as np
 import pytest
 from behave import given, then, use_step_matcher, when
 
@@ -80,6 +81,21 @@ def step_given_ray(context, var, ox, oy, oz, dx, dy, dz):
     )
 
 
+@given(rf"the following ray batch {_V}:")
+def step_given_ray_batch(context, var):
+    # Behave treats the first table row as headings (ox | oy | oz | dx | dy | dz).
+    rows = [[parse_math(cell) for cell in row.cells] for row in context.table.rows]
+    origins = np.array([[ox, oy, oz, 1.0] for ox, oy, oz, _dx, _dy, _dz in rows])
+    directions = np.array([[dx, dy, dz, 0.0] for _ox, _oy, _oz, dx, dy, dz in rows])
+    setattr(context, var, (origins, directions))
+
+
+@given(rf"the following point batch {_V}:")
+def step_given_point_batch(context, var):
+    rows = [[parse_math(cell) for cell in row.cells] for row in context.table.rows]
+    setattr(context, var, np.array([[x, y, z, 1.0] for x, y, z in rows]))
+
+
 # Chained matrix: m ← expr1 * expr2
 @given(r"([A-Za-z][A-Za-z0-9_]*) ← (.+) \* (.+)")
 def step_given_matrix_mul_expr(context, var, expr1, expr2):
@@ -110,6 +126,23 @@ def step_when_intersect(context, shape_var, ray_var):
     context.xs = intersect(getattr(context, shape_var), getattr(context, ray_var))
 
 
+@when(rf"{_V} ← intersect_rays\({_V},\s*{_V}\)")
+def step_when_intersect_rays(context, var, shape_var, batch_var):
+    origins, directions = getattr(context, batch_var)
+    setattr(context, var, getattr(context, shape_var).intersect_rays(origins, directions))
+
+
+@when(rf"{_V} ← any_hits\({_V},\s*{_V},\s*{_A}\)")
+def step_when_any_hits(context, var, shape_var, batch_var, max_t):
+    origins, directions = getattr(context, batch_var)
+    setattr(context, var, getattr(context, shape_var).any_hits(origins, directions, parse_math(max_t)))
+
+
+@when(rf"{_V} ← normals_at\({_V},\s*{_V}\)")
+def step_when_normals_at(context, var, shape_var, batch_var):
+    setattr(context, var, getattr(context, shape_var).normals_at(getattr(context, batch_var)))
+
+
 @when(rf"set_transform\({_V},\s*(.+)\)")
 def step_when_set_transform(context, var, expr):
     getattr(context, var).set_transform(_eval_transform(context, expr))
@@ -135,6 +168,15 @@ def step_when_set_material(context, shape_var, mat_var):
 # ---------------------------------------------------------------------------
 
 
+@then(rf"set_transform\({_V},\s*(.+)\) raises an error")
+def step_then_set_transform_raises(context, var, expr):
+    try:
+        getattr(context, var).set_transform(_eval_transform(context, expr))
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
 @then(rf"{_V}\.transform = identity_matrix")
 def step_then_transform_is_identity(context, var):
     assert getattr(context, var).transform == IDENTITY_MATRIX
@@ -145,6 +187,29 @@ def step_then_transform_eq_var(context, shape_var, mat_var):
     assert getattr(context, shape_var).transform == getattr(context, mat_var)
 
 
+@then(rf"{_V} are:")
+def step_then_batch_hits(context, var):
+    t0, t1, mask = getattr(context, var)
+    assert len(mask) == len(context.table.rows)
+    for i, row in enumerate(context.table.rows):
+        expected_hit = row["hit"] == "true"
+        assert bool(mask[i]) == expected_hit, f"ray {i}: hit={mask[i]}"
+        if expected_hit:
+            assert t0[i] == pytest.approx(parse_math(row["t0"]), abs=1e-5)
+            assert t1[i] == pytest.approx(parse_math(row["t1"]), abs=1e-5)
+
+
+@then(rf"{_V}\.transform_inverse = inverse\({_V}\)")
+def step_then_transform_inverse(context, shape_var, mat_var):
+    assert getattr(context, shape_var).transform_inverse == getattr(context, mat_var).inverse()
+
+
+@then(rf"{_V}\.transform_inverse_transpose = transpose\(inverse\({_V}\)\)")
+def step_then_transform_inverse_transpose(context, shape_var, mat_var):
+    expected = getattr(context, mat_var).inverse().transpose()
+    assert getattr(context, shape_var).transform_inverse_transpose == expected
+
+
 @then(rf"xs\.count = {_I}")
 def step_then_xs_count(context, n):
     assert len(context.xs) == int(n)
@@ -195,3 +260,34 @@ def step_then_material_transparency(context, var, val):
 @then(rf"{_V}\.material\.refractive_index = {_A}")
 def step_then_material_refractive_index(context, var, val):
     assert getattr(context, var).material.refractive_index == pytest.approx(parse_math(val), abs=1e-5)
+
+
+@then(rf"the normals in {_V} are:")
+def step_then_normals_are(context, var):
+    expected = np.array([[parse_math(cell) for cell in row.cells] + [0.0] for row in context.table.rows])
+    np.testing.assert_allclose(getattr(context, var), expected, atol=1e-5)
+
+
+@then(rf"normals_at\({_V}\) agrees with normal_at for {_I} random points on {_V}")
+def step_then_normals_at_agrees(context, var, count, _same):
+    s = getattr(context, var)
+    rng = np.random.default_rng(3)
+    obj = np.zeros((int(count), 4))
+    obj[:, :3] = rng.normal(size=(int(count), 3))
+    obj[:, :3] /= np.linalg.norm(obj[:, :3], axis=1)[:, np.newaxis]
+    obj[:, 3] = 1.0
+    points = obj @ s.transform.to_array().T
+    normals = s.normals_at(points)
+    for p, n in zip(points.tolist(), normals.tolist()):
+        assert Vector(*n[:3]) == s.normal_at(Point(*p[:3]))
+
+
+@then(rf"any_hit\({_V},\s*{_V},\s*{_A}\) is (true|false)")
+def step_then_any_hit(context, var, ray_var, max_t, expected):
+    assert getattr(context, var).any_hit(getattr(context, ray_var), parse_math(max_t)) == (expected == "true")
+
+
+@then(rf"{_V} is ((?:true|false)(?:,\s*(?:true|false))*)")
+def step_then_bool_array(context, var, values):
+    expected = [v.strip() == "true" for v in values.split(",")]
+    assert getattr(context, var).tolist() == expected
@@ -0,0 +1,123 @@
+import re
+
+import numpy as np
+import pytest
+from behave import given, then, use_step_matcher
+
+from rayz.math_parser import parse_math
+from rayz.tuple import Point, Tuple, Vector
+from rayz.tuple_array import TupleArray
+
+use_step_matcher("re")
+
+_A = r"([^\s,)]+)"
+_V = r"([a-z][a-z0-9_]*)"
+
+_CONSTRUCTORS = {"point": Point, "vector": Vector, "tuple": Tuple}
+
+
+def _eval_tuple(context, expr: str) -> Tuple:
+    """Evaluate a variable name or an inline point(...)/vector(...)/tuple(...) call."""
+    m = re.fullmatch(r"(point|vector|tuple)\((.+)\)", expr.strip())
+    if m:
+        return _CONSTRUCTORS[m.group(1)](*(parse_math(a.strip()) for a in m.group(2).split(",")))
+    return getattr(context, expr.strip())
+
+
+def _tuple_array(context, args: str) -> TupleArray:
+    items = re.findall(r"(?:point|vector|tuple)\([^)]*\)|[a-z][a-z0-9_]*", args)
+    return TupleArray.from_tuples(_eval_tuple(context, item) for item in items)
+
+
+def _numbers(text: str) -> list[float]:
+    return [parse_math(v.strip()) for v in text.split(",")]
+
+
+# ---------------------------------------------------------------------------
+# Construction
+# ---------------------------------------------------------------------------
+
+
+@given(rf"{_V} ← tuple_array\((.+)\)")
+def step_given_tuple_array(context, var, args):
+    setattr(context, var, _tuple_array(context, args))
+
+
+# ---------------------------------------------------------------------------
+# Element access and conversion
+# ---------------------------------------------------------------------------
+
+
+@then(rf"{_V}\[(\d+)\] = ((?:point|vector|tuple)\(.+\))")
+def step_then_element(context, var, idx, expr):
+    expected = _eval_tuple(context, expr)
+    actual = getattr(context, var)[int(idx)]
+    assert actual == expected, f"{actual!r} != {expected!r}"
+
+
+@then(rf"tuples of {_V} are ([a-z, ]+)")
+def step_then_tuple_types(context, var, kinds):
+    actual = [type(t) for t in getattr(context, var).to_tuples()]
+    assert actual == [_CONSTRUCTORS[k.strip()] for k in kinds.split(",")]
+
+
+# ---------------------------------------------------------------------------
+# Operations
+# ---------------------------------------------------------------------------
+
+
+@then(rf"{_V} \+ {_V} = tuple_array\((.+)\)")
+def step_then_add(context, a, b, args):
+    assert getattr(context, a) + getattr(context, b) == _tuple_array(context, args)
+
+
+@then(rf"{_V} - {_V} = tuple_array\((.+)\)")
+def step_then_sub(context, a, b, args):
+    assert getattr(context, a) - getattr(context, b) == _tuple_array(context, args)
+
+
+@then(rf"-{_V} = tuple_array\((.+)\)")
+def step_then_neg(context, a, args):
+    assert -getattr(context, a) == _tuple_array(context, args)
+
+
+@then(rf"{_V} \* {_A} = tuple_array\((.+)\)")
+def step_then_scale(context, a, scalar, args):
+    assert getattr(context, a) * parse_math(scalar) == _tuple_array(context, args)
+
+
+@then(rf"{_V} / {_A} = tuple_array\((.+)\)")
+def step_then_divide(context, a, scalar, args):
+    assert getattr(context, a) / parse_math(scalar) == _tuple_array(context, args)
+
+
+@then(rf"magnitude\({_V}\) = \[(.+)\]")
+def step_then_magnitude(context, a, values):
+    assert getattr(context, a).magnitude().tolist() == pytest.approx(_numbers(values), abs=1e-5)
+
+
+@then(rf"normalize\({_V}\) = tuple_array\((.+)\)")
+def step_then_normalize(context, a, args):
+    assert getattr(context, a).normalize() == _tuple_array(context, args)
+
+
+@then(rf"dot\({_V},\s*{_V}\) = \[(.+)\]")
+def step_then_dot(context, a, b, values):
+    result = getattr(context, a).dot(getattr(context, b))
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == pytest.approx(_numbers(values), abs=1e-5)
+
+
+@then(rf"cross\({_V},\s*{_V}\) = tuple_array\((.+)\)")
+def step_then_cross(context, a, b, args):
+    assert getattr(context, a).cross(getattr(context, b)) == _tuple_array(context, args)
+
+
+@then(rf"reflect\({_V},\s*{_V}\) = tuple_array\((.+)\)")
+def step_then_reflect(context, a, b, args):
+    assert getattr(context, a).reflect(getattr(context, b)) == _tuple_array(context, args)
+
+
+@then(rf"{_V} = tuple_array\((.+)\)")
+def step_then_eq(context, a, args):
+    assert getattr(context, a) == _tuple_array(context, args)
@@ -0,0 +1,202 @@
+import re
+
+import numpy as np
+import pytest
+from behave import given, then, use_step_matcher, when
+
+from rayz.color import Color
+from rayz.intersection import hit
+from rayz.light import PointLight
+from rayz.math_parser import parse_math
+from rayz.ray import Ray
+from rayz.sphere import Sphere
+from rayz.transformations import scaling, translation
+from rayz.tuple import Point, Vector
+from rayz.world import World, default_world
+
+use_step_matcher("re")
+
+_V = r"([A-Za-z][A-Za-z0-9_]*)"
+_A = r"([^\s,)]+)"
+_I = r"(\d+)"
+
+_TRANSFORM_FUNCS = {"scaling": scaling, "translation": translation}
+
+
+def _args(text: str) -> list[float]:
+    return [parse_math(a.strip()) for a in text.split(",")]
+
+
+def _same_sphere(a: Sphere, b: Sphere) -> bool:
+    return a.transform == b.transform and a.material == b.material
+
+
+# ---------------------------------------------------------------------------
+# Lights
+# ---------------------------------------------------------------------------
+
+
+@when(rf"{_V} ← point_light\({_V},\s*{_V}\)")
+def step_when_point_light_vars(context, var, position, intensity):
+    setattr(context, var, PointLight(getattr(context, position), getattr(context, intensity)))
+
+
+@given(rf"{_V} ← point_light\(point\((.+?)\),\s*color\((.+?)\)\)")
+def step_given_point_light(context, var, position, intensity):
+    setattr(context, var, PointLight(Point(*_args(position)), Color(*_args(intensity))))
+
+
+@then(rf"{_V}\.(position|intensity) = {_V}")
+def step_then_light_attr(context, var, attr, expected):
+    assert getattr(getattr(context, var), attr) == getattr(context, expected)
+
+
+# ---------------------------------------------------------------------------
+# World construction
+# ---------------------------------------------------------------------------
+
+
+@given(rf"{_V} ← world\(\)")
+def step_given_world(context, var):
+    setattr(context, var, World())
+
+
+@given(rf"{_V} ← default_world\(\)")
+@when(rf"{_V} ← default_world\(\)")
+def step_default_world(context, var):
+    setattr(context, var, default_world())
+
+
+@given(rf"{_V} ← sphere\(\) with:")
+def step_given_sphere_with(context, var):
+    s = Sphere()
+    # Behave treats the first table row as headings, so include it as a data row.
+    rows = [context.table.headings] + [row.cells for row in context.table.rows]
+    for key, value in rows:
+        if key == "transform":
+            m = re.fullmatch(r"(\w+)\((.+)\)", value.strip())
+            s.set_transform(_TRANSFORM_FUNCS[m.group(1)](*_args(m.group(2))))
+        elif key == "material.color":
+            s.material.color = Color(*_args(value.strip("() ")))
+        else:
+            setattr(s.material, key.removeprefix("material."), parse_math(value))
+    setattr(context, var, s)
+
+
+@given(rf"a third sphere at translation\((.+)\) scaled by {_A} is added to {_V}")
+def step_given_third_sphere(context, offset, scale, var):
+    s = Sphere()
+    k = parse_math(scale)
+    s.set_transform(translation(*_args(offset)) * scaling(k, k, k))
+    getattr(context, var).objects.append(s)
+
+
+# ---------------------------------------------------------------------------
+# Intersections
+# ---------------------------------------------------------------------------
+
+
+@when(rf"{_V} ← intersect_world\({_V},\s*{_V}\)")
+def step_when_intersect_world(context, var, w, r):
+    setattr(context, var, getattr(context, w).intersect(getattr(context, r)))
+
+
+@when(rf"{_V} ← nearest_hit\({_V},\s*{_V}\)")
+def step_when_nearest_hit(context, var, w, r):
+    setattr(context, var, getattr(context, w).nearest_hit(getattr(context, r)))
+
+
+# ---------------------------------------------------------------------------
+# Then
+# ---------------------------------------------------------------------------
+
+
+@then(rf"{_V} contains no objects")
+def step_then_no_objects(context, var):
+    assert getattr(context, var).objects == []
+
+
+@then(rf"{_V} has no light source")
+def step_then_no_light(context, var):
+    assert getattr(context, var).light is None
+
+
+@then(rf"{_V}\.light = {_V}")
+def step_then_world_light(context, var, light):
+    assert getattr(context, var).light == getattr(context, light)
+
+
+@then(rf"{_V} contains {_V}")
+def step_then_world_contains(context, var, obj):
+    assert any(_same_sphere(o, getattr(context, obj)) for o in getattr(context, var).objects)
+
+
+@then(rf"{_V} is object {_I} at t = {_A}")
+def step_then_nearest_is(context, var, index, t):
+    actual_index, actual_t = getattr(context, var)
+    assert actual_index == int(index)
+    assert actual_t == pytest.approx(parse_math(t), abs=1e-5)
+
+
+@then(rf"{_V} is a miss")
+def step_then_nearest_is_miss(context, var):
+    assert getattr(context, var) == (-1, float("inf"))
+
+
+@then(rf"nearest_hits\({_V}\) for a {_I}x{_I} fan of rays from point\((.+)\) agrees with intersect_world")
+def step_then_nearest_hits_agree(context, var, nx, ny, origin):
+    w = getattr(context, var)
+    origin = Point(*_args(origin))
+    rays = [
+        Ray(origin, (Point(x, y, 0) - origin).normalize())
+        for y in np.linspace(-1.5, 1.5, int(ny))
+        for x in np.linspace(-1.5, 1.5, int(nx))
+    ]
+    origins = np.array([[r.origin.x, r.origin.y, r.origin.z, 1.0] for r in rays])
+    directions = np.array([[r.direction.x, r.direction.y, r.direction.z, 0.0] for r in rays])
+    index, t = w.nearest_hits(origins, directions)
+    for i, r in enumerate(rays):
+        expected = hit(w.intersect(r))
+        if expected is None:
+            assert index[i] == -1 and t[i] == float("inf")
+        else:
+            assert w.objects[index[i]] is expected.object
+            assert t[i] == pytest.approx(expected.t, abs=1e-9)
+
+
+@then(
+    rf"normals_at\({_V}\) at the nearest hits of a {_I}x{_I} fan of rays from point\((.+)\)"
+    r" agree with normal_at"
+)
+def step_then_world_normals_agree(context, var, nx, ny, origin):
+    w = getattr(context, var)
+    origin = np.array([*_args(origin), 1.0])
+    xs, ys = np.meshgrid(np.linspace(-1.5, 1.5, int(nx)), np.linspace(-1.5, 1.5, int(ny)))
+    directions = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size), np.zeros(xs.size)], axis=1)
+    directions -= origin * [1, 1, 1, 0]
+    directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+    origins = np.broadcast_to(origin, directions.shape)
+    index, t = w.nearest_hits(origins, directions)
+    hits = index >= 0
+    assert hits.any()
+    points = origins[hits] + directions[hits] * t[hits, np.newaxis]
+    normals = w.normals_at(index[hits], points)
+    for i, p, n in zip(index[hits].tolist(), points.tolist(), normals.tolist()):
+        assert Vector(*n[:3]) == w.objects[i].normal_at(Point(*p[:3]))
+
+
+@then(rf"is_shadowed\({_V},\s*{_V}\) is (true|false)")
+def step_then_is_shadowed(context, var, point, expected):
+    assert getattr(context, var).is_shadowed(getattr(context, point)) == (expected == "true")
+
+
+@then(rf"shadowed\({_V}\) for a {_I}x{_I}x{_I} grid of points agrees with is_shadowed")
+def step_then_shadowed_agrees(context, var, nx, ny, nz):
+    w = getattr(context, var)
+    axes = [np.linspace(-3, 3, int(k)) for k in (nx, ny, nz)]
+    grid = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+    points = np.hstack([grid, np.ones((len(grid), 1))])
+    shadowed = w.shadowed(points)
+    assert shadowed.any() and not shadowed.all()
+    for p, s in zip(grid.tolist(), shadowed.tolist()):
+        assert s == w.is_shadowed(Point(*p))
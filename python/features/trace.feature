@@ -0,0 +1,69 @@
+Feature: Tracing with reflection and refraction
+
+Scenario: The color when a ray misses
+  Given w ← default_world()
+    And r ← ray(point(0, 0, -5), vector(0, 1, 0))
+  When c ← color_at(w, r)
+  Then c = color(0, 0, 0)
+
+Scenario: The color when a ray hits
+  Given w ← default_world()
+    And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+  When c ← color_at(w, r)
+  Then c = color(0.38066, 0.47583, 0.2855)
+
+Scenario: The color with an intersection behind the ray
+  Given w ← default_world()
+    And outer ← the first object in w
+    And outer.material.ambient ← 1
+    And inner ← the second object in w
+    And inner.material.ambient ← 1
+    And r ← ray(point(0, 0, 0.75), vector(0, 0, -1))
+  When c ← color_at(w, r)
+  Then c = inner.material.color
+
+Scenario: The color of a hit in shadow
+  Given w ← world()
+    And w.light ← point_light(point(0, 0, -10), color(1, 1, 1))
+    And a sphere at translation(0, 0, 0) scaled by 1 is added to w
+    And a sphere at translation(0, 0, 10) scaled by 1 is added to w
+    And r ← ray(point(0, 0, 5), vector(0, 0, 1))
+  When c ← color_at(w, r)
+  Then c = color(0.1, 0.1, 0.1)
+
+Scenario: The Schlick approximation under total internal reflection
+  Given shape ← glass_sphere()
+    And r ← ray(point(0, 0, √2/2), vector(0, 1, 0))
+  When reflectance ← schlick at the hit of r on shape
+  Then reflectance = 1.0
+
+Scenario: The Schlick approximation with a perpendicular viewing angle
+  Given shape ← glass_sphere()
+    And r ← ray(point(0, 0, 0), vector(0, 1, 0))
+  When reflectance ← schlick at the hit of r on shape
+  Then reflectance = 0.04
+
+Scenario: The Schlick approximation with small angle and n2 > n1
+  Given shape ← glass_sphere()
+    And r ← ray(point(0.99, 0, -2), vector(0, 0, 1))
+  When reflectance ← schlick at the hit of r on shape
+  Then reflectance = 0.48873
+
+Scenario: A mirror sphere reflects its surroundings
+  Given w ← default_world()
+    And a mirror sphere at translation(1.5, 0, 1) scaled by 0.5 is added to w
+    And r ← ray(point(1.15, 0, -5), vector(0, 0, 1))
+  When c ← color_at(w, r)
+    And surface ← color_at(w, r) with no bounces
+  Then c is brighter than surface
+
+Scenario: The wavefront tracer agrees with recursive tracing
+  Given w ← default_world()
+    And a mirror sphere at translation(1.5, 0, 1) scaled by 0.5 is added to w
+    And a glass sphere at translation(-1.2, 0.5, -1.5) scaled by 0.6 is added to w
+  Then trace_rays(w) for a 21x21 fan of rays from point(0.5, 0, -5) agrees with recursive tracing to depth 4
+
+Scenario: Rays whose throughput falls below the cutoff are retired
+  Given w ← default_world()
+    And a mirror sphere at translation(1.5, 0, 1) scaled by 0.5 is added to w
+  Then trace_rays(w) for a 21x21 fan of rays from point(1.15, 0, -5) with min_throughput 0.9 equals tracing with no bounces
@@ -0,0 +1,65 @@
+Feature: Tuple arrays
+
+Scenario: Building a tuple array from tuples
+  Given p ← point(1, 2, 3)
+    And v ← vector(4, 5, 6)
+    And t ← tuple(1, 2, 3, 0.5)
+    And ta ← tuple_array(p, v, t)
+  Then ta.count = 3
+    And ta[0] = point(1, 2, 3)
+    And ta[1] = vector(4, 5, 6)
+    And ta[2] = tuple(1, 2, 3, 0.5)
+    And tuples of ta are point, vector, tuple
+
+Scenario: Adding and subtracting tuple arrays
+  Given p1 ← point(3, -2, 5)
+    And p2 ← point(1, 1, 1)
+    And v1 ← vector(-2, 3, 1)
+    And v2 ← vector(0, 0, 1)
+    And ta ← tuple_array(p1, p2)
+    And tb ← tuple_array(v1, v2)
+  Then ta + tb = tuple_array(point(1, 1, 6), point(1, 1, 2))
+    And ta - tb = tuple_array(point(5, -5, 4), point(1, 1, 0))
+
+Scenario: Negating and scaling a tuple array
+  Given a ← tuple(1, -2, 3, -4)
+    And b ← tuple(0, 1, 0, 0)
+    And ta ← tuple_array(a, b)
+  Then -ta = tuple_array(tuple(-1, 2, -3, 4), tuple(0, -1, 0, 0))
+    And ta * 3.5 = tuple_array(tuple(3.5, -7, 10.5, -14), tuple(0, 3.5, 0, 0))
+    And ta / 2 = tuple_array(tuple(0.5, -1, 1.5, -2), tuple(0, 0.5, 0, 0))
+
+Scenario: Magnitude and normalization of a tuple array
+  Given v1 ← vector(4, 0, 0)
+    And v2 ← vector(1, 2, 3)
+    And ta ← tuple_array(v1, v2)
+  Then magnitude(ta) = [4, √14]
+    And normalize(ta) = tuple_array(vector(1, 0, 0), vector(0.26726, 0.53452, 0.80178))
+
+Scenario: Dot and cross products of tuple arrays
+  Given a1 ← vector(1, 2, 3)
+    And a2 ← vector(1, 0, 0)
+    And b1 ← vector(2, 3, 4)
+    And b2 ← vector(0, 1, 0)
+    And ta ← tuple_array(a1, a2)
+    And tb ← tuple_array(b1, b2)
+  Then dot(ta, tb) = [20, 0]
+    And cross(ta, tb) = tuple_array(vector(-1, 2, -1), vector(0, 0, 1))
+    And cross(tb, ta) = tuple_array(vector(1, -2, 1), vector(0, 0, -1))
+
+Scenario: Reflecting a tuple array of vectors
+  Given v1 ← vector(1, -1, 0)
+    And v2 ← vector(0, -1, 0)
+    And n1 ← vector(0, 1, 0)
+    And n2 ← vector(√2/2, √2/2, 0)
+    And ta ← tuple_array(v1, v2)
+    And tn ← tuple_array(n1, n2)
+  Then reflect(ta, tn) = tuple_array(vector(1, 1, 0), vector(1, 0, 0))
+
+Scenario: Multiplying a matrix by a tuple array
+  Given transform ← translation(5, -3, 2)
+    And p ← point(-3, 4, 5)
+    And v ← vector(-3, 4, 5)
+    And ta ← tuple_array(p, v)
+  When tb ← transform * ta
+  Then tb = tuple_array(point(2, 1, 7), vector(-3, 4, 5))
@@ -0,0 +1,89 @@
+Feature: World
+
+Scenario: A point light has a position and intensity
+  Given intensity ← color(1, 1, 1)
+    And position ← point(0, 0, 0)
+  When light ← point_light(position, intensity)
+  Then light.position = position
+    And light.intensity = intensity
+
+Scenario: Creating a world
+  Given w ← world()
+  Then w contains no objects
+    And w has no light source
+
+Scenario: The default world
+  Given light ← point_light(point(-10, 10, -10), color(1, 1, 1))
+    And s1 ← sphere() with:
+      | material.color     | (0.8, 1.0, 0.6)        |
+      | material.diffuse   | 0.7                    |
+      | material.specular  | 0.2                    |
+    And s2 ← sphere() with:
+      | transform | scaling(0.5, 0.5, 0.5) |
+  When w ← default_world()
+  Then w.light = light
+    And w contains s1
+    And w contains s2
+
+Scenario: Intersect a world with a ray
+  Given w ← default_world()
+    And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+  When xs ← intersect_world(w, r)
+  Then xs.count = 4
+    And xs[0].t = 4
+    And xs[1].t = 4.5
+    And xs[2].t = 5.5
+    And xs[3].t = 6
+
+Scenario: The nearest hit in a world
+  Given w ← default_world()
+    And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+  When nearest ← nearest_hit(w, r)
+  Then nearest is object 0 at t = 4
+
+Scenario: The nearest hit from inside a world's objects
+  Given w ← default_world()
+    And r ← ray(point(0, 0, 0), vector(0, 0, 1))
+  When nearest ← nearest_hit(w, r)
+  Then nearest is object 1 at t = 0.5
+
+Scenario: The nearest hit when a ray misses every object
+  Given w ← default_world()
+    And r ← ray(point(0, 0, -5), vector(0, 1, 0))
+  When nearest ← nearest_hit(w, r)
+  Then nearest is a miss
+
+Scenario: Batched nearest hits agree with intersect_world
+  Given w ← default_world()
+    And a third sphere at translation(0.5, 0.5, -2) scaled by 0.4 is added to w
+  Then nearest_hits(w) for a 15x15 fan of rays from point(0, 0, -5) agrees with intersect_world
+
+Scenario: There is no shadow when nothing is collinear with point and light
+  Given w ← default_world()
+    And p ← point(0, 10, 0)
+   Then is_shadowed(w, p) is false
+
+Scenario: The shadow when an object is between the point and the light
+  Given w ← default_world()
+    And p ← point(10, -10, 10)
+   Then is_shadowed(w, p) is true
+
+Scenario: There is no shadow when an object is behind the light
+  Given w ← default_world()
+    And p ← point(-20, 20, -20)
+   Then is_shadowed(w, p) is false
+
+Scenario: There is no shadow when an object is behind the point
+  Given w ← default_world()
+    And p ← point(-2, 2, -2)
+   Then is_shadowed(w, p) is false
+
+Scenario: Batched shadow tests agree with is_shadowed
+  Given w ← default_world()
+    And a third sphere at translation(0.5, 0.5, -2) scaled by 0.4 is added to w
+  Then shadowed(w) for a 9x9x9 grid of points agrees with is_shadowed
+
+Scenario: Normals for a buffer of hits on different objects
+  Given w ← default_world()
+    And a third sphere at translation(0.5, 0.5, -2) scaled by 0.4 is added to w
+  Then normals_at(w) at the nearest hits of a 15x15 fan of rays from point(0, 0, -5) agree with normal_at
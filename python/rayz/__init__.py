@@ -1,32 +1,57 @@
 # rayz - a ray tracer based on "The Ray Tracer Challenge" by Jamis Buck
-from rayz.canvas import Canvas
+from rayz.bounds import BoundingBox
+from rayz.bvh import BVH
+from rayz.camera import Camera
+from rayz.canvas import Canvas, MappedCanvas
 from rayz.color import Color
 from rayz.constants import EPSILON
 from rayz.environment import Environment
-from rayz.intersection import Intersection, hit, intersect, intersections
-from rayz.material import Material
+from rayz.intersection import Intersection, IntersectionList, hit, intersect, intersections
+from rayz.light import PointLight
+from rayz.lighting import lighting, lighting_batch
+from rayz.material import Material, MaterialArrays
 from rayz.matrix import Matrix
+from rayz.profiling import Profiler
 from rayz.projectile import Projectile
 from rayz.ray import Ray
 from rayz.sphere import Sphere, glass_sphere
+from rayz.trace import color_at, schlick, trace_rays
 from rayz.tuple import Point, Tuple, Vector
+from rayz.tuple_array import TupleArray
+from rayz.world import World, default_world
 
 __all__ = [
+    "BVH",
+    "BoundingBox",
+    "Camera",
     "Canvas",
     "Color",
     "EPSILON",
     "Environment",
     "Intersection",
+    "IntersectionList",
+    "MappedCanvas",
     "Material",
+    "MaterialArrays",
     "Matrix",
     "Point",
+    "PointLight",
+    "Profiler",
     "Projectile",
     "Ray",
     "Sphere",
     "Tuple",
+    "TupleArray",
     "Vector",
+    "World",
+    "color_at",
+    "default_world",
     "glass_sphere",
     "hit",
     "intersect",
     "intersections",
+    "lighting",
+    "lighting_batch",
+    "schlick",
+    "trace_rays",
 ]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from rayz.matrix import Matrix
+from rayz.tuple import Point
+
+
+class BoundingBox:
+    """An axis-aligned bounding box. A box built with no arguments is empty
+    (min at +inf, max at -inf) and grows as points and boxes are added."""
+
+    __slots__ = ("min", "max")
+
+    def __init__(self, minimum: Point | None = None, maximum: Point | None = None) -> None:
+        self.min = minimum if minimum is not None else Point(math.inf, math.inf, math.inf)
+        self.max = maximum if maximum is not None else Point(-math.inf, -math.inf, -math.inf)
+
+    def add_point(self, p: Point) -> None:
+        self.min = Point(min(self.min.x, p.x), min(self.min.y, p.y), min(self.min.z, p.z))
+        self.max = Point(max(self.max.x, p.x), max(self.max.y, p.y), max(self.max.z, p.z))
+
+    def add_box(self, other: BoundingBox) -> None:
+        self.add_point(other.min)
+        self.add_point(other.max)
+
+    def contains_point(self, p: Point) -> bool:
+        return (
+            self.min.x <= p.x <= self.max.x
+            and self.min.y <= p.y <= self.max.y
+            and self.min.z <= p.z <= self.max.z
+        )
+
+    def contains_box(self, other: BoundingBox) -> bool:
+        return self.contains_point(other.min) and self.contains_point(other.max)
+
+    def transform(self, m: Matrix) -> BoundingBox:
+        """The axis-aligned box enclosing all eight transformed corners."""
+        box = BoundingBox()
+        for x in (self.min.x, self.max.x):
+            for y in (self.min.y, self.max.y):
+                for z in (self.min.z, self.max.z):
+                    box.add_point(m * Point(x, y, z))
+        return box
+
+    def intersects(self, ray) -> bool:
+        """Slab test: True if the ray's line passes through the box."""
+        t_near, t_far = _slabs(
+            (ray.origin.x, ray.origin.y, ray.origin.z),
+            (ray.direction.x, ray.direction.y, ray.direction.z),
+            (self.min.x, self.min.y, self.min.z),
+            (self.max.x, self.max.y, self.max.z),
+        )
+        return t_near <= t_far
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BoundingBox):
+            return NotImplemented
+        return self.min == other.min and self.max == other.max
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BoundingBox(min={self.min!r}, max={self.max!r})"
+
+
+def _slabs(origin, direction, lo, hi) -> tuple[float, float]:
+    # (t_near, t_far) of a line against the box given as xyz triples. A
+    # direction component of zero means the line is parallel to that slab,
+    # so it is either inside it for every t or for none.
+    t_near, t_far = -math.inf, math.inf
+    for o, d, a, b in zip(origin, direction, lo, hi):
+        if d == 0:
+            if o < a or o > b:
+                return math.inf, -math.inf
+            continue
+        t0 = (a - o) / d
+        t1 = (b - o) / d
+        if t0 > t1:
+            t0, t1 = t1, t0
+        if t0 > t_near:
+            t_near = t0
+        if t1 < t_far:
+            t_far = t1
+    return t_near, t_far
+
+
+def sphere_bounds(transforms: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """World-space boxes of unit spheres under a (K, 4, 4) stack of transforms.
+
+    Returns (K, 3) min and max arrays. Along each axis the transformed
+    sphere extends from its centre by the length of the matching row of the
+    3x3 linear part, which is tighter than transforming the corners of the
+    object-space cube.
+    """
+    centre = transforms[:, :3, 3]
+    half = np.sqrt(np.einsum("kij,kij->ki", transforms[:, :3, :3], transforms[:, :3, :3]))
+    return centre - half, centre + half
@@ -0,0 +1,336 @@
+"""Bounding volume hierarchy over spheres.
+
+The tree is built top-down with the surface area heuristic (SAH) and
+stored as flat NumPy arrays in depth-first order rather than as linked
+node objects. The left child of an interior node is always the next
+node, so each node records just:
+
+    node_min, node_max   (M, 3) corners of its box
+    node_offset          right child index (interior) or first slot in order (leaf)
+    node_count           number of spheres in a leaf, 0 for interior nodes
+    node_axis            the axis an interior node was split along
+
+order maps leaf slots back to indices into objects, and inverses holds
+the spheres' inverse transforms in leaf-slot order so each leaf's spheres
+are one contiguous slice.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+from rayz.bounds import sphere_bounds
+from rayz.constants import EPSILON
+from rayz.sphere import Sphere, _any_sphere_hits, _nearest_sphere_hits
+
+DEFAULT_LEAF_SIZE = 4
+
+
+class BVH:
+    def __init__(self, objects: Sequence[Sphere], leaf_size: int = DEFAULT_LEAF_SIZE) -> None:
+        if leaf_size < 1:
+            raise ValueError(f"BVH: leaf_size must be at least 1, got {leaf_size}")
+        self.objects = list(objects)
+        if self.objects:
+            transforms = np.stack([obj.transform.to_array() for obj in self.objects])
+        else:
+            transforms = np.empty((0, 4, 4))
+        lo, hi = sphere_bounds(transforms)
+        # Pad the tight sphere boxes so a grazing hit is never culled by rounding.
+        (
+            self.node_min,
+            self.node_max,
+            self.node_offset,
+            self.node_count,
+            self.node_axis,
+            self.order,
+        ) = _build(lo - EPSILON, hi + EPSILON, leaf_size)
+        self.inverses = np.array([self.objects[i].transform_inverse.to_array() for i in self.order.tolist()])
+        self.inverses = self.inverses.reshape(-1, 4, 4)
+
+        # Python-float copies for single-ray traversal, where per-element
+        # NumPy indexing would dominate.
+        self._nodes = list(
+            zip(
+                self.node_min.tolist(),
+                self.node_max.tolist(),
+                self.node_offset.tolist(),
+                self.node_count.tolist(),
+                self.node_axis.tolist(),
+            )
+        )
+        self._leaf_rows = self.inverses[:, :3, :].reshape(-1, 12).tolist()
+        self._order = self.order.tolist()
+
+    def __len__(self) -> int:
+        """The number of nodes."""
+        return len(self.node_count)
+
+    def depth(self) -> int:
+        """The number of nodes on the longest root-to-leaf path."""
+        deepest = 0
+        stack = [(0, 1)] if len(self) else []
+        while stack:
+            node, level = stack.pop()
+            deepest = max(deepest, level)
+            if not self._nodes[node][3]:
+                stack.append((node + 1, level + 1))
+                stack.append((self._nodes[node][2], level + 1))
+        return deepest
+
+    def nearest_hit(self, ray) -> tuple[int, float]:
+        """The nearest non-negative hit of ray: (object index or -1, t or +inf)."""
+        best, best_t = -1, math.inf
+        for slot, t0, t1 in self._leaf_roots(ray, lambda: best_t):
+            t = t0 if t0 >= 0 else t1
+            if 0 <= t < best_t:
+                best, best_t = slot, t
+        return (self._order[best] if best >= 0 else -1), best_t
+
+    def any_hit(self, ray, max_t: float) -> bool:
+        """True if ray hits any sphere at some t in (EPSILON, max_t).
+
+        Traversal stops at the first such hit, so this is much cheaper
+        than nearest_hit for shadow rays.
+        """
+        for _slot, t0, t1 in self._leaf_roots(ray, lambda: max_t):
+            if EPSILON < t0 < max_t or EPSILON < t1 < max_t:
+                return True
+        return False
+
+    def _leaf_roots(self, ray, max_t):
+        # Yield (slot, t0, t1) for every sphere the ray hits in the leaves
+        # whose boxes it enters before max_t(), nearest leaves first. max_t
+        # is re-read at every node so the caller can shrink it as it goes.
+        ox, oy, oz = ray.origin.x, ray.origin.y, ray.origin.z
+        dx, dy, dz = ray.direction.x, ray.direction.y, ray.direction.z
+        # An infinite reciprocal makes a parallel slab either all-inside (nan
+        # terms fail every comparison) or all-outside (both bounds +/-inf).
+        ix = 1.0 / dx if dx else math.inf
+        iy = 1.0 / dy if dy else math.inf
+        iz = 1.0 / dz if dz else math.inf
+        negative = (dx < 0, dy < 0, dz < 0)
+        nodes = self._nodes
+        rows = self._leaf_rows
+        stack = [0] if nodes else []
+        while stack:
+            node = stack.pop()
+            (x0, y0, z0), (x1, y1, z1), offset, count, axis = nodes[node]
+            t_near, t_far = 0.0, max_t()
+            for t0, t1 in (
+                ((x0 - ox) * ix, (x1 - ox) * ix),
+                ((y0 - oy) * iy, (y1 - oy) * iy),
+                ((z0 - oz) * iz, (z1 - oz) * iz),
+            ):
+                if t0 > t1:
+                    t0, t1 = t1, t0
+                if t0 > t_near:
+                    t_near = t0
+                if t1 < t_far:
+                    t_far = t1
+            if t_near > t_far:
+                continue
+            if not count:
+                # Push the far child first so the near one is visited first.
+                if negative[axis]:
+                    stack.append(node + 1)
+                    stack.append(offset)
+                else:
+                    stack.append(offset)
+                    stack.append(node + 1)
+                continue
+            for slot in range(offset, offset + count):
+                m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11 = rows[slot]
+                px = m0 * ox + m1 * oy + m2 * oz + m3
+                py = m4 * ox + m5 * oy + m6 * oz + m7
+                pz = m8 * ox + m9 * oy + m10 * oz + m11
+                vx = m0 * dx + m1 * dy + m2 * dz
+                vy = m4 * dx + m5 * dy + m6 * dz
+                vz = m8 * dx + m9 * dy + m10 * dz
+                a = vx * vx + vy * vy + vz * vz
+                b = 2.0 * (vx * px + vy * py + vz * pz)
+                c = px * px + py * py + pz * pz - 1.0
+                disc = b * b - 4.0 * a * c
+                if disc < 0:
+                    continue
+                root = math.sqrt(disc)
+                yield slot, (-b - root) / (2.0 * a), (-b + root) / (2.0 * a)
+
+    def nearest_hits(self, origins: np.ndarray, directions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """nearest_hit for N rays given as (N, 4) origin and direction arrays.
+
+        The rays descend the tree together: each node tests only the rays
+        that reached it, and a leaf intersects its spheres with every
+        surviving ray in one vectorized step.
+        """
+        n = len(origins)
+        index = np.full(n, -1, dtype=np.intp)
+        t = np.full(n, np.inf)
+        if n == 0 or not len(self):
+            return index, t
+        o3 = np.ascontiguousarray(origins[:, :3])
+        with np.errstate(divide="ignore"):
+            inv_d = 1.0 / directions[:, :3]
+        stack = [(0, np.arange(n))]
+        while stack:
+            node, rays = stack.pop()
+            rays = self._enter(node, o3, inv_d, rays, t)
+            if not rays.size:
+                continue
+            count = int(self.node_count[node])
+            offset = int(self.node_offset[node])
+            if not count:
+                if directions[rays, self.node_axis[node]].sum() < 0:
+                    stack.append((node + 1, rays))
+                    stack.append((offset, rays))
+                else:
+                    stack.append((offset, rays))
+                    stack.append((node + 1, rays))
+                continue
+            slot, t_hit = _nearest_sphere_hits(
+                self.inverses[offset : offset + count], origins[rays], directions[rays]
+            )
+            closer = t_hit < t[rays]
+            rays = rays[closer]
+            t[rays] = t_hit[closer]
+            index[rays] = self.order[offset + slot[closer]]
+        return index, t
+
+    def any_hits(self, origins: np.ndarray, directions: np.ndarray, max_t: np.ndarray | float) -> np.ndarray:
+        """any_hit for N rays given as (N, 4) origin and direction arrays,
+        with a scalar or (N,) max_t. Returns an (N,) boolean array.
+
+        A ray drops out of the traversal as soon as it is found to be
+        occluded.
+        """
+        n = len(origins)
+        occluded = np.zeros(n, dtype=bool)
+        if n == 0 or not len(self):
+            return occluded
+        max_t = np.broadcast_to(np.asarray(max_t, dtype=float), (n,))
+        o3 = np.ascontiguousarray(origins[:, :3])
+        with np.errstate(divide="ignore"):
+            inv_d = 1.0 / directions[:, :3]
+        stack = [(0, np.arange(n))]
+        while stack:
+            node, rays = stack.pop()
+            rays = rays[~occluded[rays]]
+            rays = self._enter(node, o3, inv_d, rays, max_t)
+            if not rays.size:
+                continue
+            count = int(self.node_count[node])
+            offset = int(self.node_offset[node])
+            if not count:
+                stack.append((offset, rays))
+                stack.append((node + 1, rays))
+                continue
+            hit = _any_sphere_hits(
+                self.inverses[offset : offset + count], origins[rays], directions[rays], max_t[rays]
+            )
+            occluded[rays[hit]] = True
+        return occluded
+
+    def _enter(
+        self, node: int, o3: np.ndarray, inv_d: np.ndarray, rays: np.ndarray, max_t: np.ndarray
+    ) -> np.ndarray:
+        # The subset of rays whose segment [0, max_t) passes through node's box.
+        o, inv = o3[rays], inv_d[rays]
+        with np.errstate(invalid="ignore"):
+            t0 = (self.node_min[node] - o) * inv
+            t1 = (self.node_max[node] - o) * inv
+        # fmin/fmax skip the nan terms of rays parallel to a slab they lie in.
+        t_near = np.fmax.reduce(np.fmin(t0, t1), axis=1)
+        t_far = np.fmin.reduce(np.fmax(t0, t1), axis=1)
+        return rays[(t_near <= t_far) & (t_far >= 0) & (t_near < max_t[rays])]
+
+    def __repr__(self) -> str:
+        return f"BVH(objects={len(self.objects)}, nodes={len(self)})"
+
+
+# ----------------------------------------------------------------------
+# Construction
+# ----------------------------------------------------------------------
+
+
+def _build(lo: np.ndarray, hi: np.ndarray, leaf_size: int):
+    centroids = (lo + hi) * 0.5
+    order = np.arange(len(lo))
+    node_min: list[np.ndarray] = []
+    node_max: list[np.ndarray] = []
+    offsets: list[int] = []
+    counts: list[int] = []
+    axes: list[int] = []
+
+    # Pending (start, stop) ranges of order, plus the parent whose right
+    # child this is (-1 for the root and for left children, which always
+    # directly follow their parent).
+    stack = [(0, len(lo), -1)] if len(lo) else []
+    while stack:
+        start, stop, right_of = stack.pop()
+        node = len(counts)
+        if right_of >= 0:
+            offsets[right_of] = node
+        idx = order[start:stop]
+        node_min.append(lo[idx].min(axis=0))
+        node_max.append(hi[idx].max(axis=0))
+        split = None if stop - start <= leaf_size else _sah_split(lo[idx], hi[idx], centroids[idx])
+        if split is None:
+            offsets.append(start)
+            counts.append(stop - start)
+            axes.append(0)
+            continue
+        axis, perm, k = split
+        order[start:stop] = idx[perm]
+        offsets.append(-1)  # filled in when the right child is created
+        counts.append(0)
+        axes.append(axis)
+        stack.append((start + k, stop, node))
+        stack.append((start, start + k, -1))
+
+    return (
+        np.array(node_min).reshape(-1, 3),
+        np.array(node_max).reshape(-1, 3),
+        np.array(offsets, dtype=np.intp),
+        np.array(counts, dtype=np.intp),
+        np.array(axes, dtype=np.intp),
+        order,
+    )
+
+
+def _sah_split(lo: np.ndarray, hi: np.ndarray, centroids: np.ndarray):
+    """The cheapest split of a node's spheres by SAH, as (axis, perm, k):
+    sorting by centroids[:, axis] with perm puts the first k on the left.
+
+    Every split position along every axis is evaluated with prefix/suffix
+    bounds, so the sweep is exact rather than binned. Returns None when
+    all centroids coincide and no split can separate them.
+    """
+    m = len(lo)
+    counts = np.arange(1, m)
+    best = None
+    best_cost = math.inf
+    for axis in range(3):
+        if centroids[:, axis].max() - centroids[:, axis].min() <= 0:
+            continue
+        perm = np.argsort(centroids[:, axis], kind="stable")
+        sorted_lo, sorted_hi = lo[perm], hi[perm]
+        # Areas of the boxes around the first i and the last m - i spheres.
+        left = _area(np.minimum.accumulate(sorted_lo)[:-1], np.maximum.accumulate(sorted_hi)[:-1])
+        right = _area(
+            np.minimum.accumulate(sorted_lo[::-1])[::-1][1:],
+            np.maximum.accumulate(sorted_hi[::-1])[::-1][1:],
+        )
+        cost = left * counts + right * (m - counts)
+        k = int(np.argmin(cost))
+        if cost[k] < best_cost:
+            best_cost = cost[k]
+            best = (axis, perm, k + 1)
+    return best
+
+
+def _area(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    d = hi - lo
+    return 2.0 * (d[:, 0] * d[:, 1] + d[:, 1] * d[:, 2] + d[:, 2] * d[:, 0])
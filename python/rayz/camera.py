@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from rayz.matrix import Matrix
+from rayz.ray import Ray
+from rayz.tuple import Point, Vector
+
+
+class Camera:
+    """A pinhole camera looking down -z, one unit from its canvas.
+
+    hsize and vsize are the canvas size in pixels; transform orients the
+    world relative to the camera (see transformations.view_transform).
+    """
+
+    def __init__(self, hsize: int, vsize: int, field_of_view: float) -> None:
+        self.hsize = hsize
+        self.vsize = vsize
+        self.field_of_view = field_of_view
+        self.transform = Matrix.identity(4)
+
+        half_view = math.tan(field_of_view / 2)
+        aspect = hsize / vsize
+        if aspect >= 1:
+            self.half_width = half_view
+            self.half_height = half_view / aspect
+        else:
+            self.half_width = half_view * aspect
+            self.half_height = half_view
+        self.pixel_size = (self.half_width * 2) / hsize
+
+    @property
+    def transform(self) -> Matrix:
+        return self._transforms[0]
+
+    @transform.setter
+    def transform(self, m: Matrix) -> None:
+        # Cache the inverse alongside the transform, as Sphere does.
+        self._transforms = (m, m.inverse())
+
+    @property
+    def transform_inverse(self) -> Matrix:
+        return self._transforms[1]
+
+    def ray_for_pixel(self, px: int, py: int) -> Ray:
+        # Offset from the canvas edge to the pixel's centre; +x is to the left
+        # because the camera looks toward -z.
+        world_x = self.half_width - (px + 0.5) * self.pixel_size
+        world_y = self.half_height - (py + 0.5) * self.pixel_size
+        inv = self._transforms[1]
+        pixel = inv * Point(world_x, world_y, -1)
+        origin = inv * Point(0, 0, 0)
+        diff = pixel - origin
+        return Ray(origin, Vector(diff.x, diff.y, diff.z).normalize())
+
+    def rays_for_tile(
+        self, col: int = 0, row: int = 0, width: int | None = None, height: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Primary rays for every pixel of a tile (the whole image by default).
+
+        Returns (origins, directions) as (width * height, 4) arrays in
+        row-major pixel order, matching ray_for_pixel for each pixel. All
+        primary rays share the camera origin, so origins is a read-only
+        broadcast view.
+        """
+        width = self.hsize - col if width is None else width
+        height = self.vsize - row if height is None else height
+        # Pixel centres, one row of x values broadcast against a column of y.
+        x = np.broadcast_to(np.arange(col, col + width) + 0.5, (height, width))
+        y = np.broadcast_to((np.arange(row, row + height) + 0.5)[:, np.newaxis], (height, width))
+        return self.rays_through(x.ravel(), y.ravel())
+
+    def rays_through(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Primary rays through arbitrary canvas positions, for sub-pixel sampling.
+
+        x and y are (N,) arrays in pixel units: pixel (px, py) covers
+        [px, px + 1) x [py, py + 1), so its centre is (px + 0.5, py + 0.5).
+        Returns (origins, directions) as (N, 4) arrays, origins a read-only
+        broadcast view of the camera origin.
+        """
+        inv_t = self._transforms[1].to_array().T
+        # Camera-space points on the z = -1 plane.
+        points = np.empty((len(x), 4))
+        points[:, 0] = self.half_width - np.asarray(x, dtype=float) * self.pixel_size
+        points[:, 1] = self.half_height - np.asarray(y, dtype=float) * self.pixel_size
+        points[:, 2] = -1.0
+        points[:, 3] = 1.0
+        origin = inv_t[3]  # the camera-space origin (0, 0, 0, 1) in world space
+        directions = points @ inv_t
+        directions -= origin
+        directions /= np.sqrt(np.einsum("ij,ij->i", directions, directions))[:, np.newaxis]
+        return np.broadcast_to(origin, directions.shape), directions
+
+    def __repr__(self) -> str:
+        return f"Camera({self.hsize}, {self.vsize}, {self.field_of_view}, transform={self.transform!r})"
@@ -1,44 +1,237 @@
 from __future__ import annotations
 
+import io
+from collections.abc import Iterator
+from typing import BinaryIO, TextIO
+
+import numpy as np
+
+from rayz import png
 from rayz.color import Color
 
 _MAX_COLOR = 255
 _SCALE = _MAX_COLOR + 1  # 256, matching the book's scaling formula
+_PPM_LINE_LIMIT = 70  # the book caps P3 lines at 70 characters
+_PPM_CHUNK_VALUES = 1 << 20  # channel values encoded per chunk when streaming output
+
+
+def _p3_token_table() -> np.ndarray:
+    """Each value 0-255 as a fixed 4-byte ASCII token ("255 ", "7 \\0\\0", ...).
+
+    Zero bytes are padding and are dropped after a lookup.
+    """
+    table = np.zeros((_MAX_COLOR + 1, 4), dtype=np.uint8)
+    for value in range(_MAX_COLOR + 1):
+        token = f"{value} ".encode("ascii")
+        table[value, : len(token)] = np.frombuffer(token, dtype=np.uint8)
+    return table
+
+
+_P3_TOKENS = _p3_token_table()
+_P3_DIGITS = np.array([len(str(v)) for v in range(_MAX_COLOR + 1)])
+_SPACE = ord(" ")
+_NEWLINE = ord("\n")
 
 
 class Canvas:
-    """A 2D grid of pixels. Origin is bottom-left; row 0 is the bottom row."""
+    """A 2D grid of pixels. Origin is bottom-left; row 0 is the bottom row.
+
+    Pixels live in a (height, width, 3) float32 array indexed [row, col]
+    rather than as per-pixel Color objects.
+    """
 
     def __init__(self, width: int, height: int) -> None:
         self.width = width
         self.height = height
-        black = Color(0.0, 0.0, 0.0)
-        self.pixels: list[list[Color]] = [[black] * width for _ in range(height)]
+        self._pixels = np.zeros((height, width, 3), dtype=np.float32)
 
     def write_pixel(self, col: int, row: int, color: Color) -> None:
         if not (0 <= row < self.height):
             raise ValueError(f"write_pixel: row {row} out of bounds")
         if not (0 <= col < self.width):
             raise ValueError(f"write_pixel: col {col} out of bounds")
-        self.pixels[row][col] = color
+        self._pixels[row, col] = self._encode((color.red, color.green, color.blue))
 
     def pixel_at(self, col: int, row: int) -> Color:
         if not (0 <= row < self.height):
             raise ValueError(f"pixel_at: row {row} out of bounds")
         if not (0 <= col < self.width):
             raise ValueError(f"pixel_at: col {col} out of bounds")
-        return self.pixels[row][col]
+        red, green, blue = self._decode(self._pixels[row, col]).tolist()
+        return Color(red, green, blue)
+
+    def write_row(self, row: int, colors: np.ndarray) -> None:
+        """Write a whole row from a (width, 3) array of RGB values."""
+        if not (0 <= row < self.height):
+            raise ValueError(f"write_row: row {row} out of bounds")
+        colors = np.asarray(colors)
+        if colors.shape != (self.width, 3):
+            raise ValueError(f"write_row: expected shape {(self.width, 3)}, got {colors.shape}")
+        self._pixels[row] = self._encode(colors)
+
+    def write_block(self, col: int, row: int, colors: np.ndarray) -> None:
+        """Write an (h, w, 3) array of RGB values with its [0, 0] at (col, row)."""
+        colors = np.asarray(colors)
+        if colors.ndim != 3 or colors.shape[2] != 3:
+            raise ValueError(f"write_block: expected shape (h, w, 3), got {colors.shape}")
+        h, w = colors.shape[:2]
+        if not (0 <= row and row + h <= self.height):
+            raise ValueError(f"write_block: rows {row}..{row + h - 1} out of bounds")
+        if not (0 <= col and col + w <= self.width):
+            raise ValueError(f"write_block: cols {col}..{col + w - 1} out of bounds")
+        self._pixels[row : row + h, col : col + w] = self._encode(colors)
+
+    def to_array(self) -> np.ndarray:
+        """Return the live (height, width, 3) float32 framebuffer, indexed [row, col]."""
+        return self._pixels
 
     def to_ppm(self) -> str:
-        lines = ["P3", f"{self.width} {self.height}", str(_MAX_COLOR)]
+        out = io.StringIO()
+        self.write_ppm(out)
+        return out.getvalue()
+
+    def write_ppm(self, f: TextIO) -> None:
+        """Stream the canvas to a text file handle as P3 PPM, a chunk of rows at a time."""
+        f.write(f"P3\n{self.width} {self.height}\n{_MAX_COLOR}\n")
+        for values in self._quantized_chunks():
+            f.write(_encode_p3_rows(values.reshape(values.shape[0], -1)).decode("ascii"))
+
+    def to_ppm_binary(self) -> bytes:
+        out = io.BytesIO()
+        self.write_ppm_binary(out)
+        return out.getvalue()
+
+    def write_ppm_binary(self, f: BinaryIO) -> None:
+        """Stream the canvas to a binary file handle as P6 PPM (raw RGB bytes)."""
+        f.write(f"P6\n{self.width} {self.height}\n{_MAX_COLOR}\n".encode("ascii"))
+        for values in self._quantized_chunks():
+            f.write(values.tobytes())
+
+    def save_p6(self, path: str) -> None:
+        with open(path, "wb") as f:
+            self.write_ppm_binary(f)
+
+    def to_png(self, compression_level: int = 6, filter_type: str = "none") -> bytes:
+        out = io.BytesIO()
+        self.write_png(out, compression_level, filter_type)
+        return out.getvalue()
+
+    def write_png(self, f: BinaryIO, compression_level: int = 6, filter_type: str = "none") -> None:
+        """Stream the canvas to a binary file handle as an 8-bit RGB PNG.
+
+        compression_level is passed to zlib (0-9, or -1 for its default);
+        filter_type is one of "none", "sub", "up", "average" or "paeth".
+        """
+        png.write_png(f, self.width, self.height, self._quantized_chunks(), compression_level, filter_type)
+
+    def save_png(self, path: str, compression_level: int = 6, filter_type: str = "none") -> None:
+        with open(path, "wb") as f:
+            self.write_png(f, compression_level, filter_type)
+
+    def _quantized_chunks(self) -> Iterator[np.ndarray]:
+        """Yield (rows, width, 3) uint8 chunks in file order, bounded in size."""
+        if self.width == 0 or self.height == 0:
+            return
         # Rows top-to-bottom in the file (high row index first), cols right-to-left.
-        for row in range(self.height - 1, -1, -1):
-            values: list[str] = []
-            for col in range(self.width - 1, -1, -1):
-                pixel = self.pixels[row][col]
-                values.append(str(min(_MAX_COLOR, max(0, round(pixel.red * _SCALE)))))
-                values.append(str(min(_MAX_COLOR, max(0, round(pixel.green * _SCALE)))))
-                values.append(str(min(_MAX_COLOR, max(0, round(pixel.blue * _SCALE)))))
-            lines.append(" ".join(values))
-        lines.append("")  # PPM files end with a newline
-        return "\n".join(lines)
+        ordered = self._pixels[::-1, ::-1]
+        rows_per_chunk = max(1, _PPM_CHUNK_VALUES // (self.width * 3))
+        for start in range(0, self.height, rows_per_chunk):
+            yield _quantize(self._decode(ordered[start : start + rows_per_chunk]))
+
+    # Conversions between float channel values and what the framebuffer
+    # stores; overridden by MappedCanvas for byte storage.
+    def _encode(self, colors):
+        return colors
+
+    def _decode(self, values: np.ndarray) -> np.ndarray:
+        return values
+
+
+_MAPPED_DTYPES = (np.dtype(np.float32), np.dtype(np.uint8))
+
+
+class MappedCanvas(Canvas):
+    """A Canvas whose framebuffer is a memory-mapped .npy file at path, for
+    images too large to hold in memory.
+
+    Writes go straight to the file's pages, which the OS writes back and
+    evicts as it needs to, and export reads the file a chunk of rows at a
+    time. dtype is float32 (12 bytes a pixel) or uint8 (3 bytes a pixel):
+    uint8 stores each channel quantized as for export, so pixel_at returns
+    the quantized color and to_array() the raw bytes.
+    """
+
+    def __init__(self, path: str, width: int, height: int, dtype=np.float32) -> None:
+        dtype = np.dtype(dtype)
+        if dtype not in _MAPPED_DTYPES:
+            raise ValueError(f"MappedCanvas: dtype must be float32 or uint8, got {dtype}")
+        self.path = path
+        self.width = width
+        self.height = height
+        self._pixels = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(height, width, 3))
+
+    @classmethod
+    def open(cls, path: str) -> MappedCanvas:
+        """Map an existing framebuffer file, such as one written by a
+        MappedCanvas, for reading and writing."""
+        pixels = np.load(path, mmap_mode="r+")
+        if pixels.ndim != 3 or pixels.shape[2] != 3 or pixels.dtype not in _MAPPED_DTYPES:
+            raise ValueError(
+                f"MappedCanvas: {path} holds a {pixels.dtype} array of shape {pixels.shape}, "
+                "not a (height, width, 3) float32 or uint8 framebuffer"
+            )
+        canvas = cls.__new__(cls)
+        canvas.path = path
+        canvas.height, canvas.width = pixels.shape[:2]
+        canvas._pixels = pixels
+        return canvas
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._pixels.dtype
+
+    def flush(self) -> None:
+        """Write pending changes to the file."""
+        self._pixels.flush()
+
+    def _encode(self, colors):
+        if self._pixels.dtype == np.uint8:
+            return _quantize(np.asarray(colors, dtype=np.float32))
+        return colors
+
+    def _decode(self, values: np.ndarray) -> np.ndarray:
+        if values.dtype == np.uint8:
+            # Exact: quantizing b / 256 gives b back.
+            return values / np.float32(_SCALE)
+        return values
+
+
+def _quantize(pixels: np.ndarray) -> np.ndarray:
+    """Scale, round and clamp float channels to 0-255 bytes."""
+    return np.clip(np.round(pixels * _SCALE), 0, _MAX_COLOR).astype(np.uint8)
+
+
+def _encode_p3_rows(values: np.ndarray) -> bytes:
+    """Encode (rows, n) channel bytes as P3 text: one newline-terminated row per
+    input row, wrapped at spaces so no line exceeds the 70-character limit."""
+    tokens = _P3_TOKENS[values]
+    # Turn the trailing space after each row's last value into the row's newline.
+    tokens[np.arange(values.shape[0]), -1, _P3_DIGITS[values[:, -1]]] = _NEWLINE
+    flat = tokens.reshape(-1)
+    buf = flat[flat != 0]
+
+    ends = np.flatnonzero(buf == _NEWLINE)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    long_rows = ends - starts > _PPM_LINE_LIMIT
+    if long_rows.any():
+        spaces = np.flatnonzero(buf == _SPACE)
+        starts, ends = starts[long_rows], ends[long_rows]
+        # Break every over-long row at once: each pass swaps the last space
+        # within reach of the current line start for a newline.
+        while starts.size:
+            breaks = spaces[np.searchsorted(spaces, starts + _PPM_LINE_LIMIT, side="right") - 1]
+            buf[breaks] = _NEWLINE
+            starts = breaks + 1
+            still_long = ends - starts > _PPM_LINE_LIMIT
+            starts, ends = starts[still_long], ends[still_long]
+    return buf.tobytes()
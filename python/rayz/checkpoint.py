@@ -0,0 +1,191 @@
+"""Checkpointed tile rendering that can resume after a crash.
+
+A checkpoint is a directory holding the framebuffer and a done flag per
+tile as memory-mapped .npy files, plus the image and tile sizes:
+
+    pixels.npy   (height, width, 3) float32, written tile by tile
+    done.npy     (tiles,) bool, True once a tile's pixels are on disk
+    meta.json    {"width": ..., "height": ..., "tile_size": ...}
+
+Tiles are written straight into the mapped framebuffer. Every interval
+seconds the framebuffer is flushed and only then are the tiles finished
+since the last flush marked done, so a tile marked done always has its
+pixels on disk. Rendering again into the same directory skips those
+tiles. The caller must resume with the same scene; only the sizes are
+checked. The finished image is a MappedCanvas over pixels.npy, so it is
+never copied into memory.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from rayz.canvas import Canvas, MappedCanvas
+from rayz.profiling import profiled_render
+from rayz.render import (
+    BACKENDS,
+    DEFAULT_TILE_SIZE,
+    Tile,
+    gil_disabled,
+    init_worker,
+    render_tile_in_worker,
+    tiles,
+)
+
+DEFAULT_INTERVAL = 5.0
+
+_PIXELS = "pixels.npy"
+_DONE = "done.npy"
+_META = "meta.json"
+
+
+class Checkpoint:
+    """The on-disk state of one render, created or reopened in directory."""
+
+    def __init__(self, directory: str, width: int, height: int, tile_size: int = DEFAULT_TILE_SIZE) -> None:
+        self.directory = directory
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.tiles: list[Tile] = tiles(width, height, tile_size)
+        meta = {"width": width, "height": height, "tile_size": tile_size}
+        meta_path = os.path.join(directory, _META)
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                found = json.load(f)
+            if found != meta:
+                raise ValueError(
+                    f"Checkpoint: {directory} holds a {found['width']}x{found['height']} render with "
+                    f"{found['tile_size']}-pixel tiles, not {width}x{height} with {tile_size}-pixel tiles"
+                )
+            self.pixels = np.load(self.pixels_path, mmap_mode="r+")
+            self.done = np.load(os.path.join(directory, _DONE), mmap_mode="r+")
+            return
+        os.makedirs(directory, exist_ok=True)
+        self.pixels = np.lib.format.open_memmap(
+            self.pixels_path, mode="w+", dtype=np.float32, shape=(height, width, 3)
+        )
+        self.done = np.lib.format.open_memmap(
+            os.path.join(directory, _DONE), mode="w+", dtype=np.bool_, shape=(len(self.tiles),)
+        )
+        # Written last, so a directory with meta.json is a complete checkpoint.
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+
+    @property
+    def pixels_path(self) -> str:
+        return os.path.join(self.directory, _PIXELS)
+
+    def remaining(self) -> list[int]:
+        """Indices into tiles of the tiles not yet done."""
+        return np.flatnonzero(~self.done).tolist()
+
+    def is_complete(self) -> bool:
+        return bool(self.done.all())
+
+    def commit(self, finished: list[int]) -> None:
+        """Flush the framebuffer, then mark finished tiles as done."""
+        if not finished:
+            return
+        self.pixels.flush()
+        self.done[finished] = True
+        self.done.flush()
+
+    def to_canvas(self) -> MappedCanvas:
+        return MappedCanvas.open(self.pixels_path)
+
+    def __repr__(self) -> str:
+        return (
+            f"Checkpoint({self.directory!r}, {self.width}x{self.height}, "
+            f"{int(self.done.sum())}/{len(self.tiles)} tiles done)"
+        )
+
+
+@profiled_render
+def render_checkpointed(
+    scene,
+    width: int,
+    height: int,
+    directory: str,
+    workers: int | None = None,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    backend: str = "auto",
+    interval: float = DEFAULT_INTERVAL,
+) -> Canvas:
+    """render(), checkpointing finished tiles to directory every interval seconds.
+
+    Tiles already done in directory are skipped, so calling this again
+    after a crash or preemption picks up where the last run left off.
+    interval=0 commits after every tile. Tiles finished when an exception
+    stops the render are committed before it propagates.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"render_checkpointed: unknown backend {backend!r} (valid: {BACKENDS})")
+    if workers is not None and workers < 1:
+        raise ValueError(f"render_checkpointed: workers must be at least 1, got {workers}")
+    checkpoint = Checkpoint(directory, width, height, tile_size)
+    todo = checkpoint.remaining()
+    workers = workers or os.cpu_count() or 1
+    if backend == "auto":
+        backend = "threads" if gil_disabled() else "processes"
+
+    pending: list[int] = []
+    last_commit = time.monotonic()
+    try:
+        for index in _render_tiles(scene, checkpoint, todo, workers, backend):
+            pending.append(index)
+            if time.monotonic() - last_commit >= interval:
+                checkpoint.commit(pending)
+                pending = []
+                last_commit = time.monotonic()
+    finally:
+        checkpoint.commit(pending)
+    return checkpoint.to_canvas()
+
+
+def _render_tiles(scene, checkpoint: Checkpoint, todo: list[int], workers: int, backend: str):
+    # Yield the index of each tile as soon as its pixels are in the mapped
+    # framebuffer.
+    if workers == 1 or len(todo) <= 1:
+        for index in todo:
+            _render_into(scene, checkpoint.pixels, checkpoint.tiles[index])
+            yield index
+        return
+
+    if backend == "threads":
+        pool = ThreadPoolExecutor(max_workers=min(workers, len(todo)))
+
+        def submit(index: int):
+            return pool.submit(_render_into, scene, checkpoint.pixels, checkpoint.tiles[index])
+
+    else:
+        # Each worker maps the framebuffer file itself and writes its tiles
+        # there; the file's pages are shared with this process.
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers, len(todo)),
+            initializer=init_worker,
+            initargs=(scene, MappedCanvas.open, checkpoint.pixels_path),
+        )
+
+        def submit(index: int):
+            return pool.submit(render_tile_in_worker, checkpoint.tiles[index])
+
+    with pool:
+        futures = {submit(index): index for index in todo}
+        try:
+            for future in as_completed(futures):
+                future.result()
+                yield futures[future]
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _render_into(scene, pixels: np.ndarray, tile: Tile) -> None:
+    col, row, w, h = tile
+    pixels[row : row + h, col : col + w] = scene.render_tile(col, row, w, h)
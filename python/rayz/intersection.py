@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import heapq
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+
 
 class Intersection:
+    __slots__ = ("t", "object")
+
     def __init__(self, t: float, obj) -> None:
         self.t = t
         self.object = obj
@@ -11,19 +17,82 @@ class Intersection:
             return NotImplemented
         return self.t == other.t and self.object is other.object
 
+    __hash__ = None  # type: ignore[assignment]
+
     def __repr__(self) -> str:
         return f"Intersection(t={self.t}, object={self.object!r})"
 
 
-def intersections(*args: Intersection) -> list[Intersection]:
-    return list(args)
+def _t(i: Intersection) -> float:
+    return i.t
+
+
+class IntersectionList:
+    """Intersections kept sorted by t.
+
+    A parallel list of t values allows bisect lookups, so hit() is
+    O(log n). Already-sorted per-object lists can be combined in linear
+    time with merge().
+    """
+
+    __slots__ = ("_items", "_ts")
+
+    def __init__(self, items: Iterable[Intersection] = ()) -> None:
+        self._items: list[Intersection] = sorted(items, key=_t)
+        self._ts: list[float] = [i.t for i in self._items]
+
+    @classmethod
+    def merge(cls, *sorted_lists: Sequence[Intersection]) -> IntersectionList:
+        """Merge lists that are each already sorted by t (e.g. Sphere.intersect results)."""
+        xs = cls()
+        xs._items = list(heapq.merge(*sorted_lists, key=_t))
+        xs._ts = [i.t for i in xs._items]
+        return xs
+
+    def add(self, i: Intersection) -> None:
+        # bisect_right keeps equal t values in insertion order.
+        index = bisect_right(self._ts, i.t)
+        self._ts.insert(index, i.t)
+        self._items.insert(index, i)
+
+    def extend(self, sorted_items: Sequence[Intersection]) -> None:
+        """Merge in intersections that are already sorted by t."""
+        self._items = list(heapq.merge(self._items, sorted_items, key=_t))
+        self._ts = [i.t for i in self._items]
+
+    def hit(self) -> Intersection | None:
+        """The intersection with the lowest non-negative t, or None."""
+        index = bisect_left(self._ts, 0)
+        if index == len(self._items):
+            return None
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> Intersection:
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[Intersection]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"IntersectionList({self._items!r})"
+
+
+def intersections(*args: Intersection) -> IntersectionList:
+    return IntersectionList(args)
 
 
-def hit(xs: list[Intersection]) -> Intersection | None:
-    valid = [i for i in xs if i.t >= 0]
-    if not valid:
-        return None
-    return min(valid, key=lambda i: i.t)
+def hit(xs: Iterable[Intersection]) -> Intersection | None:
+    if isinstance(xs, IntersectionList):
+        return xs.hit()
+    # Single pass over an unsorted sequence; no filtered copy.
+    best = None
+    for i in xs:
+        if i.t >= 0 and (best is None or i.t < best.t):
+            best = i
+    return best
 
 
 def intersect(shape, ray) -> list[Intersection]:
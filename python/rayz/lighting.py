@@ -0,0 +1,93 @@
+"""Phong reflection model: ambient + diffuse + specular."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from rayz.color import Color
+from rayz.light import PointLight
+from rayz.material import Material, MaterialArrays
+from rayz.tuple import Point, Vector
+
+
+def lighting(
+    material: Material,
+    light: PointLight,
+    point: Point,
+    eyev: Vector,
+    normalv: Vector,
+    in_shadow: bool = False,
+) -> Color:
+    """The color of a single point lit by light, seen along eyev."""
+    color, intensity = material.color, light.intensity
+    # Combine the surface color with the light's color.
+    er = color.red * intensity.red
+    eg = color.green * intensity.green
+    eb = color.blue * intensity.blue
+    ambient = material.ambient
+    if in_shadow:
+        return Color(er * ambient, eg * ambient, eb * ambient)
+
+    lx = light.position.x - point.x
+    ly = light.position.y - point.y
+    lz = light.position.z - point.z
+    length = math.sqrt(lx * lx + ly * ly + lz * lz)
+    lx, ly, lz = lx / length, ly / length, lz / length
+    # The cosine of the angle between the light vector and the normal; a
+    # negative value means the light is on the other side of the surface.
+    light_dot_normal = lx * normalv.x + ly * normalv.y + lz * normalv.z
+    if light_dot_normal < 0:
+        return Color(er * ambient, eg * ambient, eb * ambient)
+
+    k = ambient + material.diffuse * light_dot_normal
+    # reflect(-lightv, normalv), dotted with the eye vector.
+    twice = 2.0 * light_dot_normal
+    rx, ry, rz = twice * normalv.x - lx, twice * normalv.y - ly, twice * normalv.z - lz
+    reflect_dot_eye = rx * eyev.x + ry * eyev.y + rz * eyev.z
+    specular = material.specular * reflect_dot_eye**material.shininess if reflect_dot_eye > 0 else 0.0
+    return Color(
+        er * k + intensity.red * specular,
+        eg * k + intensity.green * specular,
+        eb * k + intensity.blue * specular,
+    )
+
+
+def lighting_batch(
+    material: Material | MaterialArrays,
+    light: PointLight,
+    points: np.ndarray,
+    eyevs: np.ndarray,
+    normals: np.ndarray,
+    in_shadow: np.ndarray | None = None,
+) -> np.ndarray:
+    """lighting() for N hits at once.
+
+    points, eyevs and normals are (N, 4) arrays (or (N, 3); only xyz is
+    read) and in_shadow an optional (N,) boolean mask. material is either
+    one Material shared by every hit or a MaterialArrays with one row per
+    hit. Returns the colors as an (N, 3) array, ready for Canvas.write_block.
+    """
+    if isinstance(material, Material):
+        material = MaterialArrays.from_materials([material])
+    intensity = np.array([light.intensity.red, light.intensity.green, light.intensity.blue])
+    position = np.array([light.position.x, light.position.y, light.position.z])
+
+    lightv = position - points[:, :3]
+    lightv /= np.sqrt(np.einsum("ij,ij->i", lightv, lightv))[:, np.newaxis]
+    n = normals[:, :3]
+    light_dot_normal = np.einsum("ij,ij->i", lightv, n)
+    lit = light_dot_normal >= 0
+    if in_shadow is not None:
+        lit &= ~in_shadow
+
+    # reflect(-lightv, n) = 2 (l.n) n - l, dotted with the eye vector.
+    reflectv = (2.0 * light_dot_normal)[:, np.newaxis] * n - lightv
+    reflect_dot_eye = np.einsum("ij,ij->i", reflectv, eyevs[:, :3])
+    shines = lit & (reflect_dot_eye > 0)
+    specular = np.where(
+        shines, material.specular * np.where(shines, reflect_dot_eye, 0.0) ** material.shininess, 0.0
+    )
+    k = material.ambient + np.where(lit, material.diffuse * light_dot_normal, 0.0)
+    return (material.color * intensity) * k[:, np.newaxis] + intensity * specular[:, np.newaxis]
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import itertools
+from collections.abc import Sequence
+
+import numpy as np
+
 from rayz.color import Color
 from rayz.constants import EPSILON
 
+# Stamps for Material._version: every attribute assignment gives the
+# material a new, never reused version, so data derived from materials
+# (World.materials) can tell when any of them changed.
+_versions = itertools.count(1)
+
 
 class Material:
     def __init__(
@@ -25,6 +35,10 @@ class Material:
         self.transparency = transparency
         self.refractive_index = refractive_index
 
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_version", next(_versions))
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Material):
             return NotImplemented
@@ -46,3 +60,59 @@ class Material:
             f"Material(color={self.color!r}, ambient={self.ambient}, diffuse={self.diffuse}, "
             f"specular={self.specular}, shininess={self.shininess})"
         )
+
+
+class MaterialArrays:
+    """The properties of a batch of materials as NumPy arrays, one row per
+    material: color is (N, 3), every other property is (N,).
+
+    Index it with an array of object indices to get the material of each
+    hit in a buffer, e.g. ``MaterialArrays.from_materials(ms)[index]``.
+    """
+
+    __slots__ = (
+        "color",
+        "ambient",
+        "diffuse",
+        "specular",
+        "shininess",
+        "reflective",
+        "transparency",
+        "refractive_index",
+    )
+
+    def __init__(
+        self,
+        color: np.ndarray,
+        ambient: np.ndarray,
+        diffuse: np.ndarray,
+        specular: np.ndarray,
+        shininess: np.ndarray,
+        reflective: np.ndarray,
+        transparency: np.ndarray,
+        refractive_index: np.ndarray,
+    ) -> None:
+        self.color = color
+        self.ambient = ambient
+        self.diffuse = diffuse
+        self.specular = specular
+        self.shininess = shininess
+        self.reflective = reflective
+        self.transparency = transparency
+        self.refractive_index = refractive_index
+
+    @classmethod
+    def from_materials(cls, materials: Sequence[Material]) -> MaterialArrays:
+        return cls(
+            np.array([(m.color.red, m.color.green, m.color.blue) for m in materials]).reshape(-1, 3),
+            *(np.array([getattr(m, name) for m in materials], dtype=float) for name in cls.__slots__[1:]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ambient)
+
+    def __getitem__(self, index: np.ndarray) -> MaterialArrays:
+        return MaterialArrays(*(getattr(self, name)[index] for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f"MaterialArrays({len(self)} materials)"
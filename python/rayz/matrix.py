@@ -3,7 +3,8 @@ from __future__ import annotations
 import numpy as np
 
 from rayz.constants import EPSILON
-from rayz.tuple import Tuple
+from rayz.tuple import Tuple, _tuple
+from rayz.tuple_array import TupleArray
 
 
 class Matrix:
@@ -14,6 +15,10 @@ class Matrix:
             self._data = rows.astype(float)
         else:
             self._data = np.array(rows, dtype=float)
+        self._is_4x4 = self._data.shape == (4, 4)
+        # Row-major Python floats of a 4x4 matrix, built on first Matrix * Tuple.
+        # Concurrent first uses may both build it; they store equal tuples.
+        self._flat: tuple[float, ...] | None = None
 
     # ------------------------------------------------------------------
     # Element access
@@ -38,19 +43,46 @@ class Matrix:
     def __repr__(self) -> str:
         return f"Matrix({self._data.tolist()})"
 
+    def to_array(self) -> np.ndarray:
+        """Return the backing array as a read-only view."""
+        view = self._data.view()
+        view.flags.writeable = False
+        return view
+
     # ------------------------------------------------------------------
     # Multiplication
     # ------------------------------------------------------------------
 
-    def __mul__(self, other: Matrix | Tuple) -> Matrix | Tuple:
-        if isinstance(other, Matrix):
-            return Matrix(self._data @ other._data)
+    def __mul__(self, other: Matrix | Tuple | TupleArray) -> Matrix | Tuple | TupleArray:
+        # Tuples are checked first: Matrix * Tuple is the per-ray hot path.
         if isinstance(other, Tuple):
+            if self._is_4x4:
+                return self._mul_tuple4(other)
             vec = np.array([other.x, other.y, other.z, other.w])
             result = self._data @ vec
             return Tuple(result[0], result[1], result[2], result[3])
+        if isinstance(other, Matrix):
+            return Matrix(self._data @ other._data)
+        if isinstance(other, TupleArray):
+            # Row-wise M * t for every tuple, as one (N, 4) @ (4, 4) product.
+            return TupleArray(other.to_array() @ self._data.T)
         return NotImplemented
 
+    def _mul_tuple4(self, t: Tuple) -> Tuple:
+        # Unrolled float arithmetic: for a single 4-vector this beats the
+        # NumPy call overhead of building an array and running a matmul.
+        m = self._flat
+        if m is None:
+            m = self._flat = tuple(self._data.ravel().tolist())
+        m00, m01, m02, m03, m10, m11, m12, m13, m20, m21, m22, m23, m30, m31, m32, m33 = m
+        x, y, z, w = t.x, t.y, t.z, t.w
+        return _tuple(
+            m00 * x + m01 * y + m02 * z + m03 * w,
+            m10 * x + m11 * y + m12 * z + m13 * w,
+            m20 * x + m21 * y + m22 * z + m23 * w,
+            m30 * x + m31 * y + m32 * z + m33 * w,
+        )
+
     # ------------------------------------------------------------------
     # Transpose
     # ------------------------------------------------------------------
@@ -66,6 +98,11 @@ class Matrix:
         n = self._data.shape[0]
         if n == 2:
             return float(self._data[0, 0] * self._data[1, 1] - self._data[0, 1] * self._data[1, 0])
+        if n == 3:
+            return _det3(self._data.ravel().tolist())
+        if n == 4:
+            return _det4(self._data.ravel().tolist())
+        # General case: cofactor expansion along the first row.
         total = 0.0
         for col in range(n):
             total += self._data[0, col] * self.cofactor(0, col)
@@ -97,6 +134,12 @@ class Matrix:
         return abs(self.determinant()) > EPSILON
 
     def inverse(self) -> Matrix:
+        n = self._data.shape[0]
+        if n in _CLOSED_FORM_INVERSES:
+            inv = _CLOSED_FORM_INVERSES[n](self._data.ravel().tolist())
+            if inv is None:
+                raise ValueError("Matrix is not invertible")
+            return Matrix(np.array(inv, dtype=float).reshape(n, n))
         if not self.is_invertible():
             raise ValueError("Matrix is not invertible")
         return Matrix(np.linalg.inv(self._data))
@@ -108,3 +151,107 @@ class Matrix:
     @classmethod
     def identity(cls, size: int = 4) -> Matrix:
         return cls(np.eye(size))
+
+
+# ----------------------------------------------------------------------
+# Closed-form determinant and inverse for 2x2, 3x3 and 4x4 matrices.
+#
+# These work on a flat row-major list of Python floats so no temporary
+# NumPy arrays are built. The inverse helpers return None when the
+# determinant is within EPSILON of zero, mirroring is_invertible().
+# ----------------------------------------------------------------------
+
+
+def _det3(m: list[float]) -> float:
+    a, b, c, d, e, f, g, h, i = m
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+
+def _det4(m: list[float]) -> float:
+    a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = m
+    # 2x2 determinants from the top two rows (s*) and the bottom two rows (c*).
+    s0 = a00 * a11 - a10 * a01
+    s1 = a00 * a12 - a10 * a02
+    s2 = a00 * a13 - a10 * a03
+    s3 = a01 * a12 - a11 * a02
+    s4 = a01 * a13 - a11 * a03
+    s5 = a02 * a13 - a12 * a03
+    c5 = a22 * a33 - a32 * a23
+    c4 = a21 * a33 - a31 * a23
+    c3 = a21 * a32 - a31 * a22
+    c2 = a20 * a33 - a30 * a23
+    c1 = a20 * a32 - a30 * a22
+    c0 = a20 * a31 - a30 * a21
+    return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+
+def _inverse2(m: list[float]) -> list[float] | None:
+    a, b, c, d = m
+    det = a * d - b * c
+    if abs(det) <= EPSILON:
+        return None
+    inv = 1.0 / det
+    return [d * inv, -b * inv, -c * inv, a * inv]
+
+
+def _inverse3(m: list[float]) -> list[float] | None:
+    a, b, c, d, e, f, g, h, i = m
+    c00 = e * i - f * h
+    c01 = f * g - d * i
+    c02 = d * h - e * g
+    det = a * c00 + b * c01 + c * c02
+    if abs(det) <= EPSILON:
+        return None
+    inv = 1.0 / det
+    return [
+        c00 * inv,
+        (c * h - b * i) * inv,
+        (b * f - c * e) * inv,
+        c01 * inv,
+        (a * i - c * g) * inv,
+        (c * d - a * f) * inv,
+        c02 * inv,
+        (b * g - a * h) * inv,
+        (a * e - b * d) * inv,
+    ]
+
+
+def _inverse4(m: list[float]) -> list[float] | None:
+    a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = m
+    s0 = a00 * a11 - a10 * a01
+    s1 = a00 * a12 - a10 * a02
+    s2 = a00 * a13 - a10 * a03
+    s3 = a01 * a12 - a11 * a02
+    s4 = a01 * a13 - a11 * a03
+    s5 = a02 * a13 - a12 * a03
+    c5 = a22 * a33 - a32 * a23
+    c4 = a21 * a33 - a31 * a23
+    c3 = a21 * a32 - a31 * a22
+    c2 = a20 * a33 - a30 * a23
+    c1 = a20 * a32 - a30 * a22
+    c0 = a20 * a31 - a30 * a21
+    det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+    if abs(det) <= EPSILON:
+        return None
+    inv = 1.0 / det
+    return [
+        (a11 * c5 - a12 * c4 + a13 * c3) * inv,
+        (-a01 * c5 + a02 * c4 - a03 * c3) * inv,
+        (a31 * s5 - a32 * s4 + a33 * s3) * inv,
+        (-a21 * s5 + a22 * s4 - a23 * s3) * inv,
+        (-a10 * c5 + a12 * c2 - a13 * c1) * inv,
+        (a00 * c5 - a02 * c2 + a03 * c1) * inv,
+        (-a30 * s5 + a32 * s2 - a33 * s1) * inv,
+        (a20 * s5 - a22 * s2 + a23 * s1) * inv,
+        (a10 * c4 - a11 * c2 + a13 * c0) * inv,
+        (-a00 * c4 + a01 * c2 - a03 * c0) * inv,
+        (a30 * s4 - a31 * s2 + a33 * s0) * inv,
+        (-a20 * s4 + a21 * s2 - a23 * s0) * inv,
+        (-a10 * c3 + a11 * c1 - a12 * c0) * inv,
+        (a00 * c3 - a01 * c1 + a02 * c0) * inv,
+        (-a30 * s3 + a31 * s1 - a32 * s0) * inv,
+        (a20 * s3 - a21 * s1 + a22 * s0) * inv,
+    ]
+
+
+_CLOSED_FORM_INVERSES = {2: _inverse2, 3: _inverse3, 4: _inverse4}
@@ -0,0 +1,88 @@
+"""Dependency-free PNG encoder for 8-bit RGB images, built on zlib.
+
+Scanline filters are applied to whole chunks of rows at once with NumPy;
+compressed data is streamed out as a sequence of IDAT chunks.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from collections.abc import Iterable
+from typing import BinaryIO
+
+import numpy as np
+
+_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_BYTES_PER_PIXEL = 3  # 8-bit RGB
+_COLOR_TYPE_RGB = 2
+
+FILTERS = {"none": 0, "sub": 1, "up": 2, "average": 3, "paeth": 4}
+
+
+def write_png(
+    f: BinaryIO,
+    width: int,
+    height: int,
+    chunks: Iterable[np.ndarray],
+    compression_level: int = 6,
+    filter_type: str = "none",
+) -> None:
+    """Write an RGB PNG whose rows arrive top-to-bottom as (rows, width, 3) uint8 chunks."""
+    if filter_type not in FILTERS:
+        raise ValueError(f"write_png: unknown filter {filter_type!r} (valid: {sorted(FILTERS)})")
+    if not (-1 <= compression_level <= 9):
+        raise ValueError(f"write_png: compression_level {compression_level} not in -1..9")
+
+    f.write(_SIGNATURE)
+    f.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, _COLOR_TYPE_RGB, 0, 0, 0)))
+    compressor = zlib.compressobj(compression_level)
+    prior = np.zeros(width * _BYTES_PER_PIXEL, dtype=np.uint8)
+    for rows in chunks:
+        raw = np.ascontiguousarray(rows, dtype=np.uint8).reshape(rows.shape[0], -1)
+        if raw.shape[0] == 0:
+            continue
+        data = compressor.compress(_filter_rows(raw, prior, FILTERS[filter_type]).tobytes())
+        if data:
+            f.write(_chunk(b"IDAT", data))
+        prior = raw[-1]
+    f.write(_chunk(b"IDAT", compressor.flush()))
+    f.write(_chunk(b"IEND", b""))
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    crc = zlib.crc32(data, zlib.crc32(kind))
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
+
+
+def _filter_rows(raw: np.ndarray, prior: np.ndarray, filter_code: int) -> np.ndarray:
+    """Filter (rows, stride) scanlines; prior is the scanline above the first row.
+
+    Returns (rows, stride + 1) bytes with the filter type byte prepended to each row.
+    """
+    out = np.empty((raw.shape[0], raw.shape[1] + 1), dtype=np.uint8)
+    out[:, 0] = filter_code
+    if filter_code == 0:
+        out[:, 1:] = raw
+        return out
+
+    # Filters work modulo 256 on the unfiltered bytes to the left (a), above (b)
+    # and above-left (c) of each byte, so every row can be filtered at once.
+    x = raw.astype(np.int16)
+    up = np.vstack((prior[np.newaxis, :], raw[:-1])).astype(np.int16)
+    left = np.zeros_like(x)
+    left[:, _BYTES_PER_PIXEL:] = x[:, :-_BYTES_PER_PIXEL]
+    if filter_code == 1:
+        predicted = left
+    elif filter_code == 2:
+        predicted = up
+    elif filter_code == 3:
+        predicted = (left + up) // 2
+    else:
+        up_left = np.zeros_like(x)
+        up_left[:, _BYTES_PER_PIXEL:] = up[:, :-_BYTES_PER_PIXEL]
+        p = left + up - up_left
+        pa, pb, pc = np.abs(p - left), np.abs(p - up), np.abs(p - up_left)
+        predicted = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, up_left))
+    out[:, 1:] = ((x - predicted) & 0xFF).astype(np.uint8)
+    return out
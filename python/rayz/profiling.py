@@ -0,0 +1,311 @@
+"""Opt-in instrumentation: event counters, per-stage timers and cProfile.
+
+Nothing in the library checks whether profiling is on. While a Profiler
+is active it replaces the methods and functions listed in _HOOKS with
+counting, timing wrappers, and it puts the originals back when it stops,
+so code run outside a profiler pays nothing at all.
+
+Stages are timed inclusively and only at their outermost call, so a
+stage that calls into another (trace into intersect, say) includes that
+time too, but a stage re-entering itself (World.intersect into
+Sphere.intersect) is not counted twice. Counters:
+
+    rays                ray queries against a world or shape, counted
+                        once at the outermost query
+    intersection_tests  ray-sphere tests, scalar or batched (the scalar
+                        BVH traversal's inlined leaf tests are not seen)
+    matrix_inversions   Matrix.inverse calls
+    tuple_allocations   Tuple, Point and Vector objects created
+    intersection_allocations  Intersection objects created
+
+The render drivers are not hooked. They are decorated with
+profiled_render, which times them as the render stage itself. Counters
+and timers only see this process, so while a profiler is active the
+drivers run in-process (workers=1). Because the hooks are process-wide,
+the drivers refuse the threads backend.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import functools
+import importlib
+import inspect
+import io
+import json
+import pstats
+import sys
+import time
+from collections.abc import Callable
+
+
+def _one(args: tuple) -> int:
+    return 1
+
+
+def _batch(args: tuple) -> int:
+    # Methods taking (self, origins, directions, ...) as (N, 4) arrays.
+    return len(args[1])
+
+
+def _pairs(args: tuple) -> int:
+    # _sphere_roots(inv, origins, directions): K spheres against n rays.
+    return len(args[0]) * len(args[1])
+
+
+_RAY = ("rays", _one, True)
+_RAYS = ("rays", _batch, True)
+_TEST = ("intersection_tests", _one, False)
+_TUPLE = ("tuple_allocations", _one, False)
+
+# target -> (stage or None, ((counter, size, outermost only), ...)). A
+# target is "module:Class.method" or "module:function"; functions are
+# replaced in every loaded module that imported them by name.
+_HOOKS: dict[str, tuple[str | None, tuple]] = {
+    "rayz.trace:trace_rays": ("trace", ()),
+    "rayz.camera:Camera.ray_for_pixel": ("camera", ()),
+    "rayz.camera:Camera.rays_for_tile": ("camera", ()),
+    "rayz.ray:Ray.transform": ("transform", ()),
+    "rayz.world:World.intersect": ("intersect", (_RAY,)),
+    "rayz.world:World.nearest_hit": ("intersect", (_RAY,)),
+    "rayz.world:World.nearest_hits": ("intersect", (_RAYS,)),
+    "rayz.bvh:BVH.nearest_hit": ("intersect", (_RAY,)),
+    "rayz.bvh:BVH.nearest_hits": ("intersect", (_RAYS,)),
+    "rayz.sphere:Sphere.intersect": ("intersect", (_RAY, _TEST)),
+    "rayz.sphere:Sphere.intersect_rays": ("intersect", (_RAYS, ("intersection_tests", _batch, False))),
+    "rayz.sphere:_sphere_roots": (None, (("intersection_tests", _pairs, False),)),
+    "rayz.intersection:hit": ("hit", ()),
+    "rayz.intersection:IntersectionList.hit": ("hit", ()),
+    "rayz.world:World.is_shadowed": ("shadow", ()),
+    "rayz.world:World.shadowed": ("shadow", ()),
+    "rayz.world:World.any_hit": ("shadow", (_RAY,)),
+    "rayz.world:World.any_hits": ("shadow", (_RAYS,)),
+    "rayz.bvh:BVH.any_hit": ("shadow", (_RAY,)),
+    "rayz.bvh:BVH.any_hits": ("shadow", (_RAYS,)),
+    "rayz.sphere:Sphere.any_hit": ("shadow", (_RAY, _TEST)),
+    "rayz.sphere:Sphere.any_hits": ("shadow", (_RAYS,)),
+    "rayz.lighting:lighting": ("shade", ()),
+    "rayz.lighting:lighting_batch": ("shade", ()),
+    "rayz.world:World.normals_at": ("shade", ()),
+    "rayz.sphere:Sphere.normal_at": ("shade", ()),
+    "rayz.sphere:Sphere.normals_at": ("shade", ()),
+    "rayz.matrix:Matrix.inverse": ("invert", (("matrix_inversions", _one, False),)),
+    "rayz.canvas:Canvas.write_ppm": ("export", ()),
+    "rayz.canvas:Canvas.write_ppm_binary": ("export", ()),
+    "rayz.canvas:Canvas.write_png": ("export", ()),
+    "rayz.tuple:Tuple.__init__": (None, (_TUPLE,)),
+    "rayz.tuple:Point.__init__": (None, (_TUPLE,)),
+    "rayz.tuple:Vector.__init__": (None, (_TUPLE,)),
+    "rayz.tuple:_tuple": (None, (_TUPLE,)),
+    "rayz.tuple:_point": (None, (_TUPLE,)),
+    "rayz.tuple:_vector": (None, (_TUPLE,)),
+    "rayz.intersection:Intersection.__init__": (None, (("intersection_allocations", _one, False),)),
+}
+
+COUNTERS = (
+    "rays",
+    "intersection_tests",
+    "matrix_inversions",
+    "tuple_allocations",
+    "intersection_allocations",
+)
+STAGES = ("render", "trace", "camera", "intersect", "transform", "hit", "shadow", "shade", "invert", "export")
+
+_active: Profiler | None = None
+
+
+class Profiler:
+    """Counts events and times pipeline stages while active.
+
+        with Profiler() as prof:
+            canvas = render(scene, 200, 100)
+            canvas.save_p6("out.ppm")
+        print(prof.summary())
+
+    With cprofile=True a cProfile.Profile runs alongside, for export with
+    dump_stats() or inspection through stats(). Only one profiler may be
+    active at a time.
+    """
+
+    def __init__(self, cprofile: bool = False) -> None:
+        self.counters: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.stages: dict[str, list[float]] = {stage: [0, 0.0] for stage in STAGES}  # [calls, seconds]
+        self.wall = 0.0
+        self._profile = cProfile.Profile() if cprofile else None
+        self._depth: dict[str, int] = {}
+        self._patches: list[tuple[object, str, object]] = []
+        self._started: float | None = None
+
+    def start(self) -> None:
+        global _active
+        if _active is not None:
+            raise ValueError("Profiler: another profiler is already active")
+        _active = self
+        self._depth = dict.fromkeys((*COUNTERS, *STAGES), 0)
+        for target, (stage, counts) in _HOOKS.items():
+            self._install(target, stage, counts)
+        self._started = time.perf_counter()
+        if self._profile is not None:
+            self._profile.enable()
+
+    def stop(self) -> None:
+        global _active
+        if _active is not self:
+            raise ValueError("Profiler: not active")
+        if self._profile is not None:
+            self._profile.disable()
+        self.wall += time.perf_counter() - self._started
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches = []
+        _active = None
+
+    def __enter__(self) -> Profiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Hooks
+    # ------------------------------------------------------------------
+
+    def _install(self, target: str, stage: str | None, counts: tuple) -> None:
+        module_name, _, qualname = target.partition(":")
+        module = importlib.import_module(module_name)
+        if "." in qualname:
+            class_name, name = qualname.split(".")
+            owner = getattr(module, class_name)
+            original = owner.__dict__[name]
+            self._patch(owner, name, self._wrap(original, stage, counts))
+            return
+        original = getattr(module, qualname)
+        wrapper = self._wrap(original, stage, counts)
+        for loaded in list(sys.modules.values()):
+            for name, value in list(getattr(loaded, "__dict__", {}).items()):
+                if value is original:
+                    self._patch(loaded, name, wrapper)
+
+    def _patch(self, owner: object, name: str, value: object) -> None:
+        self._patches.append((owner, name, getattr(owner, "__dict__")[name]))
+        setattr(owner, name, value)
+
+    def _wrap(self, fn: Callable, stage: str | None, counts: tuple) -> Callable:
+        counters, depth, stages = self.counters, self._depth, self.stages
+        guards = tuple(counter for counter, _size, outermost in counts if outermost)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for counter, size, outermost in counts:
+                if not (outermost and depth[counter]):
+                    counters[counter] += size(args)
+            for counter in guards:
+                depth[counter] += 1
+            try:
+                if stage is None or depth[stage]:
+                    return fn(*args, **kwargs)
+                depth[stage] += 1
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    entry = stages[stage]
+                    entry[0] += 1
+                    entry[1] += time.perf_counter() - start
+                    depth[stage] -= 1
+            finally:
+                for counter in guards:
+                    depth[counter] -= 1
+
+        return wrapper
+
+    @contextlib.contextmanager
+    def stage(self, stage: str):
+        """Time the enclosed code as stage, unless already inside it."""
+        depth = self._depth
+        if depth[stage]:
+            yield
+            return
+        depth[stage] += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.stages[stage]
+            entry[0] += 1
+            entry[1] += time.perf_counter() - start
+            depth[stage] -= 1
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "wall_seconds": self.wall,
+            "counters": dict(self.counters),
+            "stages": {
+                stage: {"calls": calls, "seconds": seconds}
+                for stage, (calls, seconds) in self.stages.items()
+                if calls
+            },
+        }
+
+    def save_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def summary(self) -> str:
+        """The stage timings and counters as a plain-text table."""
+        lines = [f"{'stage':<12}{'calls':>12}{'seconds':>12}{'% wall':>9}"]
+        for stage, (calls, seconds) in self.stages.items():
+            if calls:
+                share = 100.0 * seconds / self.wall if self.wall else 0.0
+                lines.append(f"{stage:<12}{calls:>12,}{seconds:>12.4f}{share:>9.1f}")
+        lines.append(f"{'(wall)':<12}{'':>12}{self.wall:>12.4f}")
+        lines.append("")
+        lines.append(f"{'counter':<26}{'value':>19}")
+        for counter, value in self.counters.items():
+            lines.append(f"{counter:<26}{value:>19,}")
+        return "\n".join(lines)
+
+    def stats(self) -> pstats.Stats:
+        """The cProfile statistics; requires cprofile=True."""
+        if self._profile is None:
+            raise ValueError("Profiler: created without cprofile=True")
+        return pstats.Stats(self._profile, stream=io.StringIO())
+
+    def dump_stats(self, path: str) -> None:
+        """Write the cProfile statistics as a pstats file."""
+        self.stats().dump_stats(path)
+
+    def __repr__(self) -> str:
+        return f"Profiler(wall={self.wall:.4f}, counters={self.counters!r})"
+
+
+def profiled_render(render: Callable) -> Callable:
+    """Decorator for the render drivers.
+
+    While a profiler is active, each call is timed as the render stage and
+    run in this process (workers=1), where the hooks see every tile. The
+    threads backend raises ValueError then, since the hooks are shared by
+    every thread. Otherwise it costs a single check per render.
+    """
+    signature = inspect.signature(render)
+
+    @functools.wraps(render)
+    def wrapper(*args, **kwargs):
+        profiler = _active
+        if profiler is None:
+            return render(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        if bound.arguments.get("backend") == "threads":
+            raise ValueError(f"{render.__name__}: the threads backend cannot run under a Profiler")
+        bound.arguments["workers"] = 1
+        with profiler.stage("render"):
+            return render(*bound.args, **bound.kwargs)
+
+    return wrapper
@@ -0,0 +1,216 @@
+"""Progressive rendering: a coarse image first, refined pass by pass.
+
+The first pass traces every start_step-th pixel along each axis and fills
+the start_step x start_step block to its lower right (higher col and row)
+with its color. Each later pass halves the step and traces only the
+pixels no earlier pass traced, filling their smaller blocks. After the
+step-1 pass every pixel has been traced exactly once, and the canvas is
+the one render() gives.
+
+The scene must have a ``pixels(cols, rows)`` method returning the (N, 3)
+colors of scattered pixels, as SilhouetteScene and WorldScene do.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from rayz.canvas import Canvas
+from rayz.profiling import profiled_render
+from rayz.render import BACKENDS, SharedFramebuffer, gil_disabled, init_worker, worker_state
+
+DEFAULT_START_STEP = 8
+DEFAULT_CHUNK_SIZE = 4096
+
+Pass = tuple[int, np.ndarray, np.ndarray]  # (step, cols, rows)
+
+
+def progressive_passes(width: int, height: int, start_step: int = DEFAULT_START_STEP) -> Iterator[Pass]:
+    """The pixels each pass traces, coarsest first: (step, cols, rows)."""
+    if start_step < 1 or start_step & (start_step - 1):
+        raise ValueError(f"progressive_passes: start_step must be a power of two, got {start_step}")
+    step = start_step
+    while step >= 1:
+        rows, cols = np.mgrid[0:height:step, 0:width:step]
+        rows, cols = rows.ravel(), cols.ravel()
+        if step < start_step:
+            # Pixels on the previous pass's grid were traced already.
+            new = (rows % (2 * step) != 0) | (cols % (2 * step) != 0)
+            rows, cols = rows[new], cols[new]
+        yield step, cols, rows
+        step //= 2
+
+
+@profiled_render
+def render_progressive(
+    scene,
+    width: int,
+    height: int,
+    start_step: int = DEFAULT_START_STEP,
+    callback: Callable[[Canvas, int], None] | None = None,
+    cancel=None,
+    workers: int | None = None,
+    backend: str = "auto",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Canvas:
+    """Render scene coarse to fine, calling callback(canvas, step) after each pass.
+
+    cancel is anything with an is_set() method, such as a threading.Event.
+    It is checked between chunks of chunk_size pixels; once it is set no
+    further chunks start, and the canvas is returned as far as it got,
+    without a callback for the unfinished pass. workers and backend are
+    as for render(); the pass's chunks are shared among the workers.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"render_progressive: unknown backend {backend!r} (valid: {BACKENDS})")
+    if not hasattr(scene, "pixels"):
+        raise ValueError(f"render_progressive: {type(scene).__name__} has no pixels(cols, rows) method")
+    if workers is not None and workers < 1:
+        raise ValueError(f"render_progressive: workers must be at least 1, got {workers}")
+    workers = workers or os.cpu_count() or 1
+    if backend == "auto":
+        backend = "threads" if gil_disabled() else "processes"
+    canvas = Canvas(width, height)
+    passes = progressive_passes(width, height, start_step)
+    # No pass has more chunks than there are pixels to split among them.
+    workers = min(workers, max(1, math.ceil(width * height / chunk_size)))
+
+    if workers == 1:
+        buffer = canvas.to_array()
+        _run_passes(
+            passes,
+            chunk_size,
+            callback,
+            cancel,
+            canvas,
+            lambda chunks: _serial(scene, buffer, chunks, cancel),
+        )
+        return canvas
+
+    if backend == "threads":
+        buffer = canvas.to_array()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Blocks within a pass are disjoint, so concurrent fills never
+            # touch the same pixels.
+            _run_passes(
+                passes,
+                chunk_size,
+                callback,
+                cancel,
+                canvas,
+                lambda chunks: _pooled(pool, _trace_chunk, chunks, cancel, scene, buffer),
+            )
+        return canvas
+
+    with SharedFramebuffer(width, height) as framebuffer:
+        _render_shared(scene, canvas, framebuffer, passes, chunk_size, callback, cancel, workers)
+    return canvas
+
+
+def ppm_preview(path: str) -> Callable[[Canvas, int], None]:
+    """A render_progressive callback that saves each pass as a binary PPM at path.
+
+    The file is written beside path and then renamed over it, so a viewer
+    never sees a half-written image.
+    """
+
+    def write(canvas: Canvas, step: int) -> None:
+        partial = f"{path}.partial"
+        canvas.save_p6(partial)
+        os.replace(partial, path)
+
+    return write
+
+
+# ----------------------------------------------------------------------
+# Pass and chunk scheduling
+# ----------------------------------------------------------------------
+
+
+def _run_passes(passes, chunk_size: int, callback, cancel, canvas: Canvas, run_pass) -> None:
+    # run_pass(chunks) traces one pass's chunks and returns False if it was
+    # cancelled part way.
+    for step, cols, rows in passes:
+        chunks = [
+            (cols[i : i + chunk_size], rows[i : i + chunk_size], step)
+            for i in range(0, len(cols), chunk_size)
+        ]
+        if not run_pass(chunks):
+            return
+        if callback is not None:
+            callback(canvas, step)
+        if cancel is not None and cancel.is_set():
+            return
+
+
+def _serial(scene, buffer: np.ndarray, chunks, cancel) -> bool:
+    for chunk in chunks:
+        if cancel is not None and cancel.is_set():
+            return False
+        _trace_chunk(chunk, scene, buffer)
+    return True
+
+
+def _pooled(pool, fn, chunks, cancel, *args) -> bool:
+    # As _serial, a pass is cancelled only if cancel is set before a chunk
+    # has finished; one set while the last chunk finishes still completes
+    # the pass.
+    futures = [pool.submit(fn, chunk, *args) for chunk in chunks]
+    try:
+        for future in futures:
+            if cancel is not None and cancel.is_set() and not future.done():
+                return False
+            future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+    return True
+
+
+def _render_shared(
+    scene,
+    canvas: Canvas,
+    framebuffer: SharedFramebuffer,
+    passes,
+    chunk_size: int,
+    callback,
+    cancel,
+    workers: int,
+) -> None:
+    # Workers fill a shared-memory framebuffer, copied into the canvas
+    # after every pass so the callback sees it.
+    def run_pass(chunks) -> bool:
+        done = _pooled(pool, _trace_chunk_in_worker, chunks, cancel)
+        canvas.write_block(0, 0, framebuffer.pixels)
+        return done
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(scene, SharedFramebuffer.attach, framebuffer.name, canvas.width, canvas.height),
+    ) as pool:
+        _run_passes(passes, chunk_size, callback, cancel, canvas, run_pass)
+
+
+def _trace_chunk(chunk, scene, buffer: np.ndarray) -> None:
+    cols, rows, step = chunk
+    colors = scene.pixels(cols, rows)
+    if step == 1:
+        buffer[rows, cols] = colors
+        return
+    height, width = buffer.shape[:2]
+    for dy in range(step):
+        for dx in range(step):
+            r, c = rows + dy, cols + dx
+            inside = (r < height) & (c < width)
+            buffer[r[inside], c[inside]] = colors[inside]
+
+
+def _trace_chunk_in_worker(chunk) -> None:
+    scene, framebuffer = worker_state()
+    _trace_chunk(chunk, scene, framebuffer.pixels)
@@ -0,0 +1,302 @@
+"""Tile-based render driver.
+
+A scene is any picklable object with a ``render_tile(col, row, width, height)``
+method that returns the (height, width, 3) RGB values of that tile, indexed
+[row, col] like Canvas. Each tile depends only on the scene, so the image is
+the same whatever the number of workers or the backend. Scenes that also
+have a ``sample(x, y)`` method, giving the colors seen through arbitrary
+canvas positions, can be supersampled (see rayz.sampling), and those with
+a ``pixels(cols, rows)`` method, giving the colors of scattered pixels,
+can be rendered progressively (see rayz.progressive).
+
+Backends:
+    "processes"  worker processes writing into a shared-memory framebuffer,
+                 or straight into the file of a MappedCanvas
+    "threads"    a thread pool; only a speedup on free-threaded (no-GIL) builds
+    "auto"       threads when the GIL is disabled at runtime, else processes
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from rayz.canvas import Canvas, MappedCanvas
+from rayz.color import Color
+from rayz.profiling import profiled_render
+from rayz.trace import DEFAULT_MAX_DEPTH, DEFAULT_MIN_THROUGHPUT, trace_rays
+
+DEFAULT_TILE_SIZE = 32
+BACKENDS = ("auto", "processes", "threads")
+
+Tile = tuple[int, int, int, int]  # (col, row, width, height)
+
+
+def tiles(width: int, height: int, tile_size: int = DEFAULT_TILE_SIZE) -> list[Tile]:
+    """Split an image into row-major tiles; edge tiles may be smaller."""
+    return [
+        (col, row, min(tile_size, width - col), min(tile_size, height - row))
+        for row in range(0, height, tile_size)
+        for col in range(0, width, tile_size)
+    ]
+
+
+def gil_disabled() -> bool:
+    """True when running on a free-threaded build with the GIL actually off."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+@profiled_render
+def render(
+    scene,
+    width: int,
+    height: int,
+    workers: int | None = None,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    backend: str = "auto",
+    canvas: Canvas | None = None,
+) -> Canvas:
+    """Render scene tile by tile across a pool of workers.
+
+    workers=None uses one worker per CPU; workers=1 renders in this
+    thread. With processes the scene is sent to each worker once, and
+    workers write their tiles straight into a shared-memory framebuffer.
+    With threads each tile is rendered into its own buffer and then
+    copied into the canvas.
+
+    The image goes into canvas when given, else a new Canvas. Worker
+    processes write a MappedCanvas's tiles into its file directly, so an
+    image larger than memory is never held in full.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"render: unknown backend {backend!r} (valid: {BACKENDS})")
+    if canvas is None:
+        canvas = Canvas(width, height)
+    elif (canvas.width, canvas.height) != (width, height):
+        raise ValueError(f"render: canvas is {canvas.width}x{canvas.height}, not {width}x{height}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"render: workers must be at least 1, got {workers}")
+    workers = workers or os.cpu_count() or 1
+    work = tiles(width, height, tile_size)
+    if workers == 1 or len(work) <= 1:
+        for col, row, w, h in work:
+            canvas.write_block(col, row, scene.render_tile(col, row, w, h))
+        return canvas
+
+    if backend == "auto":
+        backend = "threads" if gil_disabled() else "processes"
+    if backend == "threads":
+        _render_threaded(scene, canvas, work, workers)
+        return canvas
+    if isinstance(canvas, MappedCanvas):
+        # Each worker maps the canvas's file itself; the file's pages are
+        # shared with this process.
+        _render_in_workers(scene, work, workers, MappedCanvas.open, canvas.path)
+        return canvas
+
+    with SharedFramebuffer(width, height) as framebuffer:
+        _render_in_workers(scene, work, workers, SharedFramebuffer.attach, framebuffer.name, width, height)
+        canvas.write_block(0, 0, framebuffer.pixels)
+    return canvas
+
+
+def _render_in_workers(scene, work: list[Tile], workers: int, attach, *args) -> None:
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(work)),
+        initializer=init_worker,
+        initargs=(scene, attach, *args),
+    ) as pool:
+        # Consume the iterator so worker exceptions are raised here.
+        for _ in pool.map(render_tile_in_worker, work):
+            pass
+
+
+def _render_threaded(scene, canvas: Canvas, work: list[Tile], workers: int) -> None:
+    def render_one(tile: Tile) -> None:
+        col, row, w, h = tile
+        # Tiles are disjoint, so concurrent writes never touch the same pixels.
+        canvas.write_block(col, row, scene.render_tile(col, row, w, h))
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(work))) as pool:
+        for _ in pool.map(render_one, work):
+            pass
+
+
+# ----------------------------------------------------------------------
+# Shared-memory framebuffers and worker process state, used by every
+# driver that renders in a process pool.
+# ----------------------------------------------------------------------
+
+
+class SharedFramebuffer:
+    """A (height, width, 3) float32 framebuffer in shared memory, zeroed,
+    that worker processes write into and the parent copies out of.
+
+        with SharedFramebuffer(width, height) as framebuffer:
+            ... pool initializer: init_worker(scene, SharedFramebuffer.attach,
+                                              framebuffer.name, width, height)
+            canvas.write_block(0, 0, framebuffer.pixels)
+
+    The creator owns the segment and unlinks it on close; workers attach
+    by name. pixels is only valid until close, so copy out of it rather
+    than keeping it.
+    """
+
+    def __init__(self, width: int, height: int, name: str | None = None) -> None:
+        self.width = width
+        self.height = height
+        self._owner = name is None
+        if self._owner:
+            size = max(1, width * height * 3 * np.dtype(np.float32).itemsize)
+            self._shm = SharedMemory(create=True, size=size)
+        else:
+            self._shm = SharedMemory(name=name, track=False)
+        self.pixels = np.ndarray((height, width, 3), dtype=np.float32, buffer=self._shm.buf)
+        if self._owner:
+            self.pixels.fill(0.0)
+
+    @classmethod
+    def attach(cls, name: str, width: int, height: int) -> SharedFramebuffer:
+        """Map the framebuffer another process created."""
+        return cls(width, height, name)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def write_block(self, col: int, row: int, colors: np.ndarray) -> None:
+        h, w = colors.shape[:2]
+        self.pixels[row : row + h, col : col + w] = colors
+
+    def close(self) -> None:
+        # The array must go before the segment it views can be closed.
+        del self.pixels
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> SharedFramebuffer:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_worker_scene = None
+_worker_framebuffer = None
+
+
+def init_worker(scene, attach, *args) -> None:
+    """A process pool initializer: keep scene, and attach(*args) as the
+    framebuffer this worker writes into (anything with write_block, such
+    as a SharedFramebuffer or a MappedCanvas)."""
+    global _worker_scene, _worker_framebuffer
+    _worker_scene = scene
+    _worker_framebuffer = attach(*args)
+
+
+def worker_state() -> tuple:
+    """(scene, framebuffer) as set by init_worker in this worker process."""
+    return _worker_scene, _worker_framebuffer
+
+
+def render_tile_in_worker(tile: Tile) -> None:
+    col, row, w, h = tile
+    _worker_framebuffer.write_block(col, row, _worker_scene.render_tile(col, row, w, h))
+
+
+# ----------------------------------------------------------------------
+# Scenes
+# ----------------------------------------------------------------------
+
+
+class SilhouetteScene:
+    """Chapter 5's ray-cast silhouette: rays from a single origin through a
+    square wall behind the shape; pixels whose ray hits the shape get color."""
+
+    def __init__(
+        self,
+        shape,
+        canvas_size: int,
+        color: Color,
+        ray_origin: tuple[float, float, float] = (0.0, 0.0, -5.0),
+        wall_z: float = 10.0,
+        wall_size: float = 7.0,
+    ) -> None:
+        self.shape = shape
+        self.canvas_size = canvas_size
+        self.color = color
+        self.ray_origin = ray_origin
+        self.wall_z = wall_z
+        self.wall_size = wall_size
+
+    def render_tile(self, col: int, row: int, width: int, height: int) -> np.ndarray:
+        rows, cols = np.divmod(np.arange(width * height), width)
+        return self.pixels(col + cols, row + rows).reshape(height, width, 3)
+
+    def pixels(self, cols: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """The colors of the pixels (cols[i], rows[i]) as an (N, 3) array."""
+        # As in the book, each pixel's ray goes through its corner.
+        return self.sample(cols, rows)
+
+    def sample(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """The colors seen through (N,) arrays of canvas positions in pixel
+        units, as an (N, 3) array; pixel (px, py) covers [px, px + 1) x
+        [py, py + 1)."""
+        pixel_size = self.wall_size / self.canvas_size
+        half = self.wall_size / 2.0
+        n = len(x)
+        targets = np.empty((n, 4))
+        targets[:, 0] = -half + pixel_size * np.asarray(x, dtype=float)
+        targets[:, 1] = half - pixel_size * np.asarray(y, dtype=float)
+        targets[:, 2] = self.wall_z
+        targets[:, 3] = 1.0
+        origins = np.tile([*self.ray_origin, 1.0], (n, 1))
+        directions = targets - origins
+        directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+
+        _t0, t1, mask = self.shape.intersect_rays(origins, directions)
+        # A ray has a hit when its far intersection is in front of the origin.
+        image = np.zeros((n, 3), dtype=np.float32)
+        image[mask & (t1 >= 0)] = (self.color.red, self.color.green, self.color.blue)
+        return image
+
+
+class WorldScene:
+    """A world seen through a camera, traced with reflection and refraction.
+
+    Changes to the world are seen by the next render; the world's
+    material table is only rebuilt when its objects or materials change.
+    """
+
+    def __init__(
+        self,
+        world,
+        camera,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        min_throughput: float = DEFAULT_MIN_THROUGHPUT,
+    ) -> None:
+        self.world = world
+        self.camera = camera
+        self.max_depth = max_depth
+        self.min_throughput = min_throughput
+
+    def render_tile(self, col: int, row: int, width: int, height: int) -> np.ndarray:
+        return self._trace(*self.camera.rays_for_tile(col, row, width, height)).reshape(height, width, 3)
+
+    def pixels(self, cols: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """The colors of the pixels (cols[i], rows[i]) as an (N, 3) array."""
+        return self.sample(np.asarray(cols) + 0.5, np.asarray(rows) + 0.5)
+
+    def sample(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """The colors seen through (N,) arrays of canvas positions in pixel
+        units, as an (N, 3) array; see Camera.rays_through."""
+        return self._trace(*self.camera.rays_through(x, y))
+
+    def _trace(self, origins: np.ndarray, directions: np.ndarray) -> np.ndarray:
+        return trace_rays(self.world, origins, directions, self.max_depth, self.min_throughput)
@@ -2,22 +2,63 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
+from rayz.bounds import BoundingBox, sphere_bounds
+from rayz.constants import EPSILON
 from rayz.intersection import Intersection
 from rayz.material import Material
 from rayz.matrix import Matrix
 from rayz.tuple import Point, Vector
 
+# Bumped whenever any sphere's transform is set. Each sphere's _version is
+# the value of the counter after its latest change, so data derived from a
+# set of spheres (World's packed inverses and BVH) is stale exactly when
+# one of them has a version newer than the counter was at the build, and
+# need not be checked at all while the counter is unchanged.
+_transform_epoch = 0
+
+
+def transform_epoch() -> int:
+    return _transform_epoch
+
 
 class Sphere:
     def __init__(self) -> None:
         self.transform = Matrix.identity(4)
         self.material = Material()
 
+    @property
+    def transform(self) -> Matrix:
+        return self._transforms[0]
+
+    @transform.setter
+    def transform(self, m: Matrix) -> None:
+        # Invert once here rather than on every intersect/normal_at call. The
+        # matrices are published with a single attribute assignment so threads
+        # rendering concurrently never see a transform paired with a stale inverse.
+        # A noninvertible m therefore raises ValueError here, when it is set,
+        # rather than on the first intersect, and the sphere keeps its old
+        # transform.
+        global _transform_epoch
+        inv = m.inverse()
+        self._transforms = (m, inv, inv.transpose())
+        _transform_epoch += 1
+        self._version = _transform_epoch
+
+    @property
+    def transform_inverse(self) -> Matrix:
+        return self._transforms[1]
+
+    @property
+    def transform_inverse_transpose(self) -> Matrix:
+        return self._transforms[2]
+
     def set_transform(self, m: Matrix) -> None:
         self.transform = m
 
     def intersect(self, ray) -> list[Intersection]:
-        ray2 = ray.transform(self.transform.inverse())
+        ray2 = ray.transform(self._transforms[1])
         sphere_to_ray = ray2.origin - Point(0, 0, 0)
         a = ray2.direction.dot(ray2.direction)
         b = 2 * ray2.direction.dot(sphere_to_ray)
@@ -29,17 +70,142 @@ class Sphere:
         t2 = (-b + math.sqrt(disc)) / (2 * a)
         return [Intersection(t1, self), Intersection(t2, self)]
 
+    def intersect_rays(
+        self, origins: np.ndarray, directions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Intersect a batch of rays given as (N, 4) origin and direction arrays.
+
+        Returns (t0, t1, mask) where t0 <= t1 are the two intersection
+        distances for each ray and mask is True for rays that hit. Both t
+        arrays hold +inf for rays that miss.
+        """
+        inv_t = self._transforms[1].to_array().T
+        # Object-space xyz; w drops out since the sphere is centred on the origin.
+        sphere_to_ray = (origins @ inv_t)[:, :3]
+        direction = (directions @ inv_t)[:, :3]
+        a = np.einsum("ij,ij->i", direction, direction)
+        b = 2.0 * np.einsum("ij,ij->i", direction, sphere_to_ray)
+        c = np.einsum("ij,ij->i", sphere_to_ray, sphere_to_ray) - 1.0
+        disc = b * b - 4.0 * a * c
+        mask = disc >= 0
+        root = np.sqrt(np.where(mask, disc, 0.0))
+        two_a = 2.0 * a
+        t0 = np.where(mask, (-b - root) / two_a, np.inf)
+        t1 = np.where(mask, (-b + root) / two_a, np.inf)
+        return t0, t1, mask
+
+    def any_hit(self, ray, max_t: float) -> bool:
+        """True if ray hits the sphere at some t in (EPSILON, max_t).
+
+        For shadow rays, which only need to know whether anything is in
+        the way; no Intersection objects are created.
+        """
+        ray2 = ray.transform(self._transforms[1])
+        o, d = ray2.origin, ray2.direction
+        a = d.x * d.x + d.y * d.y + d.z * d.z
+        b = 2 * (d.x * o.x + d.y * o.y + d.z * o.z)
+        c = o.x * o.x + o.y * o.y + o.z * o.z - 1.0
+        disc = b * b - 4 * a * c
+        if disc < 0:
+            return False
+        root = math.sqrt(disc)
+        t0 = (-b - root) / (2 * a)
+        t1 = (-b + root) / (2 * a)
+        return EPSILON < t0 < max_t or EPSILON < t1 < max_t
+
+    def any_hits(self, origins: np.ndarray, directions: np.ndarray, max_t: np.ndarray | float) -> np.ndarray:
+        """any_hit for a batch of rays given as (N, 4) origin and direction
+        arrays, with a scalar or (N,) max_t. Returns an (N,) boolean array."""
+        return _any_sphere_hits(self._transforms[1].to_array()[np.newaxis], origins, directions, max_t)
+
     def normal_at(self, world_point) -> Vector:
-        inv = self.transform.inverse()
+        _m, inv, inv_t = self._transforms
         obj_point = inv * world_point
         obj_normal = obj_point - Point(0, 0, 0)
-        raw = inv.transpose() * obj_normal
+        raw = inv_t * obj_normal
         return Vector(raw.x, raw.y, raw.z).normalize()
 
+    def normals_at(self, points: np.ndarray) -> np.ndarray:
+        """normal_at for a batch of world-space points given as an (N, 4) array.
+
+        Returns the normals as an (N, 4) array of vectors.
+        """
+        inv = self._transforms[1].to_array()
+        return _object_to_world_normals(points @ inv.T, inv)
+
+    def bounds(self) -> BoundingBox:
+        """The object-space bounds of the unit sphere."""
+        return BoundingBox(Point(-1, -1, -1), Point(1, 1, 1))
+
+    def parent_space_bounds(self) -> BoundingBox:
+        """The tight axis-aligned bounds of the sphere after its transform."""
+        lo, hi = sphere_bounds(self._transforms[0].to_array()[np.newaxis])
+        return BoundingBox(Point(*lo[0].tolist()), Point(*hi[0].tolist()))
+
     def __repr__(self) -> str:
         return f"Sphere(transform={self.transform!r})"
 
 
+def _sphere_roots(
+    inv: np.ndarray, origins: np.ndarray, directions: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    # Both roots t0 <= t1 of n rays against K spheres given by their (K, 4, 4)
+    # inverse transforms, as (K, n) arrays holding +inf where a ray misses.
+    # The object-space xyz of every ray for every sphere has shape (K, n, 3);
+    # for a unit sphere at the origin the object-space origin is sphere_to_ray.
+    inv_t = inv[:, :3, :].transpose(0, 2, 1)
+    sphere_to_ray = origins @ inv_t
+    direction = directions @ inv_t
+    a = np.einsum("kni,kni->kn", direction, direction)
+    b = 2.0 * np.einsum("kni,kni->kn", direction, sphere_to_ray)
+    c = np.einsum("kni,kni->kn", sphere_to_ray, sphere_to_ray) - 1.0
+    disc = b * b - 4.0 * a * c
+    hit = disc >= 0
+    root = np.sqrt(np.where(hit, disc, 0.0))
+    two_a = 2.0 * a
+    t0 = np.where(hit, (-b - root) / two_a, np.inf)
+    t1 = np.where(hit, (-b + root) / two_a, np.inf)
+    return t0, t1
+
+
+def _nearest_sphere_hits(
+    inv: np.ndarray, origins: np.ndarray, directions: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """The nearest non-negative hit of n rays against K spheres given by their
+    (K, 4, 4) inverse transforms: (sphere index or -1, t or +inf) per ray."""
+    t0, t1 = _sphere_roots(inv, origins, directions)
+    # The first non-negative root of each sphere, or +inf.
+    t = np.where(t0 >= 0, t0, t1)
+    t = np.where(t >= 0, t, np.inf)
+    index = np.argmin(t, axis=0)
+    best = t[index, np.arange(t.shape[1])]
+    return np.where(np.isfinite(best), index, -1), best
+
+
+def _any_sphere_hits(
+    inv: np.ndarray, origins: np.ndarray, directions: np.ndarray, max_t: np.ndarray | float
+) -> np.ndarray:
+    """For each of n rays, whether any of K spheres is hit at some t in
+    (EPSILON, max_t); max_t is a scalar or an (n,) array."""
+    t0, t1 = _sphere_roots(inv, origins, directions)
+    return (((t0 > EPSILON) & (t0 < max_t)) | ((t1 > EPSILON) & (t1 < max_t))).any(axis=0)
+
+
+def _object_to_world_normals(obj_points: np.ndarray, inv: np.ndarray) -> np.ndarray:
+    # Object-space points to normalized world-space normals, for one (4, 4)
+    # inverse or a per-point (N, 4, 4) stack. For the unit sphere the object
+    # normal is the point itself; the world normal is inverse-transpose times
+    # that, i.e. the row vector times the inverse.
+    obj_points[:, 3] = 0.0
+    if inv.ndim == 2:
+        normals = obj_points @ inv
+    else:
+        normals = np.einsum("ni,nij->nj", obj_points, inv)
+    normals[:, 3] = 0.0
+    normals /= np.sqrt(np.einsum("ij,ij->i", normals, normals))[:, np.newaxis]
+    return normals
+
+
 def glass_sphere() -> Sphere:
     s = Sphere()
     s.material.transparency = 1.0
@@ -0,0 +1,143 @@
+"""Whitted-style tracing with reflection and refraction, run as a wavefront.
+
+Rather than recursing per pixel, every bounce depth processes the whole
+queue of live rays as NumPy arrays: one nearest-hit pass, one normals
+pass, one shadow pass and one lighting pass. Each hit adds its surface
+color, scaled by its ray's throughput, to the ray's pixel. It then
+spawns reflected and refracted rays carrying that throughput times the
+material's reflective or transparency weight, with the Schlick
+approximation splitting the two for transparent, reflective surfaces.
+A spawned ray is retired without being traced when its throughput is
+no more than min_throughput, since it could barely change its pixel.
+
+Media are not nested: a ray entering an object goes from air (index 1)
+into the object, and a ray leaving one goes back into air.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from rayz.color import Color
+from rayz.constants import EPSILON
+from rayz.lighting import lighting_batch
+from rayz.material import MaterialArrays
+from rayz.ray import Ray
+
+DEFAULT_MAX_DEPTH = 5
+DEFAULT_MIN_THROUGHPUT = 1e-3
+
+
+def schlick(cos_i: np.ndarray, n1: np.ndarray, n2: np.ndarray) -> np.ndarray:
+    """The Schlick approximation to the Fresnel reflectance.
+
+    cos_i is the cosine of the angle between the eye vector and the
+    normal, n1 and n2 the refractive indices on the eye's side and the
+    far side of the surface. Total internal reflection gives 1.
+    """
+    cos_i, n1, n2 = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (cos_i, n1, n2)))
+    ratio = n1 / n2
+    sin2_t = ratio * ratio * (1.0 - cos_i * cos_i)
+    # Going into a less dense medium, the cosine that matters is the
+    # transmitted angle's.
+    cos = np.where(n1 > n2, np.sqrt(np.clip(1.0 - sin2_t, 0.0, None)), cos_i)
+    r0 = ((n1 - n2) / (n1 + n2)) ** 2
+    return np.where((n1 > n2) & (sin2_t > 1.0), 1.0, r0 + (1.0 - r0) * (1.0 - cos) ** 5)
+
+
+def trace_rays(
+    world,
+    origins: np.ndarray,
+    directions: np.ndarray,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    min_throughput: float = DEFAULT_MIN_THROUGHPUT,
+    materials: MaterialArrays | None = None,
+) -> np.ndarray:
+    """The colors seen along N rays given as (N, 4) arrays, as an (N, 3) array.
+
+    max_depth is the number of bounces after the primary hit, as the
+    book's remaining argument. materials defaults to world.materials().
+    """
+    n = len(origins)
+    colors = np.zeros((n, 3))
+    if materials is None:
+        materials = world.materials()
+
+    # The wavefront: one entry per live ray.
+    pixel = np.arange(n)
+    throughput = np.ones(n)
+    origins = np.array(origins, dtype=float)
+    directions = np.array(directions, dtype=float)
+
+    for depth in range(max_depth + 1):
+        if not len(pixel):
+            break
+        index, t = world.nearest_hits(origins, directions)
+        hit = index >= 0
+        pixel, throughput, index, t = pixel[hit], throughput[hit], index[hit], t[hit]
+        origins, directions = origins[hit], directions[hit]
+        if not len(pixel):
+            break
+
+        points = origins + directions * t[:, np.newaxis]
+        eyev = -directions
+        normals = world.normals_at(index, points)
+        cos_i = np.einsum("ij,ij->i", eyev, normals)
+        inside = cos_i < 0
+        normals[inside] *= -1.0
+        cos_i = np.abs(cos_i)
+        material = materials[index]
+
+        # Nudge points off the surface so shadow and reflected rays don't
+        # re-hit it; refracted rays start just under it instead.
+        over = points + normals * EPSILON
+        surface = np.zeros((len(pixel), 3))
+        for light in world.lights:
+            surface += lighting_batch(material, light, over, eyev, normals, world.shadowed(over, light))
+        _accumulate(colors, pixel, surface * throughput[:, np.newaxis])
+        if depth == max_depth:
+            break
+
+        n1 = np.where(inside, material.refractive_index, 1.0)
+        n2 = np.where(inside, 1.0, material.refractive_index)
+        ratio = n1 / n2
+        sin2_t = ratio * ratio * (1.0 - cos_i * cos_i)
+        total_internal = sin2_t > 1.0
+        reflect_weight = material.reflective
+        refract_weight = np.where(total_internal, 0.0, material.transparency)
+        fresnel = (reflect_weight > 0) & (material.transparency > 0)
+        if fresnel.any():
+            reflectance = schlick(cos_i, n1, n2)
+            reflect_weight = np.where(fresnel, reflect_weight * reflectance, reflect_weight)
+            refract_weight = np.where(fresnel, refract_weight * (1.0 - reflectance), refract_weight)
+
+        reflect = throughput * reflect_weight > min_throughput
+        refract = throughput * refract_weight > min_throughput
+        reflectv = directions - normals * (2.0 * np.einsum("ij,ij->i", directions, normals))[:, np.newaxis]
+        cos_t = np.sqrt(np.clip(1.0 - sin2_t, 0.0, None))
+        refractv = normals * (ratio * cos_i - cos_t)[:, np.newaxis] - eyev * ratio[:, np.newaxis]
+        under = points - normals * EPSILON
+
+        pixel = np.concatenate([pixel[reflect], pixel[refract]])
+        throughput = np.concatenate(
+            [(throughput * reflect_weight)[reflect], (throughput * refract_weight)[refract]]
+        )
+        origins = np.concatenate([over[reflect], under[refract]])
+        directions = np.concatenate([reflectv[reflect], refractv[refract]])
+    return colors
+
+
+def color_at(world, ray: Ray, remaining: int = DEFAULT_MAX_DEPTH) -> Color:
+    """The color seen along a single ray; trace_rays for one ray."""
+    o, d = ray.origin, ray.direction
+    (red, green, blue) = trace_rays(
+        world, np.array([[o.x, o.y, o.z, 1.0]]), np.array([[d.x, d.y, d.z, 0.0]]), remaining
+    )[0].tolist()
+    return Color(red, green, blue)
+
+
+def _accumulate(colors: np.ndarray, pixel: np.ndarray, values: np.ndarray) -> None:
+    # A pixel can appear more than once in a wavefront (its reflected and
+    # refracted rays), so sum with bincount rather than fancy assignment.
+    for channel in range(3):
+        colors[:, channel] += np.bincount(pixel, weights=values[:, channel], minlength=len(colors))
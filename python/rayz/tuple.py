@@ -4,10 +4,14 @@ import math
 
 from rayz.constants import EPSILON
 
+_new = object.__new__
+
 
 class Tuple:
     """A 4D homogeneous coordinate (x, y, z, w)."""
 
+    __slots__ = ("x", "y", "z", "w")
+
     def __init__(self, x: float, y: float, z: float, w: float) -> None:
         self.x = float(x)
         self.y = float(y)
@@ -30,26 +34,27 @@ class Tuple:
         return f"{self.__class__.__name__}({self.x}, {self.y}, {self.z}, {self.w})"
 
     def __add__(self, other: Tuple) -> Tuple:
-        return Tuple(self.x + other.x, self.y + other.y, self.z + other.z, self.w + other.w)
+        return _tuple(self.x + other.x, self.y + other.y, self.z + other.z, self.w + other.w)
 
     def __sub__(self, other: Tuple) -> Tuple:
-        return Tuple(self.x - other.x, self.y - other.y, self.z - other.z, self.w - other.w)
+        return _tuple(self.x - other.x, self.y - other.y, self.z - other.z, self.w - other.w)
 
     def __mul__(self, scalar: float) -> Tuple:
-        return Tuple(self.x * scalar, self.y * scalar, self.z * scalar, self.w * scalar)
+        return _tuple(self.x * scalar, self.y * scalar, self.z * scalar, self.w * scalar)
 
     def __truediv__(self, scalar: float) -> Tuple:
-        return Tuple(self.x / scalar, self.y / scalar, self.z / scalar, self.w / scalar)
+        return _tuple(self.x / scalar, self.y / scalar, self.z / scalar, self.w / scalar)
 
     def __neg__(self) -> Tuple:
-        return Tuple(-self.x, -self.y, -self.z, -self.w)
+        return _tuple(-self.x, -self.y, -self.z, -self.w)
 
     def magnitude(self) -> float:
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2 + self.w**2)
+        x, y, z, w = self.x, self.y, self.z, self.w
+        return math.sqrt(x * x + y * y + z * z + w * w)
 
     def normalize(self) -> Tuple:
         mag = self.magnitude()
-        return Tuple(self.x / mag, self.y / mag, self.z / mag, self.w / mag)
+        return _tuple(self.x / mag, self.y / mag, self.z / mag, self.w / mag)
 
     def dot(self, other: Tuple) -> float:
         return self.x * other.x + self.y * other.y + self.z * other.z + self.w * other.w
@@ -67,8 +72,13 @@ class Tuple:
 class Point(Tuple):
     """A point in 3D space (w=1.0)."""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, z: float) -> None:
-        super().__init__(x, y, z, 1.0)
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+        self.w = 1.0
 
     def __repr__(self) -> str:
         return f"Point({self.x}, {self.y}, {self.z})"
@@ -77,22 +87,59 @@ class Point(Tuple):
 class Vector(Tuple):
     """A direction/displacement in 3D space (w=0.0)."""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, z: float) -> None:
-        super().__init__(x, y, z, 0.0)
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+        self.w = 0.0
 
     def __repr__(self) -> str:
         return f"Vector({self.x}, {self.y}, {self.z})"
 
     def normalize(self) -> Vector:
-        mag = self.magnitude()
-        return Vector(self.x / mag, self.y / mag, self.z / mag)
+        x, y, z = self.x, self.y, self.z
+        mag = math.sqrt(x * x + y * y + z * z)
+        return _vector(x / mag, y / mag, z / mag)
 
     def cross(self, other: Vector) -> Vector:
-        return Vector(
-            self.y * other.z - self.z * other.y,
-            self.z * other.x - self.x * other.z,
-            self.x * other.y - self.y * other.x,
-        )
+        ax, ay, az = self.x, self.y, self.z
+        bx, by, bz = other.x, other.y, other.z
+        return _vector(ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
 
     def reflect(self, normal: Tuple) -> Tuple:
         return self - normal * 2 * self.dot(normal)
+
+
+# ----------------------------------------------------------------------
+# Fast constructors for arithmetic results. They skip __init__ and its
+# float() coercion, so callers must pass Python floats.
+# ----------------------------------------------------------------------
+
+
+def _tuple(x: float, y: float, z: float, w: float) -> Tuple:
+    t = _new(Tuple)
+    t.x = x
+    t.y = y
+    t.z = z
+    t.w = w
+    return t
+
+
+def _point(x: float, y: float, z: float) -> Point:
+    p = _new(Point)
+    p.x = x
+    p.y = y
+    p.z = z
+    p.w = 1.0
+    return p
+
+
+def _vector(x: float, y: float, z: float) -> Vector:
+    v = _new(Vector)
+    v.x = x
+    v.y = y
+    v.z = z
+    v.w = 0.0
+    return v
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from rayz.constants import EPSILON
+from rayz.tuple import Point, Tuple, Vector
+
+
+class TupleArray:
+    """A batch of N 4D homogeneous coordinates backed by an (N, 4) float64 array.
+
+    Supports the same operations as Tuple, applied row-wise. Reductions
+    (dot, magnitude) return (N,) arrays.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: np.ndarray | list[list[float]]) -> None:
+        data = np.asarray(data, dtype=float)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise ValueError(f"TupleArray: expected shape (N, 4), got {data.shape}")
+        self._data = data
+
+    # ------------------------------------------------------------------
+    # Construction and conversion
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_tuples(cls, tuples: Iterable[Tuple]) -> TupleArray:
+        return cls(np.array([(t.x, t.y, t.z, t.w) for t in tuples], dtype=float).reshape(-1, 4))
+
+    @classmethod
+    def points(cls, xyz: np.ndarray) -> TupleArray:
+        """Build points (w=1) from an (N, 3) array."""
+        return cls._with_w(xyz, 1.0)
+
+    @classmethod
+    def vectors(cls, xyz: np.ndarray) -> TupleArray:
+        """Build vectors (w=0) from an (N, 3) array."""
+        return cls._with_w(xyz, 0.0)
+
+    @classmethod
+    def _with_w(cls, xyz: np.ndarray, w: float) -> TupleArray:
+        xyz = np.asarray(xyz, dtype=float)
+        data = np.empty((xyz.shape[0], 4))
+        data[:, :3] = xyz
+        data[:, 3] = w
+        return cls(data)
+
+    def to_tuples(self) -> list[Tuple]:
+        """Convert to a list of Point, Vector or Tuple according to each w."""
+        return [_to_tuple(x, y, z, w) for x, y, z, w in self._data.tolist()]
+
+    def to_array(self) -> np.ndarray:
+        return self._data
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
+
+    def __getitem__(self, i: int) -> Tuple:
+        x, y, z, w = self._data[i].tolist()
+        return _to_tuple(x, y, z, w)
+
+    # ------------------------------------------------------------------
+    # Equality
+    # ------------------------------------------------------------------
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TupleArray):
+            return NotImplemented
+        if self._data.shape != other._data.shape:
+            return False
+        return bool(np.all(np.abs(self._data - other._data) < EPSILON))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TupleArray({self._data.tolist()})"
+
+    # ------------------------------------------------------------------
+    # Arithmetic
+    # ------------------------------------------------------------------
+
+    def __add__(self, other: TupleArray) -> TupleArray:
+        return TupleArray(self._data + other._data)
+
+    def __sub__(self, other: TupleArray) -> TupleArray:
+        return TupleArray(self._data - other._data)
+
+    def __mul__(self, scalar: float | np.ndarray) -> TupleArray:
+        """Scale by a scalar, or row-wise by an (N,) array."""
+        return TupleArray(self._data * _per_row(scalar))
+
+    def __truediv__(self, scalar: float | np.ndarray) -> TupleArray:
+        return TupleArray(self._data / _per_row(scalar))
+
+    def __neg__(self) -> TupleArray:
+        return TupleArray(-self._data)
+
+    def magnitude(self) -> np.ndarray:
+        return np.sqrt(np.einsum("ij,ij->i", self._data, self._data))
+
+    def normalize(self) -> TupleArray:
+        return TupleArray(self._data / self.magnitude()[:, np.newaxis])
+
+    def dot(self, other: TupleArray) -> np.ndarray:
+        return np.einsum("ij,ij->i", self._data, other._data)
+
+    def cross(self, other: TupleArray) -> TupleArray:
+        """Row-wise cross product of the xyz parts; the result rows are vectors."""
+        return TupleArray.vectors(np.cross(self._data[:, :3], other._data[:, :3]))
+
+    def reflect(self, normal: TupleArray) -> TupleArray:
+        return self - normal * (2 * self.dot(normal))
+
+
+def _per_row(scalar: float | np.ndarray) -> float | np.ndarray:
+    if isinstance(scalar, np.ndarray):
+        return scalar[:, np.newaxis]
+    return scalar
+
+
+def _to_tuple(x: float, y: float, z: float, w: float) -> Tuple:
+    if w == 1.0:
+        return Point(x, y, z)
+    if w == 0.0:
+        return Vector(x, y, z)
+    return Tuple(x, y, z, w)
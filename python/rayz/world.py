@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import numpy as np
+
+from rayz.bvh import BVH
+from rayz.color import Color
+from rayz.intersection import IntersectionList
+from rayz.light import PointLight
+from rayz.material import MaterialArrays
+from rayz.ray import Ray
+from rayz.sphere import (
+    Sphere,
+    _any_sphere_hits,
+    _nearest_sphere_hits,
+    _object_to_world_normals,
+    transform_epoch,
+)
+from rayz.transformations import scaling
+from rayz.tuple import Point
+
+# Below this many objects nearest_hits tests every object directly; above it
+# the BVH's traversal overhead is repaid by the objects it skips.
+_BVH_MIN_OBJECTS = 32
+
+# Upper bound on ray-sphere pairs evaluated in one vectorized step, which
+# keeps the (spheres, rays, 3) temporaries to a few tens of MB.
+_CHUNK_PAIRS = 1 << 20
+
+
+class World:
+    """A collection of objects (spheres) and light sources."""
+
+    def __init__(self) -> None:
+        self.objects: list[Sphere] = []
+        self.lights: list[PointLight] = []
+        self._cache_objects: list[Sphere] | None = None
+        self._cache_built = 0  # transform_epoch() when the cache was started
+        self._cache_checked = 0  # transform_epoch() when it was last found valid
+        self._cache: dict = {}
+        self._materials_key: tuple[int, ...] | None = None
+        self._materials: MaterialArrays | None = None
+
+    @property
+    def light(self) -> PointLight | None:
+        """The first light source, as used by the book's single-light scenes."""
+        return self.lights[0] if self.lights else None
+
+    @light.setter
+    def light(self, light: PointLight) -> None:
+        self.lights = [light]
+
+    def intersect(self, ray: Ray) -> IntersectionList:
+        """Every intersection of ray with every object, sorted by t."""
+        return IntersectionList.merge(*(obj.intersect(ray) for obj in self.objects))
+
+    def _cached(self, name: str, build):
+        # Derived data (packed inverses, the BVH) is rebuilt only when an
+        # object is added or removed or one of this world's objects has its
+        # transform set. The list comparison short-circuits on identity, and
+        # the objects' versions are only visited after some sphere somewhere
+        # changed, so this check stays cheap enough for per-ray queries on
+        # large worlds.
+        epoch = transform_epoch()
+        if self._cache_objects is None or self._cache_objects != self.objects:
+            self._reset_cache(epoch)
+        elif epoch != self._cache_checked:
+            if any(obj._version > self._cache_built for obj in self.objects):
+                self._reset_cache(epoch)
+            self._cache_checked = epoch
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    def _reset_cache(self, epoch: int) -> None:
+        self._cache = {}
+        self._cache_objects = list(self.objects)
+        self._cache_built = self._cache_checked = epoch
+
+    def materials(self) -> MaterialArrays:
+        """The objects' materials, one row per object.
+
+        Rebuilt when an object is added, removed or given another material,
+        or one of the materials is changed. Material versions are never
+        reused, so they alone identify the table.
+        """
+        key = tuple(obj.material._version for obj in self.objects)
+        if key != self._materials_key:
+            self._materials = MaterialArrays.from_materials([obj.material for obj in self.objects])
+            self._materials_key = key
+        return self._materials
+
+    def inverse_transforms(self) -> np.ndarray:
+        """A (K, 4, 4) stack of the objects' inverse transforms."""
+        return self._cached("inverse_transforms", self._pack_inverses)
+
+    def _pack_inverses(self) -> np.ndarray:
+        if not self.objects:
+            return np.empty((0, 4, 4))
+        return np.stack([obj.transform_inverse.to_array() for obj in self.objects])
+
+    def bvh(self) -> BVH:
+        """A bounding volume hierarchy over the objects."""
+        return self._cached("bvh", lambda: BVH(self.objects))
+
+    def nearest_hits(self, origins: np.ndarray, directions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """The nearest non-negative hit of each of N rays against every object.
+
+        origins and directions are (N, 4) arrays. Returns (index, t): the
+        index into objects of the object hit (-1 for a miss) and its t
+        (+inf for a miss).
+        """
+        if len(self.objects) >= _BVH_MIN_OBJECTS:
+            return self.bvh().nearest_hits(origins, directions)
+        inv = self.inverse_transforms()
+        n = len(origins)
+        index = np.full(n, -1, dtype=np.intp)
+        t = np.full(n, np.inf)
+        if n == 0 or len(inv) == 0:
+            return index, t
+        step = max(1, _CHUNK_PAIRS // len(inv))
+        for start in range(0, n, step):
+            stop = min(n, start + step)
+            index[start:stop], t[start:stop] = _nearest_sphere_hits(
+                inv, origins[start:stop], directions[start:stop]
+            )
+        return index, t
+
+    def nearest_hit(self, ray: Ray) -> tuple[int, float]:
+        """nearest_hits for a single ray: (object index or -1, t or +inf)."""
+        return self.bvh().nearest_hit(ray)
+
+    def any_hit(self, ray: Ray, max_t: float) -> bool:
+        """True if ray hits any object at some t in (EPSILON, max_t)."""
+        return self.bvh().any_hit(ray, max_t)
+
+    def any_hits(self, origins: np.ndarray, directions: np.ndarray, max_t: np.ndarray | float) -> np.ndarray:
+        """any_hit for N rays given as (N, 4) arrays, with a scalar or (N,)
+        max_t. Returns an (N,) boolean array."""
+        if len(self.objects) >= _BVH_MIN_OBJECTS:
+            return self.bvh().any_hits(origins, directions, max_t)
+        inv = self.inverse_transforms()
+        n = len(origins)
+        occluded = np.zeros(n, dtype=bool)
+        if n == 0 or len(inv) == 0:
+            return occluded
+        max_t = np.broadcast_to(np.asarray(max_t, dtype=float), (n,))
+        step = max(1, _CHUNK_PAIRS // len(inv))
+        for start in range(0, n, step):
+            stop = min(n, start + step)
+            occluded[start:stop] = _any_sphere_hits(
+                inv, origins[start:stop], directions[start:stop], max_t[start:stop]
+            )
+        return occluded
+
+    def is_shadowed(self, point: Point, light: PointLight | None = None) -> bool:
+        """True if an object lies between point and light (the first light by default)."""
+        light = light or self.light
+        v = light.position - point
+        distance = v.magnitude()
+        return self.any_hit(Ray(point, v / distance), distance)
+
+    def shadowed(self, points: np.ndarray, light: PointLight | None = None) -> np.ndarray:
+        """is_shadowed for N points given as an (N, 4) array; returns an (N,) boolean array."""
+        light = light or self.light
+        position = light.position
+        directions = np.array([position.x, position.y, position.z, 1.0]) - points
+        distance = np.sqrt(np.einsum("ij,ij->i", directions, directions))
+        directions /= distance[:, np.newaxis]
+        return self.any_hits(points, directions, distance)
+
+    def normals_at(self, index: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """Sphere.normals_at for a hit buffer: the normal of objects[index[i]]
+        at points[i], as an (N, 4) array. index must not contain misses."""
+        inv = self.inverse_transforms()[index]
+        return _object_to_world_normals(np.einsum("nij,nj->ni", inv, points), inv)
+
+    def __repr__(self) -> str:
+        return f"World(objects={self.objects!r}, lights={self.lights!r})"
+
+
+def default_world() -> World:
+    """The book's default world: two concentric spheres lit from the upper left."""
+    w = World()
+    w.light = PointLight(Point(-10, 10, -10), Color(1, 1, 1))
+    s1 = Sphere()
+    s1.material.color = Color(0.8, 1.0, 0.6)
+    s1.material.diffuse = 0.7
+    s1.material.specular = 0.2
+    s2 = Sphere()
+    s2.set_transform(scaling(0.5, 0.5, 0.5))
+    w.objects = [s1, s2]
+    return w